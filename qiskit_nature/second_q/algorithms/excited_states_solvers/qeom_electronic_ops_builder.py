@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import copy
 from typing import Callable, Dict, List, Tuple
 
 from qiskit.opflow import PauliSumOp, Z2Symmetries
@@ -22,9 +23,12 @@ from qiskit.utils import algorithm_globals
 
 from qiskit_nature import QiskitNatureError
 from qiskit_nature.second_q.circuit.library import UCC
-from qiskit_nature.second_q.operators import FermionicOp
+from qiskit_nature.second_q.operators import FermionicOp, OperatorCache
 from qiskit_nature.second_q.mappers import QubitConverter, QubitMapper
 
+# repeated qEOM runs on the same system request the same hopping operators
+_HOPPING_OPERATOR_CACHE = OperatorCache(maxsize=1024)
+
 
 def build_electronic_ops(
     num_spatial_orbitals: int,
@@ -103,12 +107,20 @@ def _build_single_hopping_operator(
     num_spatial_orbitals: int,
     qubit_converter: QubitConverter | QubitMapper,
 ) -> Tuple[PauliSumOp, List[bool]]:
-    label = []
-    for occ in excitation[0]:
-        label.append(f"+_{occ}")
-    for unocc in excitation[1]:
-        label.append(f"-_{unocc}")
-    fer_op = FermionicOp({" ".join(label): 1.0}, num_spin_orbitals=2 * num_spatial_orbitals)
+    def build_fermionic_op() -> FermionicOp:
+        label = []
+        for occ in excitation[0]:
+            label.append(f"+_{occ}")
+        for unocc in excitation[1]:
+            label.append(f"-_{unocc}")
+        return FermionicOp({" ".join(label): 1.0}, num_spin_orbitals=2 * num_spatial_orbitals)
+
+    # the cached operator is shared, thus only a (shallow) copy of it is handed on
+    fer_op = copy.copy(
+        _HOPPING_OPERATOR_CACHE.get_or_build(
+            (tuple(excitation[0]), tuple(excitation[1]), num_spatial_orbitals), build_fermionic_op
+        )
+    )
 
     if isinstance(qubit_converter, QubitConverter):
         qubit_op = qubit_converter.convert_only(fer_op, num_particles=qubit_converter.num_particles)
@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import copy
 from typing import Callable, Dict, List, Tuple
 
 from qiskit.opflow import PauliSumOp
@@ -21,9 +22,12 @@ from qiskit.tools import parallel_map
 from qiskit.utils import algorithm_globals
 
 from qiskit_nature.second_q.circuit.library import UVCC
-from qiskit_nature.second_q.operators import VibrationalOp
+from qiskit_nature.second_q.operators import OperatorCache, VibrationalOp
 from qiskit_nature.second_q.mappers import QubitConverter, QubitMapper
 
+# repeated qEOM runs on the same system request the same hopping operators
+_HOPPING_OPERATOR_CACHE = OperatorCache(maxsize=1024)
+
 
 def build_vibrational_ops(
     num_modals: List[int],
@@ -93,13 +97,20 @@ def _build_single_hopping_operator(
     num_modals: List[int],
     qubit_converter: QubitConverter | QubitMapper,
 ) -> PauliSumOp:
-    label = []
-    for occ in excitation[0]:
-        label.append(f"+_{VibrationalOp.build_dual_index(num_modals, occ)}")
-    for unocc in excitation[1]:
-        label.append(f"-_{VibrationalOp.build_dual_index(num_modals, unocc)}")
-
-    vibrational_op = VibrationalOp({" ".join(label): 1}, num_modals)
+    def build_vibrational_op() -> VibrationalOp:
+        label = []
+        for occ in excitation[0]:
+            label.append(f"+_{VibrationalOp.build_dual_index(num_modals, occ)}")
+        for unocc in excitation[1]:
+            label.append(f"-_{VibrationalOp.build_dual_index(num_modals, unocc)}")
+        return VibrationalOp({" ".join(label): 1}, num_modals)
+
+    # the cached operator is shared, thus only a (shallow) copy of it is handed on
+    vibrational_op = copy.copy(
+        _HOPPING_OPERATOR_CACHE.get_or_build(
+            (tuple(excitation[0]), tuple(excitation[1]), tuple(num_modals)), build_vibrational_op
+        )
+    )
 
     qubit_op: PauliSumOp
     if isinstance(qubit_converter, QubitConverter):
@@ -85,6 +85,19 @@ of interest that is parsed from the log.
    GaussianLogDriver
    GaussianLogResult
 
+Batch Execution
+===============
+
+The :class:`ParallelDriverRunner` runs an electronic structure driver on many molecular
+geometries in parallel.
+
+.. autosummary::
+   :toctree: ../stubs/
+   :nosignatures:
+
+   ParallelDriverRunner
+   ParallelDriverResult
+
 """
 
 from .base_driver import BaseDriver
@@ -93,6 +106,7 @@ from .electronic_structure_driver import ElectronicStructureDriver, MethodType
 from .gaussiand import GaussianDriver, GaussianLogDriver, GaussianLogResult, GaussianForcesDriver
 from .psi4d import Psi4Driver
 from .pyscfd import PySCFDriver, InitialGuess
+from .parallel_driver_runner import ParallelDriverRunner, ParallelDriverResult
 
 __all__ = [
     "MethodType",
@@ -106,4 +120,6 @@ __all__ = [
     "Psi4Driver",
     "PySCFDriver",
     "InitialGuess",
+    "ParallelDriverRunner",
+    "ParallelDriverResult",
 ]
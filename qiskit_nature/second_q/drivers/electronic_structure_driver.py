@@ -234,7 +234,8 @@ class ElectronicStructureDriver(BaseDriver):
         properties.scf_dipole_moment = data.dip_ref
 
         def format_np_array(arr):
-            return arr.ravel().tolist()
+            # this is a view rather than a copy for contiguous arrays
+            return np.ravel(arr)
 
         wavefunction = QCWavefunction(basis=data.basis)
         if data.mo_coeff is not None:
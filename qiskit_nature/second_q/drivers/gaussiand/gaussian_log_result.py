@@ -15,24 +15,30 @@
 from __future__ import annotations
 
 import math
-from typing import List, Sequence, Tuple, Union, cast
+from array import array
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple, Union, cast
 import copy
 import logging
+import os
 import re
 
+import numpy as np
+
 from qiskit_nature.second_q.formats.watson import WatsonHamiltonian
 import qiskit_nature.optionals as _optionals
 
 if _optionals.HAS_SPARSE:
     # pylint: disable=import-error
-    from sparse import as_coo
+    from sparse import COO
 else:
 
-    def as_coo(*args):
-        """Empty as_coo function
-        Replacement if sparse.as_coo is not present.
+    class COO:  # type: ignore
+        """Empty COO class
+        Replacement if sparse.COO is not present.
         """
-        del args
+
+        pass
 
 
 logger = logging.getLogger(__name__)
@@ -53,19 +59,23 @@ class GaussianLogResult:
             log: The log contents conforming to Gaussian™ 16 format either as a single string
                  containing new line characters, or as a list of strings. If the single string
                  has no new line characters it is treated a file name and the file contents
-                 will be read (a valid log file would be multiple lines).
+                 will be read lazily (a valid log file would be multiple lines).
         Raises:
             ValueError: Invalid Input
+            FileNotFoundError: If ``log`` is treated as a file name but no such file exists.
         """
 
-        self._log = None
+        self._log: list[str] | None = None
+        self._log_file: str | None = None
+        self._parsed: _ParsedLog | None = None
 
         if isinstance(log, str):
             lines = log.split("\n")
 
             if len(lines) == 1:
-                with open(lines[0], "r", encoding="utf8") as file:
-                    self._log = file.read().split("\n")
+                if not os.path.exists(lines[0]):
+                    raise FileNotFoundError(f"The Gaussian log file '{lines[0]}' does not exist.")
+                self._log_file = lines[0]
             else:
                 self._log = lines
 
@@ -77,17 +87,37 @@ class GaussianLogResult:
 
     @property
     def log(self) -> list[str]:
-        """The complete Gaussian log in the form of a list of strings."""
+        """The complete Gaussian log in the form of a list of strings.
+
+        When constructed from a file name, the file is read anew on every access of this property.
+        """
+        if self._log is None:
+            with open(self._log_file, "r", encoding="utf8") as file:
+                return file.read().split("\n")
         return copy.copy(self._log)
 
     def __str__(self):
-        return "\n".join(self._log)
+        return "\n".join(self.log)
 
     # Sections of interest in the log file
     _SECTION_QUADRATIC = r":\s+QUADRATIC\sFORCE\sCONSTANTS\sIN\sNORMAL\sMODES"
     _SECTION_CUBIC = r":\s+CUBIC\sFORCE\sCONSTANTS\sIN\sNORMAL\sMODES"
     _SECTION_QUARTIC = r":\s+QUARTIC\sFORCE\sCONSTANTS\sIN\sNORMAL\sMODES"
 
+    @property
+    def force_constant_arrays(self) -> dict[int, np.ndarray]:
+        """The force constants of all orders, as NumPy structured arrays.
+
+        The dictionary is keyed by the order of the force constants (2 for quadratic, 3 for cubic
+        and 4 for quartic). Every array has one entry per force constant with the fields
+        ``"indices"`` (the mode labels, for example ``"3a"``) and ``"constants"`` (the 3 constant
+        values). The arrays of missing sections are empty.
+
+        All sections are parsed in a single pass over the log, which gets streamed from disk when
+        this result was constructed from a file name.
+        """
+        return self._parse().force_constants
+
     @property
     def quadratic_force_constants(self) -> list[tuple[str, str, float, float, float]]:
         """Quadratic force constants. (2 indices, 3 values)
@@ -96,7 +126,7 @@ class GaussianLogResult:
             A list of tuples each with 2 index values and 3 constant values.
             An empty list is returned if no such data is present in the log.
         """
-        qfc = self._force_constants(self._SECTION_QUADRATIC, 2)
+        qfc = self._force_constants(2)
         return cast(List[Tuple[str, str, float, float, float]], qfc)
 
     @property
@@ -107,7 +137,7 @@ class GaussianLogResult:
             A list of tuples each with 3 index values and 3 constant values.
             An empty list is returned if no such data is present in the log.
         """
-        cfc = self._force_constants(self._SECTION_CUBIC, 3)
+        cfc = self._force_constants(3)
         return cast(List[Tuple[str, str, str, float, float, float]], cfc)
 
     @property
@@ -120,53 +150,15 @@ class GaussianLogResult:
             A list of tuples each with 4 index values and 3 constant values.
             An empty list is returned if no such data is present in the log.
         """
-        qfc = self._force_constants(self._SECTION_QUARTIC, 4)
+        qfc = self._force_constants(4)
         return cast(List[Tuple[str, str, str, str, float, float, float]], qfc)
 
-    def _force_constants(self, section_name: str, indices: int) -> list[tuple]:
-        constants = []
-        pattern_constants = ""
-        for i in range(indices):
-            pattern_constants += rf"\s+(?P<index{i + 1}>\w+)"
-        for i in range(3):
-            pattern_constants += rf"\s+(?P<const{i + 1}>[+-]?\d+\.\d+)"
-
-        # Find the section of interest
-        i = 0
-        found_section = False
-        for i, line in enumerate(self._log):
-            if re.search(section_name, line) is not None:
-                found_section = True
-                break
-
-        # Now if section found look from this line onwards to get the corresponding constant data
-        # lines which are from when we start to get a match against the constants pattern until we
-        # do not again.
-        const_found = False
-        if found_section:
-            for line in self._log[i:]:
-                if not const_found:
-                    # If we have not found the first line that matches we keep looking
-                    # until we get a match (non-None) and then drop through into found
-                    # section which we use thereafter
-                    const = re.match(pattern_constants, line)
-                    const_found = const is not None
-
-                if const_found:
-                    # If we found the match then for each line we want the contents until
-                    # such point as it does not match anymore then we break out
-                    const = re.match(pattern_constants, line)
-                    if const is not None:
-                        clist: list[Union[str, float]] = []
-                        for i in range(indices):
-                            clist.append(const.group(f"index{i + 1}"))
-                        for i in range(3):
-                            clist.append(float(const.group(f"const{i + 1}")))
-                        constants.append(tuple(clist))
-                    else:
-                        break  # End of matching lines
-
-        return constants
+    def _force_constants(self, order: int) -> list[tuple]:
+        data = self.force_constant_arrays[order]
+        return [
+            (*indices, *constants)
+            for indices, constants in zip(data["indices"].tolist(), data["constants"].tolist())
+        ]
 
     @property
     def a_to_h_numbering(self) -> dict[str, int]:
@@ -176,34 +168,41 @@ class GaussianLogResult:
             Dictionary mapping string A numbering such as '1', '3a' etc from forces modes
             to H integer numbering
         """
-        a2h: dict[str, int] = {}
-
-        found_section = False
-        found_h = False
-        found_a = False
-        h_nums = []
-        a_nums = []
-        for line in self._log:
-            if not found_section:
-                if re.search(r"Input/Output\sinformation", line) is not None:
-                    logger.debug(line)
-                    found_section = True
-            else:
-                if re.search(r"\s+\(H\)\s+\|", line) is not None:
-                    logger.debug(line)
-                    found_h = True
-                    h_nums += [x.strip() for x in line.split("|") if x and "(H)" not in x]
-                elif re.search(r"\s+\(A\)\s+\|", line) is not None:
-                    logger.debug(line)
-                    found_a = True
-                    a_nums += [x.strip() for x in line.split("|") if x and "(A)" not in x]
-
-                if found_h and found_a and re.search(r"NOTE:", line) is not None:
-                    for i, a_num in enumerate(a_nums):
-                        a2h[a_num] = int(h_nums[i])
-                    break
-
-        return a2h
+        return dict(self._parse().a_to_h_numbering)
+
+    def _lines(self) -> Iterator[str]:
+        if self._log is not None:
+            yield from self._log
+            return
+
+        with open(self._log_file, "r", encoding="utf8") as file:
+            for line in file:
+                yield line.rstrip("\n")
+
+    def _parse(self) -> _ParsedLog:
+        """Parses all sections of interest in a single pass over the log."""
+        if self._parsed is not None:
+            return self._parsed
+
+        sections = {
+            2: _ForceConstantSection(self._SECTION_QUADRATIC, 2),
+            3: _ForceConstantSection(self._SECTION_CUBIC, 3),
+            4: _ForceConstantSection(self._SECTION_QUARTIC, 4),
+        }
+        numbering = _NumberingSection()
+        pending = [*sections.values(), numbering]
+
+        for line in self._lines():
+            pending = [section for section in pending if not section.feed(line)]
+            if not pending:
+                # all sections are complete, the remainder of the log does not need to be read
+                break
+
+        self._parsed = _ParsedLog(
+            {order: section.to_array() for order, section in sections.items()},
+            numbering.to_dict(),
+        )
+        return self._parsed
 
     # ----------------------------------------------------------------------------------------
     # The following is to process the constants and produce an n-body array for input
@@ -211,73 +210,180 @@ class GaussianLogResult:
     # but for now they are here
 
     @staticmethod
-    def _multinomial(indices: list[int]) -> float:
-        # For a given list of integers, computes the associated multinomial
-        tmp = set(indices)  # Set of unique indices
-        multinomial = 1
-        for val in tmp:
-            count = indices.count(val)
-            multinomial *= math.factorial(count)
+    def _multinomial(indices: np.ndarray) -> np.ndarray:
+        # For every row of integers, computes the product of the factorials of the multiplicities
+        # of its values. This equals the product over all positions j of the number of positions
+        # i <= j holding the same value as position j.
+        multinomial = np.ones(indices.shape[0], dtype=float)
+        for j in range(indices.shape[1]):
+            multinomial *= np.sum(indices[:, : j + 1] == indices[:, j : j + 1], axis=1)
         return multinomial
 
-    def _process_entry_indices(self, entry: list[Union[str, float]]) -> list[int]:
+    def _process_entry_indices(self, labels: np.ndarray) -> np.ndarray:
         # a2h gives us say '3a' -> 1, '3b' -> 2 etc. The H values can be 1 through 4
         # but we want them numbered in reverse order so the 'a2h_vals + 1 - a2h[x]'
         # takes care of this
-        a2h = self.a_to_h_numbering
+        a2h = self._parse().a_to_h_numbering
         a2h_vals = max(list(a2h.values()))
 
-        # There are 3 float entries in the list at the end, the other entries up
-        # front are the indices (string type).
-        num_indices = len(entry) - 3
-        return [a2h_vals + 1 - a2h[cast(str, x)] for x in entry[0:num_indices]]
+        unique_labels, inverse = np.unique(labels, return_inverse=True)
+        unique_indices = np.asarray(
+            [a2h_vals + 1 - a2h[label] for label in unique_labels.tolist()], dtype=int
+        )
+        return unique_indices[inverse].reshape(labels.shape)
 
     def _force_constants_array(
         self,
-        force_constants: Sequence[tuple],
+        force_constants: np.ndarray,
         factor: float,
         *,
         normalize: bool = True,
-    ):
-        sparse_data = {}
-        max_index = -1
+    ) -> tuple[np.ndarray, np.ndarray, int]:
+        if force_constants.size == 0:
+            return np.zeros((force_constants["indices"].shape[1], 0), dtype=int), np.zeros(0), -1
+
+        indices = self._process_entry_indices(force_constants["indices"])
+        coeffs = force_constants["constants"][:, 0] / factor
+        if normalize:
+            coeffs = coeffs / self._multinomial(indices)
 
-        for entry in force_constants:
-            indices = self._process_entry_indices(list(entry))
-            if indices:
-                max_index = max(max_index, *set(indices))
-                fac = factor
-                fac *= self._multinomial(indices) if normalize else 1.0
-                coeff = entry[-3] / fac
-                sparse_data[tuple(i - 1 for i in indices)] = coeff
+        # later entries overwrite earlier ones with the same indices
+        _, last = np.unique(indices[::-1], axis=0, return_index=True)
+        keep = np.sort(len(indices) - 1 - last)
 
-        return sparse_data, max_index
+        return (indices[keep] - 1).T, coeffs[keep], int(indices.max())
 
     def get_watson_hamiltonian(self, *, normalize: bool = True) -> WatsonHamiltonian:
         """Extracts a Watson Hamiltonian from the Gaussian log.
 
+        The ``WatsonHamiltonian`` is built directly from the :attr:`force_constant_arrays`.
+
         Args:
             normalize: whether or not to normalize the force constants.
 
         Returns:
             The constructed ``WatsonHamiltonian``.
         """
-        quadratic_data, quadratic_max_index = self._force_constants_array(
-            self.quadratic_force_constants, factor=2.0, normalize=normalize
+        arrays = self.force_constant_arrays
+        quadratic_coords, quadratic_data, quadratic_max_index = self._force_constants_array(
+            arrays[2], factor=2.0, normalize=normalize
         )
-        cubic_data, cubic_max_index = self._force_constants_array(
-            self.cubic_force_constants, factor=2.0 * math.sqrt(2.0), normalize=normalize
+        cubic_coords, cubic_data, cubic_max_index = self._force_constants_array(
+            arrays[3], factor=2.0 * math.sqrt(2.0), normalize=normalize
         )
-        quartic_data, quartic_max_index = self._force_constants_array(
-            self.quartic_force_constants, factor=4.0, normalize=normalize
+        quartic_coords, quartic_data, quartic_max_index = self._force_constants_array(
+            arrays[4], factor=4.0, normalize=normalize
         )
 
         max_index = max(quadratic_max_index, cubic_max_index, quartic_max_index)
 
         watson = WatsonHamiltonian(
-            as_coo(quadratic_data, shape=(max_index,) * 2),
-            as_coo(cubic_data, shape=(max_index,) * 3),
-            as_coo(quartic_data, shape=(max_index,) * 4),
-            -as_coo(quadratic_data, shape=(max_index,) * 2),
+            COO(quadratic_coords, quadratic_data, shape=(max_index,) * 2),
+            COO(cubic_coords, cubic_data, shape=(max_index,) * 3),
+            COO(quartic_coords, quartic_data, shape=(max_index,) * 4),
+            COO(quadratic_coords, -quadratic_data, shape=(max_index,) * 2),
         )
         return watson
+
+
+@dataclass(frozen=True)
+class _ParsedLog:
+    """The data parsed from a Gaussian log."""
+
+    force_constants: dict[int, np.ndarray]
+    a_to_h_numbering: dict[str, int]
+
+
+class _ForceConstantSection:
+    """Collects the force constants of a single order while the log gets streamed.
+
+    The data lines are those starting with the first line matching the constants pattern after the
+    section header, up to (excluding) the first line which does not match the pattern anymore.
+    """
+
+    def __init__(self, section_name: str, num_indices: int) -> None:
+        self._header = re.compile(section_name)
+        pattern_constants = ""
+        for i in range(num_indices):
+            pattern_constants += rf"\s+(?P<index{i + 1}>\w+)"
+        for i in range(3):
+            pattern_constants += rf"\s+(?P<const{i + 1}>[+-]?\d+\.\d+)"
+        self._pattern = re.compile(pattern_constants)
+        self._num_indices = num_indices
+        self._found_section = False
+        self._const_found = False
+        self._indices: list[str] = []
+        self._constants = array("d")
+
+    def feed(self, line: str) -> bool:
+        """Processes the next line of the log and returns whether the section is complete."""
+        if not self._found_section:
+            # cheap pre-filter before evaluating the header regex
+            if "FORCE" in line and self._header.search(line) is not None:
+                self._found_section = True
+            else:
+                return False
+
+        const = self._pattern.match(line)
+        if const is None:
+            # either the data has not started yet or it just ended
+            return self._const_found
+
+        self._const_found = True
+        groups = const.groups()
+        self._indices.extend(groups[: self._num_indices])
+        self._constants.extend(float(value) for value in groups[self._num_indices :])
+        return False
+
+    def to_array(self) -> np.ndarray:
+        """Returns the collected force constants as a structured array."""
+        width = max((len(index) for index in self._indices), default=1)
+        dtype = np.dtype(
+            [("indices", f"U{width}", (self._num_indices,)), ("constants", float, (3,))]
+        )
+        data = np.empty(len(self._constants) // 3, dtype=dtype)
+        data["indices"] = np.asarray(self._indices, dtype=f"U{width}").reshape(
+            (-1, self._num_indices)
+        )
+        data["constants"] = np.frombuffer(self._constants, dtype=float).reshape((-1, 3))
+        return data
+
+
+class _NumberingSection:
+    """Collects the A to H numbering mapping while the log gets streamed."""
+
+    def __init__(self) -> None:
+        self._found_section = False
+        self._found_h = False
+        self._found_a = False
+        self._h_nums: list[str] = []
+        self._a_nums: list[str] = []
+        self._a2h: dict[str, int] = {}
+
+    def feed(self, line: str) -> bool:
+        """Processes the next line of the log and returns whether the section is complete."""
+        if not self._found_section:
+            if re.search(r"Input/Output\sinformation", line) is not None:
+                logger.debug(line)
+                self._found_section = True
+            return False
+
+        if re.search(r"\s+\(H\)\s+\|", line) is not None:
+            logger.debug(line)
+            self._found_h = True
+            self._h_nums += [x.strip() for x in line.split("|") if x and "(H)" not in x]
+        elif re.search(r"\s+\(A\)\s+\|", line) is not None:
+            logger.debug(line)
+            self._found_a = True
+            self._a_nums += [x.strip() for x in line.split("|") if x and "(A)" not in x]
+
+        if self._found_h and self._found_a and re.search(r"NOTE:", line) is not None:
+            for i, a_num in enumerate(self._a_nums):
+                self._a2h[a_num] = int(self._h_nums[i])
+            return True
+
+        return False
+
+    def to_dict(self) -> dict[str, int]:
+        """Returns the A to H numbering mapping."""
+        return self._a2h
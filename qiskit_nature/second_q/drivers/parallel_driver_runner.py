@@ -0,0 +1,371 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The ParallelDriverRunner class."""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Iterator, Sequence
+
+import h5py
+from qiskit.utils import algorithm_globals
+
+import qiskit_nature.optionals as _optionals
+from qiskit_nature.exceptions import QiskitNatureError
+from qiskit_nature.second_q.formats.molecule_info import MoleculeInfo
+from qiskit_nature.second_q.formats.qcschema import QCSchema
+from qiskit_nature.second_q.problems import ElectronicStructureProblem
+
+from .electronic_structure_driver import ElectronicStructureDriver, MethodType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ParallelDriverResult:
+    """The result of running an electronic structure driver on a single molecular geometry."""
+
+    index: int
+    """The index of the geometry in the sequence of molecules passed to the runner."""
+
+    molecule: MoleculeInfo
+    """The molecular geometry."""
+
+    problem: ElectronicStructureProblem | None = None
+    """The constructed problem. This is ``None`` when the results are written to HDF5 files or when
+    the calculation failed."""
+
+    path: str | None = None
+    """The path to the HDF5 file storing the :class:`.QCSchema` of this geometry, if any."""
+
+    attempts: int = 0
+    """The number of attempts made to run the calculation of this geometry."""
+
+    error: str | None = None
+    """The error message of the last failed attempt. This is ``None`` if the calculation succeeded."""
+
+    @property
+    def success(self) -> bool:
+        """Returns whether the calculation of this geometry succeeded."""
+        return self.error is None
+
+
+class ParallelDriverRunner:
+    """Runs an electronic structure driver on many molecular geometries in parallel.
+
+    Potential energy scans and the generation of datasets require the same electronic structure
+    calculation for many geometries. This runner distributes those calculations over a pool of
+    processes and streams the results back as they finish. Every geometry gets constructed into
+    its own driver via the ``from_molecule`` method of the provided driver class.
+
+    .. code-block:: python
+
+        from qiskit_nature.second_q.drivers import InitialGuess, ParallelDriverRunner, PySCFDriver
+        from qiskit_nature.second_q.formats import MoleculeInfo
+
+        molecules = [
+            MoleculeInfo(["H", "H"], [(0.0, 0.0, 0.0), (0.0, 0.0, dist)])
+            for dist in (0.5, 0.6, 0.7, 0.8, 0.9)
+        ]
+
+        runner = ParallelDriverRunner(
+            PySCFDriver,
+            basis="sto3g",
+            driver_kwargs={"max_memory": 2000},
+            fallback_driver_kwargs={"init_guess": InitialGuess.ATOM},
+            num_processes=4,
+            num_threads=2,
+        )
+
+        for result in runner.run_iter(molecules):
+            print(result.index, result.problem.reference_energy)
+
+    When an ``output_dir`` is provided, the :class:`.QCSchema` of every geometry is stored in an
+    HDF5 file in that directory instead of returning the problem. Existing files are reused, which
+    allows an interrupted scan to be resumed.
+
+    Failed calculations (those raising an error or, for the :class:`.PySCFDriver`, whose SCF did not
+    converge) are retried once with the ``driver_kwargs`` updated by the ``fallback_driver_kwargs``.
+
+    .. note::
+
+        Resource limits like the ``max_memory`` of the :class:`.PySCFDriver` are passed on via the
+        ``driver_kwargs`` and apply to every process individually. Choose ``num_processes`` and
+        ``num_threads`` such that their product does not exceed the available cores. Note, that
+        ``num_threads`` only limits the threads of the backend itself, not those of NumPy.
+    """
+
+    def __init__(
+        self,
+        driver_class: type[ElectronicStructureDriver],
+        *,
+        basis: str | None = None,
+        method: MethodType = MethodType.RHF,
+        driver_kwargs: dict[str, Any] | None = None,
+        fallback_driver_kwargs: dict[str, Any] | None = None,
+        num_processes: int | None = None,
+        num_threads: int | None = None,
+        output_dir: str | None = None,
+        include_ao_eri: bool = False,
+    ) -> None:
+        """
+        Args:
+            driver_class: the electronic structure driver class. It must implement the
+                ``from_molecule`` method.
+            basis: the basis set. Defaults to the default of ``driver_class.from_molecule``.
+            method: the SCF method type.
+            driver_kwargs: keyword arguments to be passed to every driver.
+            fallback_driver_kwargs: keyword arguments which update the ``driver_kwargs`` when
+                retrying a failed calculation (for example, a different ``init_guess``). If this is
+                ``None``, failed calculations are not retried.
+            num_processes: the maximum number of parallel processes. Defaults to
+                ``qiskit.utils.algorithm_globals.num_processes``. With a single process, all
+                calculations run sequentially in the current process.
+            num_threads: the number of threads used by the backend in every worker process (for
+                the :class:`.PySCFDriver`, this calls ``pyscf.lib.num_threads``). This does not
+                limit the BLAS library of NumPy, which is already loaded when the workers get
+                forked; set, for example, ``OMP_NUM_THREADS`` before starting Python for that. If
+                this is ``None`` or all calculations run sequentially, the thread count of the
+                backend is left unchanged.
+            output_dir: an optional directory in which to store the :class:`.QCSchema` of every
+                geometry as an HDF5 file. The file name is a hash of the molecule and the driver
+                settings, such that existing files get reused only by identical calculations.
+            include_ao_eri: whether to store the two-body integrals in the AO basis in the HDF5
+                files, for drivers whose ``to_qcschema`` supports this option (like the
+                :class:`.PySCFDriver`). These are not required for constructing the problem in the
+                MO basis and are by far the largest part of the files.
+
+        Raises:
+            QiskitNatureError: if ``driver_class`` does not implement ``from_molecule``.
+        """
+        if not hasattr(driver_class, "from_molecule"):
+            raise QiskitNatureError(
+                f"The driver class {driver_class.__name__} does not implement from_molecule."
+            )
+        self._driver_class = driver_class
+        self._basis = basis
+        self._method = method
+        self._driver_kwargs = driver_kwargs
+        self._fallback_driver_kwargs = fallback_driver_kwargs
+        self._num_processes = num_processes
+        self._num_threads = num_threads
+        self._output_dir = output_dir
+        self._include_ao_eri = include_ao_eri
+
+    @property
+    def driver_class(self) -> type[ElectronicStructureDriver]:
+        """Returns the electronic structure driver class."""
+        return self._driver_class
+
+    @property
+    def output_dir(self) -> str | None:
+        """Returns the directory in which the HDF5 files get stored."""
+        return self._output_dir
+
+    @output_dir.setter
+    def output_dir(self, output_dir: str | None) -> None:
+        """Sets the directory in which the HDF5 files get stored."""
+        self._output_dir = output_dir
+
+    def run(self, molecules: Sequence[MoleculeInfo]) -> list[ParallelDriverResult]:
+        """Runs the driver on all molecular geometries.
+
+        Args:
+            molecules: the molecular geometries.
+
+        Returns:
+            The list of results, in the order of ``molecules``.
+        """
+        return sorted(self.run_iter(molecules), key=lambda result: result.index)
+
+    def run_iter(self, molecules: Sequence[MoleculeInfo]) -> Iterator[ParallelDriverResult]:
+        """Runs the driver on all molecular geometries and yields the results as they finish.
+
+        Args:
+            molecules: the molecular geometries.
+
+        Yields:
+            The result of every geometry, in the order in which the calculations finish.
+        """
+        molecules = list(molecules)
+        if self._output_dir is not None:
+            os.makedirs(self._output_dir, exist_ok=True)
+
+        num_processes = self._num_processes
+        if num_processes is None:
+            num_processes = algorithm_globals.num_processes
+        num_processes = max(1, min(num_processes, len(molecules)))
+
+        tasks = [self._task_args(index, molecule) for index, molecule in enumerate(molecules)]
+
+        if num_processes == 1:
+            for args in tasks:
+                yield _run_geometry(*args)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=num_processes,
+            initializer=_init_worker,
+            initargs=(self._num_threads,),
+        ) as executor:
+            futures = [executor.submit(_run_geometry, *args) for args in tasks]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _task_args(self, index: int, molecule: MoleculeInfo) -> tuple:
+        path = None
+        if self._output_dir is not None:
+            path = os.path.join(self._output_dir, f"geometry_{self._output_key(molecule)}.hdf5")
+        return (
+            index,
+            molecule,
+            self._driver_class,
+            self._basis,
+            self._method,
+            self._driver_kwargs,
+            self._fallback_driver_kwargs,
+            path,
+            self._include_ao_eri,
+        )
+
+    def _output_key(self, molecule: MoleculeInfo) -> str:
+        """Returns the canonical hash identifying the output file of a molecule.
+
+        Args:
+            molecule: the molecular geometry.
+
+        Returns:
+            The hexadecimal SHA-256 hash of the molecule and all settings of this runner which affect
+            the results.
+        """
+        settings_dict: dict[str, Any] = {
+            "symbols": list(molecule.symbols),
+            # rounded to remove noise from the formatting of the coordinates (and -0.0)
+            "coords": [[round(float(coord), 8) + 0.0 for coord in xyz] for xyz in molecule.coords],
+            "multiplicity": molecule.multiplicity,
+            "charge": molecule.charge,
+            "units": molecule.units.value,
+            "masses": None if molecule.masses is None else list(molecule.masses),
+            "driver_class": f"{self._driver_class.__module__}.{self._driver_class.__qualname__}",
+            "basis": self._basis,
+            "method": self._method.value,
+            "driver_kwargs": self._driver_kwargs,
+            "fallback_driver_kwargs": self._fallback_driver_kwargs,
+            "include_ao_eri": self._include_ao_eri,
+        }
+        # non-JSON values (like enums) are represented by their string
+        return hashlib.sha256(
+            json.dumps(settings_dict, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+
+def _init_worker(num_threads: int | None) -> None:
+    """Limits the number of threads used by the backend of a worker process.
+
+    Setting environment variables like ``OMP_NUM_THREADS`` here would have no effect, since the
+    BLAS library of NumPy was already loaded by the parent process.
+    """
+    if num_threads is None:
+        return
+    if _optionals.HAS_PYSCF:
+        # pylint: disable=import-error
+        from pyscf import lib
+
+        lib.num_threads(num_threads)
+
+
+def _run_geometry(
+    index: int,
+    molecule: MoleculeInfo,
+    driver_class: type[ElectronicStructureDriver],
+    basis: str | None,
+    method: MethodType,
+    driver_kwargs: dict[str, Any] | None,
+    fallback_driver_kwargs: dict[str, Any] | None,
+    path: str | None,
+    include_ao_eri: bool,
+) -> ParallelDriverResult:
+    """Runs the calculation of a single geometry, retrying it once with the fallback settings."""
+    result = ParallelDriverResult(index, molecule)
+    if path is not None and os.path.exists(path):
+        result.path = path
+        return result
+
+    attempts = [driver_kwargs]
+    if fallback_driver_kwargs is not None:
+        attempts.append({**(driver_kwargs or {}), **fallback_driver_kwargs})
+
+    for kwargs in attempts:
+        result.attempts += 1
+        try:
+            factory_kwargs: dict[str, Any] = {"method": method, "driver_kwargs": kwargs}
+            if basis is not None:
+                factory_kwargs["basis"] = basis
+            driver = driver_class.from_molecule(molecule, **factory_kwargs)
+            if path is None:
+                result.problem = driver.run()
+                _check_convergence(driver)
+            else:
+                _run_to_file(driver, path, include_ao_eri)
+                result.path = path
+            result.error = None
+            return result
+        except Exception as exc:  # pylint: disable=broad-except
+            result.problem = None
+            result.error = f"{type(exc).__name__}: {exc}"
+            logger.warning(
+                "Attempt %d for geometry %d failed: %s", result.attempts, index, result.error
+            )
+
+    return result
+
+
+def _check_convergence(driver: ElectronicStructureDriver) -> None:
+    # pylint: disable=protected-access
+    calc = getattr(driver, "_calc", None)
+    if calc is not None and not getattr(calc, "converged", True):
+        raise QiskitNatureError("The SCF calculation did not converge.")
+
+
+def _run_to_file(driver: ElectronicStructureDriver, path: str, include_ao_eri: bool) -> None:
+    """Runs a driver and stores its QCSchema in an HDF5 file."""
+    run_pyscf = getattr(driver, "run_pyscf", None)
+    if run_pyscf is not None:
+        # avoids the construction of the problem, which is not needed here
+        run_pyscf()
+    else:
+        driver.run()
+    _check_convergence(driver)
+    to_qcschema_kwargs: dict[str, Any] = {}
+    if "include_ao_eri" in inspect.signature(driver.to_qcschema).parameters:
+        to_qcschema_kwargs["include_ao_eri"] = include_ao_eri
+    qcschema: QCSchema = driver.to_qcschema(**to_qcschema_kwargs)
+
+    # the file is written under a temporary name first such that an interrupted run never leaves a
+    # truncated file behind, which would otherwise be reused
+    file_fd, tmp_path = tempfile.mkstemp(suffix=".hdf5", dir=os.path.dirname(path) or None)
+    os.close(file_fd)
+    try:
+        with h5py.File(tmp_path, "w") as file:
+            qcschema.to_hdf5(file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
@@ -14,7 +14,9 @@
 
 from __future__ import annotations
 
+import hashlib
 import inspect
+import json
 import logging
 import os
 import tempfile
@@ -22,6 +24,7 @@ import warnings
 from enum import Enum
 from typing import Any
 
+import h5py
 import numpy as np
 from qiskit.utils.validation import validate_min
 
@@ -31,7 +34,6 @@ from qiskit_nature.second_q.formats.molecule_info import MoleculeInfo
 from qiskit_nature.second_q.formats.qcschema import QCSchema
 from qiskit_nature.second_q.formats.qcschema_translator import qcschema_to_problem
 from qiskit_nature.second_q.problems import ElectronicBasis, ElectronicStructureProblem
-from qiskit_nature.settings import settings
 import qiskit_nature.optionals as _optionals
 from qiskit_nature.utils import get_einsum
 
@@ -75,6 +77,8 @@ class PySCFDriver(ElectronicStructureDriver):
         init_guess: InitialGuess = InitialGuess.MINAO,
         max_memory: int | None = None,
         chkfile: str | None = None,
+        cache_dir: str | None = None,
+        warm_start: bool = False,
     ) -> None:
         """
         Args:
@@ -111,6 +115,23 @@ class PySCFDriver(ElectronicStructureDriver):
             chkfile: The path to a PySCF checkpoint file from which to load a previously run
                 calculation. The data stored in this file is assumed to be already converged.
                 Refer to 6_ and 7_ for more details.
+            cache_dir: The path to a directory in which to cache the results of :meth:`run`. The
+                :class:`.QCSchema` of every calculation gets stored in this directory as an HDF5
+                file, named after a hash of the molecule (the atoms, in Bohr, the charge and spin)
+                and the method settings (basis, method, exchange-correlation functional and
+                convergence tolerance). Repeated runs with identical settings load this file instead
+                of running PySCF. Furthermore, the SCF of the most recent calculation of the same
+                atoms with the same settings is stored as a checkpoint file in this directory, from
+                which new geometries get warm-started. This has no effect when ``chkfile`` is set.
+                Note, that a run which is loaded from the cache does not create any PySCF objects.
+                Thus, methods which require these, like :meth:`to_qcschema` or :meth:`to_problem`,
+                are unavailable after such a run until :meth:`run_pyscf` gets called.
+            warm_start: Whether to start the SCF of every repeated run of this driver from the
+                converged density matrix of its previous run. The previous density matrix gets
+                projected onto the basis of the new geometry, which makes this especially useful
+                for fine-grained scans of potential energy surfaces, in which the ``atom`` of a
+                single driver instance gets updated between its runs. This has no effect when
+                ``chkfile`` is set.
 
         Raises:
             QiskitNatureError: An invalid input was supplied.
@@ -155,6 +176,8 @@ class PySCFDriver(ElectronicStructureDriver):
         self._init_guess = init_guess.value
         self._max_memory = max_memory
         self._chkfile = chkfile
+        self._cache_dir = cache_dir
+        self._warm_start = warm_start
 
         self._mol: gto.Mole = None
         self._calc: scf.HF = None
@@ -295,6 +318,26 @@ class PySCFDriver(ElectronicStructureDriver):
         """Sets the path to the PySCF checkpoint file."""
         self._chkfile = chkfile
 
+    @property
+    def cache_dir(self) -> str | None:
+        """Returns the path to the result cache directory."""
+        return self._cache_dir
+
+    @cache_dir.setter
+    def cache_dir(self, cache_dir: str | None) -> None:
+        """Sets the path to the result cache directory."""
+        self._cache_dir = cache_dir
+
+    @property
+    def warm_start(self) -> bool:
+        """Returns whether repeated runs are warm-started from the previous density matrix."""
+        return self._warm_start
+
+    @warm_start.setter
+    def warm_start(self, warm_start: bool) -> None:
+        """Sets whether repeated runs are warm-started from the previous density matrix."""
+        self._warm_start = warm_start
+
     @staticmethod
     def from_molecule(
         molecule: MoleculeInfo,
@@ -367,8 +410,69 @@ class PySCFDriver(ElectronicStructureDriver):
         Raises:
             QiskitNatureError: if an error during the PySCF setup or calculation occurred.
         """
-        self.run_pyscf()
-        return self.to_problem()
+        if self._cache_dir is None:
+            self.run_pyscf()
+            return self.to_problem()
+
+        os.makedirs(self._cache_dir, exist_ok=True)
+        cache_file = os.path.join(self._cache_dir, f"{self._cache_key()}.hdf5")
+        if os.path.exists(cache_file):
+            logger.info("Loading the PySCF results from the cache file %s", cache_file)
+            qcschema = QCSchema.from_hdf5(cache_file)
+            # PySCF objects of a previous geometry would no longer match the returned results
+            self._mol = None
+            self._calc = None
+        else:
+            self.run_pyscf()
+            # the problem is constructed in the MO basis, which does not require the AO integrals
+            qcschema = self.to_qcschema(include_ao_eri=False)
+            # write to a temporary file first, such that concurrent runs never see partial data
+            file, tmp_file = tempfile.mkstemp(suffix=".hdf5", dir=self._cache_dir)
+            os.close(file)
+            try:
+                with h5py.File(tmp_file, "w") as file:
+                    qcschema.to_hdf5(file)
+                os.replace(tmp_file, cache_file)
+            finally:
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+
+        return self._qcschema_to_problem(qcschema)
+
+    def _cache_key(self, *, include_geometry: bool = True) -> str:
+        """Returns the canonical hash identifying the results of this driver.
+
+        Args:
+            include_geometry: whether to include the atomic coordinates in the hash. Without them,
+                the hash only identifies the atoms and the method settings, which is used to find
+                checkpoint files of nearby geometries.
+
+        Returns:
+            The hexadecimal SHA-256 hash.
+        """
+        # pylint: disable=import-error
+        from pyscf import gto
+
+        atoms = gto.format_atom(self._check_molecule_format(self.atom), unit=self._unit.value)
+        method = self._method.value.upper()
+        settings_dict: dict[str, Any] = {
+            "symbols": [symbol for symbol, _ in atoms],
+            "charge": self._charge,
+            "spin": self._spin,
+            # the same normalization which PySCF applies to basis names
+            "basis": self._basis.lower().replace("-", "").replace("_", "").replace(" ", ""),
+            "method": method,
+            "conv_tol": self._conv_tol,
+        }
+        if method in ("RKS", "ROKS", "UKS"):
+            settings_dict["xc_functional"] = self._xc_functional
+            settings_dict["xcf_library"] = self._xcf_library
+        if include_geometry:
+            # coordinates in Bohr, rounded to remove noise from the unit conversion (and -0.0)
+            settings_dict["coords"] = [
+                [round(float(coord), 8) + 0.0 for coord in coords] for _, coords in atoms
+            ]
+        return hashlib.sha256(json.dumps(settings_dict, sort_keys=True).encode()).hexdigest()
 
     def _build_molecule(self) -> None:
         """Builds the PySCF molecule object.
@@ -466,6 +570,7 @@ class PySCFDriver(ElectronicStructureDriver):
         Raises:
             QiskitNatureError: If an invalid HF method type was supplied.
         """
+        previous_mol, previous_calc = self._mol, self._calc
         self._build_molecule()
 
         # pylint: disable=import-error
@@ -495,7 +600,22 @@ class PySCFDriver(ElectronicStructureDriver):
             self._calc.conv_tol = self._conv_tol
             self._calc.max_cycle = self._max_cycle
             self._calc.init_guess = self._init_guess
-            self._calc.kernel()
+
+            dm0 = None
+            if self._warm_start and getattr(previous_calc, "converged", False):
+                dm0 = self._project_density(previous_mol, previous_calc.make_rdm1())
+                logger.info("PySCF warm-started from the previous density matrix")
+            if self._cache_dir is not None:
+                # warm-start from the orbitals of the last geometry of the same atoms, if available
+                warm_chkfile = os.path.join(
+                    self._cache_dir, f"{self._cache_key(include_geometry=False)}.chk"
+                )
+                if dm0 is None and os.path.exists(warm_chkfile):
+                    dm0 = self._calc.from_chk(warm_chkfile)
+                    logger.info("PySCF warm-started from chkfile %s", warm_chkfile)
+                self._calc.chkfile = warm_chkfile
+
+            self._calc.kernel(dm0)
 
             logger.info(
                 "PySCF kernel() converged: %s, e(hf): %s",
@@ -503,10 +623,48 @@ class PySCFDriver(ElectronicStructureDriver):
                 self._calc.e_tot,
             )
 
-    def to_qcschema(self, *, include_dipole: bool = True) -> QCSchema:
+    def _project_density(self, previous_mol: Any, density: np.ndarray) -> np.ndarray:
+        """Projects the density matrix of a previous calculation onto the current molecule.
+
+        Args:
+            previous_mol: the ``pyscf.gto.Mole`` of the previous calculation.
+            density: the AO density matrix of the previous calculation. This is a 2D array for
+                restricted closed-shell and a 3D array (alpha and beta) for all other methods.
+
+        Returns:
+            The projected density matrix, in the shape expected by the current method.
+        """
+        # pylint: disable=import-error
+        from pyscf.scf import addons
+
+        density = addons.project_dm_nr2nr(previous_mol, density, self._mol)
+
+        restricted = self._method in (MethodType.RHF, MethodType.RKS)
+        if restricted and density.ndim == 3:
+            density = density[0] + density[1]
+        elif not restricted and density.ndim == 2:
+            density = np.asarray((0.5 * density, 0.5 * density))
+        return density
+
+    def to_qcschema(self, *, include_dipole: bool = True, include_ao_eri: bool = True) -> QCSchema:
+        """Extracts all available information after the driver was run into a :class:`.QCSchema`
+        object.
+
+        The two-body integrals are transformed from the AO to the MO basis using PySCF's ``ao2mo``
+        module, which exploits their permutational symmetry and never materializes the full AO
+        tensor. Only the blocks required by the spin treatment of the calculation are computed.
+
+        Args:
+            include_dipole: whether or not to include the custom dipole integrals in the QCSchema.
+            include_ao_eri: whether or not to include the two-body integrals in the AO basis in the
+                QCSchema. These are only required to construct problems in the AO basis.
+
+        Returns:
+            A :class:`.QCSchema` storing all extracted system data computed by the driver.
+        """
         # pylint: disable=import-error
         from pyscf import __version__ as pyscf_version
-        from pyscf import gto
+        from pyscf import ao2mo, gto
         from pyscf.tools import dump_mat
 
         einsum_func, _ = get_einsum()
@@ -533,35 +691,29 @@ class PySCFDriver(ElectronicStructureDriver):
         data.hij_mo = np.dot(np.dot(data.mo_coeff.T, data.hij), data.mo_coeff)
         if data.mo_coeff_b is not None:
             data.hij_mo_b = np.dot(np.dot(data.mo_coeff_b.T, data.hij), data.mo_coeff_b)
-        data.eri = self._mol.intor("int2e", aosym=1)
-        einsum_ao_to_mo = "pqrs,pi,qj,rk,sl->ijkl"
-        data.eri_mo = einsum_func(
-            einsum_ao_to_mo,
-            data.eri,
-            data.mo_coeff,
-            data.mo_coeff,
-            data.mo_coeff,
-            data.mo_coeff,
-            optimize=settings.optimize_einsum,
+
+        # the 8-fold symmetric AO integrals of an in-core SCF can be reused, otherwise ao2mo
+        # evaluates them on the fly (in blocks and out-of-core, if necessary)
+        eri_source = getattr(self._calc, "_eri", None)
+        if eri_source is None:
+            eri_source = self._mol
+        if include_ao_eri:
+            eri_ao = eri_source
+            if eri_ao is self._mol:
+                eri_ao = self._mol.intor("int2e", aosym="s8")
+            data.eri = ao2mo.restore(1, eri_ao, self._mol.nao)
+
+        data.eri_mo = ao2mo.restore(
+            1, ao2mo.full(eri_source, data.mo_coeff), data.mo_coeff.shape[1]
         )
         if data.mo_coeff_b is not None:
-            data.eri_mo_ba = einsum_func(
-                einsum_ao_to_mo,
-                data.eri,
-                data.mo_coeff_b,
-                data.mo_coeff_b,
-                data.mo_coeff,
-                data.mo_coeff,
-                optimize=settings.optimize_einsum,
-            )
-            data.eri_mo_bb = einsum_func(
-                einsum_ao_to_mo,
-                data.eri,
-                data.mo_coeff_b,
-                data.mo_coeff_b,
-                data.mo_coeff_b,
-                data.mo_coeff_b,
-                optimize=settings.optimize_einsum,
+            data.eri_mo_ba = ao2mo.general(
+                eri_source,
+                (data.mo_coeff_b, data.mo_coeff_b, data.mo_coeff, data.mo_coeff),
+                compact=False,
+            ).reshape((data.mo_coeff_b.shape[1],) * 2 + (data.mo_coeff.shape[1],) * 2)
+            data.eri_mo_bb = ao2mo.restore(
+                1, ao2mo.full(eri_source, data.mo_coeff_b), data.mo_coeff_b.shape[1]
             )
 
         data.e_nuc = gto.mole.energy_nuc(self._mol)
@@ -620,8 +772,18 @@ class PySCFDriver(ElectronicStructureDriver):
         basis: ElectronicBasis = ElectronicBasis.MO,
         include_dipole: bool = True,
     ) -> ElectronicStructureProblem:
-        qcschema = self.to_qcschema(include_dipole=include_dipole)
+        qcschema = self.to_qcschema(
+            include_dipole=include_dipole, include_ao_eri=basis == ElectronicBasis.AO
+        )
+        return self._qcschema_to_problem(qcschema, basis=basis, include_dipole=include_dipole)
 
+    @staticmethod
+    def _qcschema_to_problem(
+        qcschema: QCSchema,
+        *,
+        basis: ElectronicBasis = ElectronicBasis.MO,
+        include_dipole: bool = True,
+    ) -> ElectronicStructureProblem:
         problem = qcschema_to_problem(qcschema, basis=basis, include_dipole=include_dipole)
 
         if include_dipole and problem.properties.electronic_dipole_moment is not None:
@@ -12,10 +12,28 @@
 
 """FCIDump dumper."""
 
-from typing import List, Union, TextIO, Tuple, Iterator, Any
-import itertools
+from typing import List, Union, TextIO, Tuple
 import numpy as np
 
+# the format of a single integral line: the value followed by the 4 indices
+_LINE_FORMAT = "%23.16E%4d%4d%4d%4d\n"
+
+# the maximum number of lines which get formatted at once
+_CHUNK_SIZE = 2**16
+
+# the permutations of the chemist-ordered indices (ij|kl) which leave the 2-electron integrals
+# invariant: the first 4 swap indices within the bra and ket, the last 4 additionally exchange them
+_PERMUTATIONS = (
+    (0, 1, 2, 3),
+    (1, 0, 2, 3),
+    (0, 1, 3, 2),
+    (1, 0, 3, 2),
+    (2, 3, 0, 1),
+    (3, 2, 0, 1),
+    (2, 3, 1, 0),
+    (3, 2, 1, 0),
+)
+
 
 def _dump_1e_ints(
     hij: np.ndarray,
@@ -24,15 +42,16 @@ def _dump_1e_ints(
     beta: bool = False,
 ) -> None:
     idx_offset = 1 if not beta else 1 + len(mos)
-    hij_elements = set()
-    for i, j in itertools.product(mos, repeat=2):
-        if i == j:
-            _write_to_outfile(outfile, hij[i][j], (i + idx_offset, j + idx_offset, 0, 0))
-            continue
-        if (j, i) in hij_elements and np.isclose(hij[i][j], hij[j][i]):
-            continue
-        _write_to_outfile(outfile, hij[i][j], (i + idx_offset, j + idx_offset, 0, 0))
-        hij_elements.add((i, j))
+    mos = np.asarray(mos, dtype=int)
+    hij = np.asarray(hij)[np.ix_(mos, mos)]
+    # the lower triangle is only written where it differs from the upper one
+    row, col = np.indices(hij.shape)
+    row, col = np.nonzero((row <= col) | ~np.isclose(hij, hij.T))
+    _write_lines(
+        outfile,
+        hij[row, col],
+        (mos[row] + idx_offset, mos[col] + idx_offset, np.zeros_like(row), np.zeros_like(row)),
+    )
 
 
 def _dump_2e_ints(
@@ -41,49 +60,51 @@ def _dump_2e_ints(
     idx_offsets = [1, 1]
     for b in range(beta):
         idx_offsets[1 - b] += len(mos)
-    hijkl_elements = set()
-    for elem in itertools.product(mos, repeat=4):
-        if np.isclose(hijkl[elem], 0.0, atol=1e-14):
-            continue
-        if len(set(elem)) == 1:
-            _write_to_outfile(
-                outfile,
-                hijkl[elem],
-                (
-                    *[e + idx_offsets[0] for e in elem[:2]],
-                    *[e + idx_offsets[1] for e in elem[2:]],
-                ),
-            )
-            continue
-        if (
-            beta != 1
-            and elem[::-1] in hijkl_elements
-            and np.isclose(hijkl[elem], hijkl[elem[::-1]])
-        ):
-            continue
-        bra_perms = set(itertools.permutations(elem[:2]))
-        ket_perms = set(itertools.permutations(elem[2:]))
-        permutations: Iterator[Any]
-        if beta == 1:
-            permutations = itertools.product(bra_perms, ket_perms)
-        else:
-            permutations = itertools.chain(
-                itertools.product(bra_perms, ket_perms),
-                itertools.product(ket_perms, bra_perms),
-            )
-        for perm in {e1 + e2 for e1, e2 in permutations}:
-            if perm in hijkl_elements and np.isclose(hijkl[elem], hijkl[perm]):
-                break
-        else:
-            _write_to_outfile(
-                outfile,
-                hijkl[elem],
-                (
-                    *[e + idx_offsets[0] for e in elem[:2]],
-                    *[e + idx_offsets[1] for e in elem[2:]],
-                ),
+    mos = np.asarray(mos, dtype=int)
+    hijkl = np.asarray(hijkl)[np.ix_(mos, mos, mos, mos)]
+    norb = len(mos)
+    # the alpha/beta integrals are only symmetric within their bra and ket
+    permutations = _PERMUTATIONS[1:4] if beta == 1 else _PERMUTATIONS[1:]
+
+    # An element gets written unless it is equal to a permuted element which precedes it in the
+    # lexicographic order (and thus was already written). The elements are processed in chunks of
+    # the first index to bound the memory of the index arrays.
+    for i in range(norb):
+        nonzero = np.nonzero(~np.isclose(hijkl[i], 0.0, atol=1e-14))
+        indices = np.stack((np.full_like(nonzero[0], i), *nonzero))
+        values = hijkl[i][nonzero]
+        flat = np.ravel_multi_index(indices, hijkl.shape)
+
+        keep = np.ones(values.shape, dtype=bool)
+        for perm in permutations:
+            perm_indices = indices[list(perm)]
+            perm_values = hijkl[tuple(perm_indices)]
+            keep &= ~(
+                (np.ravel_multi_index(perm_indices, hijkl.shape) < flat)
+                & ~np.isclose(perm_values, 0.0, atol=1e-14)
+                & np.isclose(values, perm_values)
             )
-            hijkl_elements.add(elem)
+
+        indices = mos[indices[:, keep]]
+        _write_lines(
+            outfile,
+            values[keep],
+            (
+                indices[0] + idx_offsets[0],
+                indices[1] + idx_offsets[0],
+                indices[2] + idx_offsets[1],
+                indices[3] + idx_offsets[1],
+            ),
+        )
+
+
+def _write_lines(outfile: TextIO, values: np.ndarray, indices: Tuple[np.ndarray, ...]) -> None:
+    # formatting many lines with a single string interpolation avoids the per-line overhead
+    # (the indices are stored as exactly representable floats, which the %d format accepts)
+    lines = np.column_stack((values, *indices))
+    for start in range(0, lines.shape[0], _CHUNK_SIZE):
+        chunk = lines[start : start + _CHUNK_SIZE]
+        outfile.write((_LINE_FORMAT * chunk.shape[0]) % tuple(chunk.ravel().tolist()))
 
 
 def _write_to_outfile(outfile: TextIO, value: float, indices: Tuple):
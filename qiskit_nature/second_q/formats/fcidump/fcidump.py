@@ -14,12 +14,18 @@
 
 from __future__ import annotations
 
-from typing import Sequence
+import gzip
+from typing import Sequence, TextIO, cast
 from dataclasses import dataclass
 from pathlib import Path
+import h5py
 import numpy as np
 
 from qiskit_nature import QiskitNatureError
+from qiskit_nature.second_q.formats.qcschema.qc_wavefunction import (
+    _pack_symmetry,
+    _unpack_symmetry,
+)
 from qiskit_nature.second_q.operators.tensor_ordering import find_index_order, to_chemist_ordering
 
 from .dumper import _dump_1e_ints, _dump_2e_ints, _write_to_outfile
@@ -32,6 +38,12 @@ class FCIDump:
 
     The FCIDump format is partially defined in Knowles1989.
 
+    Besides the text format, an FCIDump can be stored in a binary HDF5 file via :meth:`to_hdf5`.
+    This file holds the same metadata (``NORB``, ``NELEC``, ``MS2``, ``ORBSYM``, ``ISYM`` and
+    ``ECORE``) and the exact (symmetry-packed) integrals, such that reloading it via
+    :meth:`from_hdf5` is limited by I/O rather than parsing, and converting it back to text
+    reproduces the original file.
+
     References:
         Knowles1989: Peter J. Knowles, Nicholas C. Handy,
             A determinant based full configuration interaction program,
@@ -104,7 +116,8 @@ class FCIDump:
         """Constructs an FCIDump object from a file.
 
         Args:
-            fcidump: Path to the input file.
+            fcidump: Path to the input file. If it ends in ``.gz`` the file is decompressed using
+                gzip.
 
         Returns:
             A :class:`.FCIDump` instance.
@@ -117,8 +130,11 @@ class FCIDump:
     def to_file(self, fcidump: str | Path) -> None:
         """Dumps an FCIDump object to a file.
 
+        Only the symmetry-unique, non-zero 2-electron integrals are written.
+
         Args:
-            fcidump: Path to the output file.
+            fcidump: Path to the output file. If it ends in ``.gz`` the file is compressed using
+                gzip.
         Raises:
             QiskitNatureError: not all beta-spin related matrices are either None or not None.
             QiskitNatureError: if the dimensions of the provided integral matrices do not match.
@@ -140,7 +156,7 @@ class FCIDump:
         ms2 = self.multiplicity - 1
 
         mos = range(norb)
-        with outpath.open("w", encoding="utf8") as outfile:
+        with _open(outpath, "w") as outfile:
             # print header
             outfile.write(f"&FCI NORB={norb:4d},NELEC={nelec:4d},MS2={ms2:4d},\n")
             if self.orbsym is None:
@@ -165,6 +181,121 @@ class FCIDump:
             if einact is not None:
                 _write_to_outfile(outfile, einact, (0, 0, 0, 0))
 
+    def to_hdf5(self, h5py_data: str | Path | h5py.Group, *, pack_symmetry: bool = True) -> None:
+        """Stores an FCIDump object in the binary HDF5 format.
+
+        Args:
+            h5py_data: the path to the output file or an ``h5py.Group`` into which to store the
+                object.
+            pack_symmetry: whether to store only the symmetry-unique elements of the 2-electron
+                integrals. These are packed only if the integrals are exactly symmetric, such that
+                the stored data remains lossless.
+        """
+        if isinstance(h5py_data, h5py.Group):
+            self._to_hdf5(h5py_data, pack_symmetry=pack_symmetry)
+            return
+
+        with h5py.File(h5py_data, "w") as file:
+            self._to_hdf5(file, pack_symmetry=pack_symmetry)
+
+    def _to_hdf5(self, group: h5py.Group, *, pack_symmetry: bool) -> None:
+        group.attrs["NORB"] = self.num_orbitals
+        group.attrs["NELEC"] = self.num_electrons
+        group.attrs["MS2"] = self.multiplicity - 1
+        group.attrs["ISYM"] = self.isym
+        if self.orbsym is not None:
+            group.attrs["ORBSYM"] = list(self.orbsym)
+        if self.constant_energy is not None:
+            group.attrs["ECORE"] = self.constant_energy
+
+        for name in ("hij", "hij_b"):
+            value = getattr(self, name)
+            if value is not None:
+                group.create_dataset(name, data=np.asarray(value))
+
+        for name, packing in (("hijkl", "s8"), ("hijkl_ba", "s4"), ("hijkl_bb", "s8")):
+            value = getattr(self, name)
+            if value is None:
+                continue
+            value = np.asarray(value)
+            packed = _pack_symmetry(value.ravel(), packing) if pack_symmetry else None
+            if packed is not None and np.array_equal(
+                _unpack_symmetry(packed[0], packing, packed[1]), value.ravel()
+            ):
+                dataset = group.create_dataset(name, data=packed[0])
+                dataset.attrs["packing"] = packing
+                dataset.attrs["num_orbitals"] = packed[1]
+            else:
+                group.create_dataset(name, data=value)
+
+    @classmethod
+    def from_hdf5(cls, h5py_data: str | Path | h5py.Group, *, mmap: bool = False) -> FCIDump:
+        """Constructs an FCIDump object from the binary HDF5 format.
+
+        Args:
+            h5py_data: the path to the input file or an ``h5py.Group`` from which to load the
+                object.
+            mmap: whether to memory-map the integrals instead of reading them into memory. This
+                only applies to integrals which were stored without symmetry packing (see
+                :meth:`to_hdf5`), since the packed ones need to be unpacked in memory.
+
+        Returns:
+            A :class:`.FCIDump` instance.
+        """
+        if isinstance(h5py_data, h5py.Group):
+            return cls._from_hdf5_group(h5py_data, mmap=mmap)
+
+        with h5py.File(h5py_data, "r") as file:
+            return cls._from_hdf5_group(file, mmap=mmap)
+
+    @classmethod
+    def _from_hdf5_group(cls, group: h5py.Group, *, mmap: bool) -> FCIDump:
+        arrays = {name: _read_hdf5_array(dataset, mmap) for name, dataset in group.items()}
+        orbsym = group.attrs.get("ORBSYM", None)
+        constant_energy = group.attrs.get("ECORE", None)
+        return cls(
+            num_electrons=int(group.attrs["NELEC"]),
+            hij=arrays["hij"],
+            hijkl=arrays["hijkl"],
+            hij_b=arrays.get("hij_b", None),
+            hijkl_bb=arrays.get("hijkl_bb", None),
+            hijkl_ba=arrays.get("hijkl_ba", None),
+            constant_energy=None if constant_energy is None else float(constant_energy),
+            multiplicity=int(group.attrs["MS2"]) + 1,
+            orbsym=None if orbsym is None else [int(sym) for sym in orbsym],
+            isym=int(group.attrs["ISYM"]),
+        )
+
+
+def _read_hdf5_array(dataset: h5py.Dataset, mmap: bool) -> np.ndarray:
+    """Reads an integral array from HDF5, unpacking symmetry-packed 2-electron integrals."""
+    packing = dataset.attrs.get("packing", None)
+    if packing is not None:
+        num_orbitals = int(dataset.attrs["num_orbitals"])
+        unpacked = _unpack_symmetry(dataset[...], packing, num_orbitals)
+        return unpacked.reshape((num_orbitals,) * 4)
+
+    if mmap:
+        # only contiguous, uncompressed datasets have a fixed location in the file
+        offset = dataset.id.get_offset()
+        if offset is not None and dataset.chunks is None:
+            return np.memmap(
+                dataset.file.filename,
+                mode="r",
+                dtype=dataset.dtype,
+                shape=dataset.shape,
+                offset=offset,
+            )
+
+    return dataset[...]
+
+
+def _open(path: Path, mode: str) -> TextIO:
+    """Opens an FCIDump file in text mode, using gzip for paths ending in ``.gz``."""
+    if path.suffix == ".gz":
+        return cast(TextIO, gzip.open(path, mode + "t", encoding="utf8"))
+    return cast(TextIO, path.open(mode, encoding="utf8"))
+
 
 # inject the property getter/setter methods for the dataclass attributes
 # See also: https://stackoverflow.com/a/61480946
@@ -19,7 +19,7 @@ from pathlib import Path
 import numpy as np
 
 from qiskit_nature import QiskitNatureError
-from .fcidump import FCIDump
+from .fcidump import FCIDump, _open
 
 
 def _parse(fcidump: Path) -> FCIDump:
@@ -35,7 +35,7 @@ def _parse(fcidump: Path) -> FCIDump:
         A dictionary storing the parsed data.
     """
     try:
-        with fcidump.open("r", encoding="utf8") as file:
+        with _open(fcidump, "r") as file:
             fcidump_str = file.read()
     except OSError as ex:
         raise QiskitNatureError(f"Input file '{fcidump}' cannot be read!") from ex
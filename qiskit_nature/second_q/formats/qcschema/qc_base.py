@@ -15,12 +15,14 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
+import copy
+from dataclasses import fields
 from pathlib import Path
 from typing import Any
 
 import json
 import h5py
+import numpy as np
 
 
 class _QCBase:
@@ -32,14 +34,17 @@ class _QCBase:
     def to_dict(self) -> dict[str, Any]:
         """Converts the schema object to a dictionary.
 
+        Any numpy arrays stored in the schema object are converted to (nested) lists, making the
+        returned dictionary JSON-serializable.
+
         Returns:
             The dictionary representation of the schema object.
         """
-
-        def filter_none(d: list[tuple[str, Any]]) -> dict[str, Any]:
-            return {k: v for (k, v) in d if v is not None}
-
-        return asdict(self, dict_factory=filter_none)
+        return {
+            field.name: _to_dict_value(getattr(self, field.name))
+            for field in fields(self)  # type: ignore[arg-type]
+            if getattr(self, field.name) is not None
+        }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> _QCBase:
@@ -137,3 +142,20 @@ class _QCBase:
         for key, value in h5py_group.items():
             data[key] = value[...]
         return cls(**data)
+
+
+def _to_dict_value(value: Any) -> Any:
+    """Recursively converts a value of a schema object for :meth:`_QCBase.to_dict`.
+
+    This mirrors :func:`dataclasses.asdict` but converts numpy arrays to lists instead of copying
+    them.
+    """
+    if isinstance(value, _QCBase):
+        return value.to_dict()
+    if isinstance(value, np.ndarray) or hasattr(value, "__array__"):
+        return np.asarray(value).tolist()
+    if isinstance(value, (list, tuple)):
+        return type(value)(_to_dict_value(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _to_dict_value(item) for key, item in value.items()}
+    return copy.deepcopy(value)
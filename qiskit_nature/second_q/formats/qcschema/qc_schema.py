@@ -81,7 +81,24 @@ class QCSchema(QCSchemaInput):
             wavefunction=wavefunction,
         )
 
-    def to_hdf5(self, group: h5py.Group) -> None:
+    def to_hdf5(
+        self,
+        group: h5py.Group,
+        *,
+        compression: str | None = None,
+        compression_opts: Any = None,
+        pack_symmetry: bool = False,
+    ) -> None:
+        """Converts the schema object to HDF5.
+
+        Args:
+            group: the h5py group into which to store the object.
+            compression: the compression filter (``"gzip"`` or ``"lzf"``) to apply to the array
+                datasets of the :attr:`wavefunction`. Compressed datasets are always stored in chunks.
+            compression_opts: the options of the compression filter (e.g. the ``gzip`` level).
+            pack_symmetry: whether to store only the symmetry-unique elements of the two-body
+                integrals. See also :meth:`.QCWavefunction.to_hdf5`.
+        """
         group.attrs["schema_name"] = self.schema_name
         group.attrs["schema_version"] = self.schema_version
         group.attrs["driver"] = self.driver
@@ -106,14 +123,38 @@ class QCSchema(QCSchemaInput):
 
         if self.wavefunction is not None:
             wavefunction_group = group.require_group("wavefunction")
-            self.wavefunction.to_hdf5(wavefunction_group)
+            self.wavefunction.to_hdf5(
+                wavefunction_group,
+                compression=compression,
+                compression_opts=compression_opts,
+                pack_symmetry=pack_symmetry,
+            )
 
         keywords_group = group.require_group("keywords")
         for key, value in self.keywords.items():
             keywords_group.attrs[key] = value
 
     @classmethod
-    def _from_hdf5_group(cls, h5py_group: h5py.Group) -> QCSchemaInput:
+    def from_hdf5(cls, h5py_data: str | Path | h5py.Group, *, lazy: bool = False) -> QCSchema:
+        """Constructs a schema object from an HDF5 object.
+
+        Args:
+            h5py_data: can be either the path to a file or an `h5py.Group`.
+            lazy: whether to defer reading the array datasets of the :attr:`wavefunction` until
+                their values are used. This makes opening large files fast and only reads the data
+                which is actually needed. See also :meth:`.QCWavefunction.from_hdf5`.
+
+        Returns:
+            An instance of the schema object.
+        """
+        if isinstance(h5py_data, h5py.Group):
+            return cls._from_hdf5_group(h5py_data, lazy=lazy)
+
+        with h5py.File(h5py_data, "r") as file:
+            return cls._from_hdf5_group(file, lazy=lazy)
+
+    @classmethod
+    def _from_hdf5_group(cls, h5py_group: h5py.Group, *, lazy: bool = False) -> QCSchema:
         data = dict(h5py_group.attrs.items())
 
         data["molecule"] = cast(QCTopology, QCTopology.from_hdf5(h5py_group["molecule"]))
@@ -126,7 +167,7 @@ class QCSchema(QCSchemaInput):
 
         if "wavefunction" in h5py_group.keys():
             data["wavefunction"] = cast(
-                QCWavefunction, QCWavefunction.from_hdf5(h5py_group["wavefunction"])
+                QCWavefunction, QCWavefunction.from_hdf5(h5py_group["wavefunction"], lazy=lazy)
             )
 
         data["keywords"] = dict(h5py_group["keywords"].attrs.items())
@@ -227,12 +268,12 @@ class QCSchema(QCSchemaInput):
                     properties_data["calcinfo_nmo"] = nmo
 
                     wavefunction_data["orbitals_a"] = "scf_orbitals_a"
-                    wavefunction_data["scf_orbitals_a"] = orbitals_a.ravel().tolist()
+                    wavefunction_data["scf_orbitals_a"] = orbitals_a.ravel()
                     if "Beta coefficients" in basis_transform.keys():
                         wavefunction_data["orbitals_b"] = "scf_orbitals_b"
-                        wavefunction_data["scf_orbitals_b"] = (
-                            np.asarray(basis_transform["Beta coefficients"][...]).ravel().tolist()
-                        )
+                        wavefunction_data["scf_orbitals_b"] = np.asarray(
+                            basis_transform["Beta coefficients"][...]
+                        ).ravel()
 
             particle_number = file[root_name].get("ParticleNumber", None)
             if particle_number is not None:
@@ -245,10 +286,10 @@ class QCSchema(QCSchemaInput):
                 properties_data["calcinfo_nbeta"] = int(particle_number.attrs["num_beta"])
                 wavefunction_data["occupations_a"] = "scf_occupations_a"
                 wavefunction_data["occupations_b"] = "scf_occupations_b"
-                wavefunction_data["scf_occupations_a"] = list(
+                wavefunction_data["scf_occupations_a"] = np.asarray(
                     particle_number["occupation_alpha"][...]
                 )
-                wavefunction_data["scf_occupations_b"] = list(
+                wavefunction_data["scf_occupations_b"] = np.asarray(
                     particle_number["occupation_beta"][...]
                 )
 
@@ -270,14 +311,10 @@ class QCSchema(QCSchemaInput):
 
                     if len(orbital_energies.shape) == 2:
                         wavefunction_data["eigenvalues_b"] = "scf_eigenvalues_b"
-                        wavefunction_data["scf_eigenvalues_a"] = (
-                            orbital_energies[0].ravel().tolist()
-                        )
-                        wavefunction_data["scf_eigenvalues_b"] = (
-                            orbital_energies[1].ravel().tolist()
-                        )
+                        wavefunction_data["scf_eigenvalues_a"] = orbital_energies[0].ravel()
+                        wavefunction_data["scf_eigenvalues_b"] = orbital_energies[1].ravel()
                     else:
-                        wavefunction_data["scf_eigenvalues_a"] = orbital_energies.ravel().tolist()
+                        wavefunction_data["scf_eigenvalues_a"] = orbital_energies.ravel()
 
                 electronic_integrals = electronic_energy["electronic_integrals"]
 
@@ -297,9 +334,7 @@ class QCSchema(QCSchemaInput):
                     if spin_integrals is None:
                         return
                     wavefunction_data[qcschema_key] = f"scf_{qcschema_key}"
-                    wavefunction_data[f"scf_{qcschema_key}"] = (
-                        np.asarray(spin_integrals).ravel().tolist()
-                    )
+                    wavefunction_data[f"scf_{qcschema_key}"] = np.asarray(spin_integrals).ravel()
 
                 _extract_electronic_integral("AO", "One", "Alpha", "fock_a")
                 _extract_electronic_integral("AO", "One", "Beta", "fock_b")
@@ -14,21 +14,24 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Sequence, cast
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, cast
 
 import h5py
+import numpy as np
 
 from .qc_base import _QCBase
 from .qc_basis_set import QCBasisSet
 
 
-# TODO: directly support np.ndarray instead of always converting to flat lists
 @dataclass
 class QCWavefunction(_QCBase):
     """A dataclass to store any additional computed wavefunction properties.
 
-    Matrix quantities are stored as flat, column-major arrays.
+    Matrix quantities are stored as flat numpy arrays. These only get converted to lists by
+    :meth:`to_dict` (and, thus, :meth:`to_json`), while they are written to and read from HDF5
+    datasets directly.
 
     For more information refer to
     [here](https://molssi-qc-schema.readthedocs.io/en/latest/auto_wf.html#wavefunction-schema).
@@ -101,91 +104,91 @@ class QCWavefunction(_QCBase):
     dipole_mo_z_b: str | None = None
     """The name of beta-spin z-axis dipole moment integrals in the MO basis."""
 
-    scf_orbitals_a: Sequence[float] | None = None
+    scf_orbitals_a: np.ndarray | None = None
     """The SCF alpha-spin orbitals in the AO basis."""
-    scf_orbitals_b: Sequence[float] | None = None
+    scf_orbitals_b: np.ndarray | None = None
     """The SCF beta-spin orbitals in the AO basis."""
-    scf_density_a: Sequence[float] | None = None
+    scf_density_a: np.ndarray | None = None
     """The SCF alpha-spin density in the AO basis."""
-    scf_density_b: Sequence[float] | None = None
+    scf_density_b: np.ndarray | None = None
     """The SCF beta-spin density in the AO basis."""
-    scf_density_mo_a: Sequence[float] | None = None
+    scf_density_mo_a: np.ndarray | None = None
     """The SCF alpha-spin density in the MO basis."""
-    scf_density_mo_b: Sequence[float] | None = None
+    scf_density_mo_b: np.ndarray | None = None
     """The SCF beta-spin density in the MO basis."""
-    scf_fock_a: Sequence[float] | None = None
+    scf_fock_a: np.ndarray | None = None
     """The SCF alpha-spin Fock matrix in the AO basis."""
-    scf_fock_b: Sequence[float] | None = None
+    scf_fock_b: np.ndarray | None = None
     """The SCF beta-spin Fock matrix in the AO basis."""
-    scf_fock_mo_a: Sequence[float] | None = None
+    scf_fock_mo_a: np.ndarray | None = None
     """The SCF alpha-spin Fock matrix in the MO basis."""
-    scf_fock_mo_b: Sequence[float] | None = None
+    scf_fock_mo_b: np.ndarray | None = None
     """The SCF beta-spin Fock matrix in the MO basis."""
-    scf_coulomb_a: Sequence[float] | None = None
+    scf_coulomb_a: np.ndarray | None = None
     """The SCF alpha-spin Coulomb matrix in the AO basis."""
-    scf_coulomb_b: Sequence[float] | None = None
+    scf_coulomb_b: np.ndarray | None = None
     """The SCF beta-spin Coulomb matrix in the AO basis."""
-    scf_exchange_a: Sequence[float] | None = None
+    scf_exchange_a: np.ndarray | None = None
     """The SCF alpha-spin Exchange matrix in the AO basis."""
-    scf_exchange_b: Sequence[float] | None = None
+    scf_exchange_b: np.ndarray | None = None
     """The SCF beta-spin Exchange matrix in the AO basis."""
-    scf_eigenvalues_a: Sequence[float] | None = None
+    scf_eigenvalues_a: np.ndarray | None = None
     """The SCF alpha-spin orbital eigenvalues."""
-    scf_eigenvalues_b: Sequence[float] | None = None
+    scf_eigenvalues_b: np.ndarray | None = None
     """The SCF beta-spin orbital eigenvalues."""
-    scf_occupations_a: Sequence[float] | None = None
+    scf_occupations_a: np.ndarray | None = None
     """The SCF alpha-spin orbital occupations."""
-    scf_occupations_b: Sequence[float] | None = None
+    scf_occupations_b: np.ndarray | None = None
     """The SCF beta-spin orbital occupations."""
-    scf_eri: Sequence[float] | None = None
+    scf_eri: np.ndarray | None = None
     """The SCF electron-repulsion integrals in the AO basis."""
-    scf_eri_mo_aa: Sequence[float] | None = None
+    scf_eri_mo_aa: np.ndarray | None = None
     """The SCF alpha-alpha electron-repulsion integrals in the MO basis."""
-    scf_eri_mo_ab: Sequence[float] | None = None
+    scf_eri_mo_ab: np.ndarray | None = None
     """The SCF alpha-beta electron-repulsion integrals in the MO basis."""
-    scf_eri_mo_ba: Sequence[float] | None = None
+    scf_eri_mo_ba: np.ndarray | None = None
     """The SCF beta-alpha electron-repulsion integrals in the MO basis."""
-    scf_eri_mo_bb: Sequence[float] | None = None
+    scf_eri_mo_bb: np.ndarray | None = None
     """The SCF beta-beta electron-repulsion integrals in the MO basis."""
-    scf_dipole_x: Sequence[float] | None = None
+    scf_dipole_x: np.ndarray | None = None
     """The SCF x-axis dipole moment integrals in the AO basis."""
-    scf_dipole_y: Sequence[float] | None = None
+    scf_dipole_y: np.ndarray | None = None
     """The SCF y-axis dipole moment integrals in the AO basis."""
-    scf_dipole_z: Sequence[float] | None = None
+    scf_dipole_z: np.ndarray | None = None
     """The SCF z-axis dipole moment integrals in the AO basis."""
-    scf_dipole_mo_x_a: Sequence[float] | None = None
+    scf_dipole_mo_x_a: np.ndarray | None = None
     """The SCF alpha-spin x-axis dipole moment integrals in the MO basis."""
-    scf_dipole_mo_y_a: Sequence[float] | None = None
+    scf_dipole_mo_y_a: np.ndarray | None = None
     """The SCF alpha-spin y-axis dipole moment integrals in the MO basis."""
-    scf_dipole_mo_z_a: Sequence[float] | None = None
+    scf_dipole_mo_z_a: np.ndarray | None = None
     """The SCF alpha-spin z-axis dipole moment integrals in the MO basis."""
-    scf_dipole_mo_x_b: Sequence[float] | None = None
+    scf_dipole_mo_x_b: np.ndarray | None = None
     """The SCF beta-spin x-axis dipole moment integrals in the MO basis."""
-    scf_dipole_mo_y_b: Sequence[float] | None = None
+    scf_dipole_mo_y_b: np.ndarray | None = None
     """The SCF beta-spin y-axis dipole moment integrals in the MO basis."""
-    scf_dipole_mo_z_b: Sequence[float] | None = None
+    scf_dipole_mo_z_b: np.ndarray | None = None
     """The SCF beta-spin z-axis dipole moment integrals in the MO basis."""
 
-    localized_orbitals_a: Sequence[float] | None = None
+    localized_orbitals_a: np.ndarray | None = None
     """The localized alpha-spin orbitals. All `nmo` orbitals are included, even if only a subset
     were localized."""
-    localized_orbitals_b: Sequence[float] | None = None
+    localized_orbitals_b: np.ndarray | None = None
     """The localized beta-spin orbitals. All `nmo` orbitals are included, even if only a subset were
     localized."""
-    localized_fock_a: Sequence[float] | None = None
+    localized_fock_a: np.ndarray | None = None
     """The alpha-spin Fock matrix in the localized basis. All `nmo` orbitals are included, even if
     only a subset were localized."""
-    localized_fock_b: Sequence[float] | None = None
+    localized_fock_b: np.ndarray | None = None
     """The beta-spin Fock matrix in the localized basis. All `nmo` orbitals are included, even if
     only a subset were localized."""
 
-    h_core_a: Sequence[float] | None = None
+    h_core_a: np.ndarray | None = None
     """The alpha-spin core (one-electron) Hamiltonian matrix in the AO basis."""
-    h_core_b: Sequence[float] | None = None
+    h_core_b: np.ndarray | None = None
     """The beta-spin core (one-electron) Hamiltonian matrix in the AO basis."""
-    h_effective_a: Sequence[float] | None = None
+    h_effective_a: np.ndarray | None = None
     """The effective alpha-spin core (one-electron) Hamiltonian matrix in the AO basis."""
-    h_effective_b: Sequence[float] | None = None
+    h_effective_b: np.ndarray | None = None
     """The effective beta-spin core (one-electron) Hamiltonian matrix in the AO basis."""
 
     restricted: bool | None = None
@@ -196,15 +199,50 @@ class QCWavefunction(_QCBase):
         basis: str | dict[str, Any] | QCBasisSet = data.pop("basis")
         if isinstance(basis, dict):
             basis = QCBasisSet.from_dict(basis)
+        data = {
+            key: np.asarray(value) if isinstance(value, list) else value
+            for key, value in data.items()
+        }
         return cls(**data, basis=basis)
 
-    def to_hdf5(self, group: h5py.Group) -> None:
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, QCWavefunction):
+            return NotImplemented
+        for field in fields(self):
+            value, other_value = getattr(self, field.name), getattr(other, field.name)
+            if _is_array(value) or _is_array(other_value):
+                if value is None or other_value is None:
+                    return False
+                if not np.array_equal(value, other_value):
+                    return False
+            elif value != other_value:
+                return False
+        return True
+
+    def to_hdf5(
+        self,
+        group: h5py.Group,
+        *,
+        compression: str | None = None,
+        compression_opts: Any = None,
+        pack_symmetry: bool = False,
+    ) -> None:
+        """Converts the schema object to HDF5.
+
+        Args:
+            group: the h5py group into which to store the object.
+            compression: the compression filter (``"gzip"`` or ``"lzf"``) to apply to the array
+                datasets. Compressed datasets are always stored in chunks.
+            compression_opts: the options of the compression filter (e.g. the ``gzip`` level).
+            pack_symmetry: whether to store only the symmetry-unique elements of the two-body
+                integrals. The (chemists'-ordered) integrals of equal spin are packed using their
+                8-fold and those of mixed spin using their 4-fold permutational symmetry. Integrals
+                which are not (numerically) symmetric are stored unpacked.
+        """
         for key, value in self.__dict__.items():
             if value is None:
                 continue
-            if key == "restricted":
-                group.attrs["restricted"] = self.restricted
-            elif key == "basis":
+            if key == "basis":
                 if isinstance(self.basis, QCBasisSet):
                     basis_group = group.require_group("basis")
                     self.basis.to_hdf5(basis_group)
@@ -213,11 +251,50 @@ class QCWavefunction(_QCBase):
             elif hasattr(value, "to_hdf5"):
                 inner_group = group.require_group(key)
                 value.to_hdf5(inner_group)
+            elif _is_array(value) or isinstance(value, (list, tuple)):
+                # arrays are written directly, without an intermediate conversion to lists
+                data = np.asarray(value)
+                packed = None
+                if pack_symmetry and key in _SYMMETRY_PACKING:
+                    packed = _pack_symmetry(data, _SYMMETRY_PACKING[key])
+                if packed is not None:
+                    data = packed[0]
+                dataset = group.create_dataset(
+                    key,
+                    data=data,
+                    chunks=True if compression is not None else None,
+                    compression=compression,
+                    compression_opts=compression_opts,
+                )
+                if packed is not None:
+                    dataset.attrs["packing"] = _SYMMETRY_PACKING[key]
+                    dataset.attrs["num_orbitals"] = packed[1]
             else:
-                group.create_dataset(key, data=value)
+                # scalars like the names of the data fields or the restricted flag
+                group.attrs[key] = value
+
+    @classmethod
+    def from_hdf5(cls, h5py_data: str | Path | h5py.Group, *, lazy: bool = False) -> QCWavefunction:
+        """Constructs a schema object from an HDF5 object.
+
+        Args:
+            h5py_data: can be either the path to a file or an `h5py.Group`.
+            lazy: whether to defer reading the array datasets until their values are used. In this
+                case, the arrays are represented by stand-ins which re-open the HDF5 file whenever
+                their data is accessed (for example, via :func:`numpy.asarray` or by indexing, which
+                only reads the requested elements of unpacked datasets).
+
+        Returns:
+            An instance of the schema object.
+        """
+        if isinstance(h5py_data, h5py.Group):
+            return cls._from_hdf5_group(h5py_data, lazy=lazy)
+
+        with h5py.File(h5py_data, "r") as file:
+            return cls._from_hdf5_group(file, lazy=lazy)
 
     @classmethod
-    def _from_hdf5_group(cls, h5py_group: h5py.Group) -> QCWavefunction:
+    def _from_hdf5_group(cls, h5py_group: h5py.Group, *, lazy: bool = False) -> QCWavefunction:
         data = dict(h5py_group.attrs.items())
 
         for key, value in h5py_group.items():
@@ -228,7 +305,135 @@ class QCWavefunction(_QCBase):
                 else:
                     basis = h5py_group.attrs["basis"]
                 data["basis"] = basis
+            elif lazy and value.ndim > 0:
+                data[key] = _LazyHDF5Array(value)
             else:
-                data[key] = value[...]
+                data[key] = _read_dataset(value)
 
         return cls(**data)
+
+
+_SYMMETRY_PACKING = {
+    "scf_eri": "s8",
+    "scf_eri_mo_aa": "s8",
+    "scf_eri_mo_bb": "s8",
+    "scf_eri_mo_ab": "s4",
+    "scf_eri_mo_ba": "s4",
+}
+
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, (np.ndarray, _LazyHDF5Array))
+
+
+def _pack_symmetry(array: np.ndarray, packing: str) -> tuple[np.ndarray, int] | None:
+    """Packs flat two-body integrals in chemists' order into their symmetry-unique elements.
+
+    Returns:
+        The pair of packed integrals and number of orbitals, or ``None`` if the integrals do not
+        have the required symmetry.
+    """
+    num_orbitals = int(round(array.size**0.25))
+    if num_orbitals**4 != array.size:
+        return None
+    eri = array.reshape((num_orbitals,) * 4)
+
+    def symmetric(axes: tuple[int, ...]) -> bool:
+        return np.allclose(eri, eri.transpose(axes), rtol=0.0, atol=1e-12)
+
+    if not (symmetric((1, 0, 2, 3)) and symmetric((0, 1, 3, 2))):
+        return None
+    if packing == "s8" and not symmetric((2, 3, 0, 1)):
+        return None
+
+    rows, cols = np.tril_indices(num_orbitals)
+    pairs = eri[rows, cols][:, rows, cols]
+    if packing == "s8":
+        return pairs[np.tril_indices(len(rows))], num_orbitals
+    return pairs.ravel(), num_orbitals
+
+
+def _unpack_symmetry(packed: np.ndarray, packing: str, num_orbitals: int) -> np.ndarray:
+    """Reverts :func:`_pack_symmetry`, returning the flat two-body integrals."""
+    rows, cols = np.tril_indices(num_orbitals)
+    num_pairs = len(rows)
+    if packing == "s8":
+        pairs = np.zeros((num_pairs, num_pairs), dtype=packed.dtype)
+        pairs[np.tril_indices(num_pairs)] = packed
+        pairs = pairs + np.tril(pairs, -1).T
+    else:
+        pairs = packed.reshape((num_pairs, num_pairs))
+
+    pair_index = np.empty((num_orbitals, num_orbitals), dtype=int)
+    pair_index[rows, cols] = np.arange(num_pairs)
+    pair_index[cols, rows] = np.arange(num_pairs)
+    return pairs[pair_index[:, :, None, None], pair_index[None, None, :, :]].ravel()
+
+
+def _read_dataset(dataset: h5py.Dataset, selection: Any = ...) -> np.ndarray:
+    """Reads (a selection of) an HDF5 dataset, unpacking symmetry-packed integrals."""
+    packing = dataset.attrs.get("packing", None)
+    if packing is None:
+        return dataset[selection]
+    unpacked = _unpack_symmetry(dataset[...], packing, int(dataset.attrs["num_orbitals"]))
+    return unpacked[selection]
+
+
+class _LazyHDF5Array:
+    """A stand-in for an array dataset of an HDF5 file, which only gets read on access.
+
+    The HDF5 file is re-opened upon every access, such that this object remains valid after the
+    file from which it was created has been closed.
+    """
+
+    def __init__(self, dataset: h5py.Dataset) -> None:
+        self._filename = dataset.file.filename
+        self._name = dataset.name
+        self._dtype = dataset.dtype
+        if "packing" in dataset.attrs:
+            self._shape: tuple[int, ...] = (int(dataset.attrs["num_orbitals"]) ** 4,)
+        else:
+            self._shape = dataset.shape
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Returns the shape of the (unpacked) array."""
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Returns the data type of the array."""
+        return self._dtype
+
+    @property
+    def ndim(self) -> int:
+        """Returns the number of dimensions of the array."""
+        return len(self._shape)
+
+    @property
+    def size(self) -> int:
+        """Returns the number of elements of the array."""
+        return int(np.prod(self._shape))
+
+    def __len__(self) -> int:
+        return self._shape[0]
+
+    def __repr__(self) -> str:
+        return f"_LazyHDF5Array({self._filename!r}, {self._name!r}, shape={self._shape})"
+
+    def __getitem__(self, selection: Any) -> np.ndarray:
+        with h5py.File(self._filename, "r") as file:
+            return _read_dataset(file[self._name], selection)
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        if copy is False:
+            # NumPy requests a view here, but reading from the file always creates a new array
+            raise ValueError("A lazily loaded HDF5 dataset cannot be converted without a copy.")
+        array = self[...]
+        if dtype is not None:
+            array = array.astype(dtype, copy=False)
+        return array
+
+    def reshape(self, *shape: Any) -> np.ndarray:
+        """Reads the array and returns it in the requested shape."""
+        return np.asarray(self).reshape(*shape)
@@ -64,27 +64,41 @@ class WatsonHamiltonian:
     """The kinetic coefficients."""
 
     @staticmethod
-    def _iter_array(
+    def _array_entries(
         array: SparseArray | np.ndarray,
         *,
         kinetic: bool = False,
-    ) -> Generator[tuple[complex, tuple[int, ...]], None, None]:
+    ) -> tuple[np.ndarray, np.ndarray]:
         if isinstance(array, np.ndarray):
-            for index in np.ndindex(*array.shape):
-                value = array[index]
-                if value:
-                    yield value, tuple((-1) ** kinetic * (i + 1) for i in index)
+            nonzero = np.nonzero(array)
+            values = array[nonzero]
+            indices = np.stack(nonzero, axis=1) if nonzero else np.zeros((values.size, 0), int)
         elif isinstance(array, SparseArray):
             coo = COO(array)
-            for value, *index in zip(coo.data, *coo.coords):
-                yield value, tuple((-1) ** kinetic * (i + 1) for i in index)
+            values = coo.data
+            indices = coo.coords.T
+        else:
+            return np.zeros(0), np.zeros((0, 0), dtype=int)
+        return values, (-1) ** kinetic * (indices + 1)
+
+    def iter_arrays(self) -> Generator[tuple[np.ndarray, np.ndarray], None, None]:
+        """Iterates the coefficients of this Hamiltonian, one force constant order at a time.
+
+        This is the vectorized variant of iterating the Hamiltonian itself: for the quadratic,
+        cubic and quartic force constants and the kinetic coefficients (in this order), it yields
+        the array of the non-zero coefficients and the 2D array of their mode indices. Each row of
+        the latter holds the one-based mode indices of a single coefficient, which are negated for
+        the kinetic coefficients.
+
+        Yields:
+            Pairs of coefficient and index arrays.
+        """
+        yield self._array_entries(self.quadratic_force_constants)
+        yield self._array_entries(self.cubic_force_constants)
+        yield self._array_entries(self.quartic_force_constants)
+        yield self._array_entries(self.kinetic_coefficients, kinetic=True)
 
     def __iter__(self) -> Generator[tuple[complex, tuple[int, ...]], None, None]:
-        for value, index in self._iter_array(self.quadratic_force_constants):
-            yield value, index
-        for value, index in self._iter_array(self.cubic_force_constants):
-            yield value, index
-        for value, index in self._iter_array(self.quartic_force_constants):
-            yield value, index
-        for value, index in self._iter_array(self.kinetic_coefficients, kinetic=True):
-            yield value, index
+        for values, indices in self.iter_arrays():
+            for value, index in zip(values, indices.tolist()):
+                yield value, tuple(index)
@@ -16,12 +16,34 @@ from __future__ import annotations
 
 from collections import defaultdict
 
+import numpy as np
+
+import qiskit_nature.optionals as _optionals
 from qiskit_nature.second_q.hamiltonians import VibrationalEnergy
+from qiskit_nature.second_q.operators import VibrationalIntegrals
 from qiskit_nature.second_q.problems import VibrationalStructureProblem, VibrationalBasis
 from qiskit_nature.second_q.properties import OccupiedModals
 
 from .watson import WatsonHamiltonian
 
+if _optionals.HAS_SPARSE:
+    # pylint: disable=import-error
+    from sparse import COO, as_coo
+else:
+
+    def as_coo(*args):
+        """Empty as_coo function
+        Replacement if sparse.as_coo is not present.
+        """
+        del args
+
+    class COO:  # type: ignore
+        """Empty COO class
+        Replacement if sparse.COO is not present.
+        """
+
+        pass
+
 
 def watson_to_problem(
     watson: WatsonHamiltonian,
@@ -36,6 +58,11 @@ def watson_to_problem(
         For more details about this, please refer to the documentation of
         :meth:`.VibrationalBasis.map`.
 
+        Unless the ``map`` method is overwritten by the provided basis, the coefficients are mapped
+        all at once using array operations: the integrals of every mode are evaluated only once per
+        power and kind of term and the resulting tables are expanded into the sparse integral
+        tensors directly.
+
     Args:
         watson: the ``WatsonHamiltonian`` object from which to build the problem.
         basis: the ``VibrationalBasis`` into which to map the hamiltonian coefficients.
@@ -43,16 +70,46 @@ def watson_to_problem(
     Returns:
         A :class:`.VibrationalStructureProblem` instance.
     """
-    nbody: dict[tuple[int, ...], complex] = defaultdict(complex)
+    if type(basis).map is VibrationalBasis.map:
+        hamiltonian = VibrationalEnergy(_map_integrals(watson, basis))
+    else:
+        nbody: dict[tuple[int, ...], complex] = defaultdict(complex)
 
-    for coefficient, modes in watson:
-        for integral, modal_index in basis.map(coefficient, modes):
-            nbody[modal_index] += integral
+        for coefficient, modes in watson:
+            for integral, modal_index in basis.map(coefficient, modes):
+                nbody[modal_index] += integral
 
-    hamiltonian = VibrationalEnergy.from_raw_integrals(nbody)
+        hamiltonian = VibrationalEnergy.from_raw_integrals(nbody)
 
     problem = VibrationalStructureProblem(hamiltonian)
     problem.basis = basis
     problem.properties.occupied_modals = OccupiedModals(basis.num_modals)
 
     return problem
+
+
+def _map_integrals(watson: WatsonHamiltonian, basis: VibrationalBasis) -> VibrationalIntegrals:
+    """Maps all coefficients of a Watson Hamiltonian into the vibrational integrals at once."""
+    # pylint: disable=protected-access
+    coords: dict[int, list[np.ndarray]] = defaultdict(list)
+    data: dict[int, list[np.ndarray]] = defaultdict(list)
+    for coefficients, modes in watson.iter_arrays():
+        if coefficients.size == 0:
+            continue
+        for n_body, (n_body_coords, n_body_data) in basis._map_arrays(coefficients, modes).items():
+            coords[n_body].append(n_body_coords)
+            data[n_body].append(n_body_data)
+
+    tensors = {}
+    for n_body in range(1, max(coords, default=0) + 1):
+        if n_body not in coords:
+            tensors["_+-" * n_body] = as_coo({})
+            continue
+        n_body_coords = np.concatenate(coords[n_body], axis=1)
+        tensors["_+-" * n_body] = COO(
+            n_body_coords,
+            np.concatenate(data[n_body]),
+            shape=tuple(n_body_coords.max(axis=1) + 1),
+        )
+
+    return VibrationalIntegrals(tensors, validate=False)
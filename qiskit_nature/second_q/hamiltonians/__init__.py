@@ -19,6 +19,8 @@ Hamiltonians (:mod:`qiskit_nature.second_q.hamiltonians`)
 
    QuadraticHamiltonian
    ElectronicEnergy
+   CholeskyElectronicEnergy
+   DoubleFactorizedHamiltonian
    VibrationalEnergy
    FermiHubbardModel
    HeisenbergModel
@@ -38,6 +40,8 @@ Submodules
 from .hamiltonian import Hamiltonian
 from .quadratic_hamiltonian import QuadraticHamiltonian
 from .electronic_energy import ElectronicEnergy
+from .cholesky_electronic_energy import CholeskyElectronicEnergy
+from .double_factorized_hamiltonian import DoubleFactorizedHamiltonian
 from .vibrational_energy import VibrationalEnergy
 from .fermi_hubbard_model import FermiHubbardModel
 from .heisenberg_model import HeisenbergModel
@@ -48,6 +52,8 @@ __all__ = [
     "Hamiltonian",
     "QuadraticHamiltonian",
     "ElectronicEnergy",
+    "CholeskyElectronicEnergy",
+    "DoubleFactorizedHamiltonian",
     "VibrationalEnergy",
     "FermiHubbardModel",
     "HeisenbergModel",
@@ -0,0 +1,404 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The Cholesky-decomposed ElectronicEnergy Hamiltonian."""
+
+from __future__ import annotations
+
+from typing import MutableMapping
+
+import numpy as np
+
+from qiskit_nature.second_q.operators import ElectronicIntegrals, PolynomialTensor
+from qiskit_nature.second_q.operators.polynomial_tensor import SparseArray
+from qiskit_nature.second_q.operators.tensor_ordering import (
+    IndexType,
+    to_chemist_ordering,
+    to_physicist_ordering,
+)
+
+from .electronic_energy import ElectronicEnergy
+
+_CHOLESKY_BLOCK_SIZE = 64
+
+
+class CholeskyElectronicEnergy(ElectronicEnergy):
+    r"""The electronic energy Hamiltonian with factorized two-body integrals.
+
+    Rather than storing the full two-body integrals, this Hamiltonian stores the Cholesky vectors
+    (or, equivalently, density-fitting factors) :math:`L^Q_{pq}` which reproduce the two-body
+    integrals in chemists' index order:
+
+    .. math::
+        (pq|rs) \approx \sum_Q L^Q_{pq} L^Q_{rs} .
+
+    This reduces the memory requirements from :math:`\mathcal{O}(N^4)` to
+    :math:`\mathcal{O}(N^2 N_Q)` and allows evaluating the :meth:`coulomb`, :meth:`exchange` and
+    :meth:`fock` terms as :math:`\mathcal{O}(N^3 N_Q)` contractions. The
+    :class:`~qiskit_nature.second_q.transformers.BasisTransformer` and
+    :class:`~qiskit_nature.second_q.transformers.ActiveSpaceTransformer` transform the factors
+    directly. The full :attr:`electronic_integrals` are only constructed (and then cached) once
+    they are requested, for example by :meth:`second_q_op`.
+
+    .. code-block:: python
+
+        hamiltonian: ElectronicEnergy = ...
+
+        from qiskit_nature.second_q.hamiltonians import CholeskyElectronicEnergy
+
+        factorized = CholeskyElectronicEnergy.from_electronic_energy(hamiltonian, threshold=1e-8)
+        print(factorized.num_cholesky_vectors)
+
+    Attributes:
+        constants: A mapping of constant energy offsets, not mapped to the qubit operator.
+    """
+
+    def __init__(
+        self,
+        one_body: ElectronicIntegrals,
+        cholesky_alpha: np.ndarray,
+        cholesky_beta: np.ndarray | None = None,
+        *,
+        constants: MutableMapping[str, float] = None,
+    ) -> None:
+        r"""
+        Args:
+            one_body: the one-body integrals.
+            cholesky_alpha: the alpha-spin Cholesky vectors of shape ``(N, N, N_Q)``.
+            cholesky_beta: the beta-spin Cholesky vectors of shape ``(N, N, N_Q)``. These must share
+                the auxiliary index with the alpha-spin ones, such that the mixed-spin integrals are
+                given by :math:`(pq|rs)_{\beta\alpha} = \sum_Q L^{Q,\beta}_{pq} L^{Q,\alpha}_{rs}`.
+            constants: A mapping of constant energy offsets.
+
+        Raises:
+            ValueError: if the shapes of the Cholesky vectors do not match.
+        """
+        # pylint: disable=super-init-not-called
+        self._one_body = one_body
+        self._cholesky_alpha = np.asarray(cholesky_alpha)
+        self._cholesky_beta = None if cholesky_beta is None else np.asarray(cholesky_beta)
+        if (
+            self._cholesky_beta is not None
+            and self._cholesky_beta.shape != self._cholesky_alpha.shape
+        ):
+            raise ValueError(
+                f"The shape of the beta-spin Cholesky vectors, {self._cholesky_beta.shape}, does not "
+                f"match the one of the alpha-spin ones, {self._cholesky_alpha.shape}."
+            )
+        self._electronic_integrals: ElectronicIntegrals | None = None
+        self.constants = constants if constants is not None else {}
+
+    @classmethod
+    def from_electronic_energy(
+        cls, hamiltonian: ElectronicEnergy, *, threshold: float = 1e-8
+    ) -> CholeskyElectronicEnergy:
+        """Factorizes the two-body integrals of an existing hamiltonian.
+
+        This performs a pivoted (modified) Cholesky decomposition of the two-body integrals
+        reshaped into a :math:`N^2 \\times N^2` matrix. The decomposition terminates once the largest
+        remaining diagonal element drops below ``threshold``, which bounds the error of every
+        reconstructed integral.
+
+        Args:
+            hamiltonian: the hamiltonian to factorize.
+            threshold: the convergence threshold of the Cholesky decomposition.
+
+        Raises:
+            ValueError: if the hamiltonian contains spin-dependent two-body integrals.
+
+        Returns:
+            The factorized hamiltonian.
+        """
+        one_body, vectors = _factorize(hamiltonian.electronic_integrals, threshold)
+        return cls(one_body, vectors, constants=dict(hamiltonian.constants))
+
+    @classmethod
+    def from_raw_integrals(
+        cls,
+        h1_a: np.ndarray,
+        h2_aa: np.ndarray,
+        h1_b: np.ndarray | None = None,
+        h2_bb: np.ndarray | None = None,
+        h2_ba: np.ndarray | None = None,
+        *,
+        validate: bool = True,
+        auto_index_order: bool = True,
+        threshold: float = 1e-8,
+    ) -> CholeskyElectronicEnergy:
+        """Constructs a factorized hamiltonian instance from raw integrals.
+
+        This constructs an :class:`.ElectronicEnergy` via
+        :meth:`.ElectronicEnergy.from_raw_integrals` and factorizes it with
+        :meth:`from_electronic_energy`.
+
+        Args:
+            h1_a: the alpha-spin one-body coefficients.
+            h2_aa: the alpha-alpha-spin two-body coefficients.
+            h1_b: the beta-spin one-body coefficients.
+            h2_bb: the beta-beta-spin two-body coefficients.
+            h2_ba: the beta-alpha-spin two-body coefficients.
+            validate: whether or not to validate the coefficient matrices.
+            auto_index_order: whether or not to automatically convert the matrices to physicists'
+                order.
+            threshold: the convergence threshold of the Cholesky decomposition.
+
+        Returns:
+            The resulting ``CholeskyElectronicEnergy`` instance.
+        """
+        hamiltonian = ElectronicEnergy.from_raw_integrals(
+            h1_a,
+            h2_aa,
+            h1_b,
+            h2_bb,
+            h2_ba,
+            validate=validate,
+            auto_index_order=auto_index_order,
+        )
+        return cls.from_electronic_energy(hamiltonian, threshold=threshold)
+
+    @property
+    def one_body(self) -> ElectronicIntegrals:
+        """Returns the one-body integrals."""
+        return self._one_body
+
+    @one_body.setter
+    def one_body(self, one_body: ElectronicIntegrals) -> None:
+        self._one_body = one_body
+        self._electronic_integrals = None
+
+    @property
+    def cholesky_alpha(self) -> np.ndarray:
+        """Returns the alpha-spin Cholesky vectors of shape ``(N, N, N_Q)``."""
+        return self._cholesky_alpha
+
+    @cholesky_alpha.setter
+    def cholesky_alpha(self, cholesky_alpha: np.ndarray) -> None:
+        self._cholesky_alpha = np.asarray(cholesky_alpha)
+        self._electronic_integrals = None
+
+    @property
+    def cholesky_beta(self) -> np.ndarray | None:
+        """Returns the beta-spin Cholesky vectors of shape ``(N, N, N_Q)``, if any."""
+        return self._cholesky_beta
+
+    @cholesky_beta.setter
+    def cholesky_beta(self, cholesky_beta: np.ndarray | None) -> None:
+        self._cholesky_beta = None if cholesky_beta is None else np.asarray(cholesky_beta)
+        self._electronic_integrals = None
+
+    @property
+    def num_cholesky_vectors(self) -> int:
+        """Returns the number of Cholesky vectors, :math:`N_Q`."""
+        return self._cholesky_alpha.shape[2]
+
+    @property
+    def register_length(self) -> int | None:
+        return self._cholesky_alpha.shape[0]
+
+    @property
+    def electronic_integrals(self) -> ElectronicIntegrals:  # type: ignore[override]
+        """The full electronic integrals, constructed lazily from the Cholesky vectors.
+
+        Constructing these requires :math:`\\mathcal{O}(N^4)` memory. The result is cached until the
+        one-body integrals or Cholesky vectors are replaced.
+
+        Assigning new integrals factorizes their two-body part anew, using
+        :func:`modified_cholesky` with its default threshold. For control over the threshold, use
+        :meth:`from_electronic_energy` instead. The assigned integrals are cached as they are.
+        """
+        if self._electronic_integrals is None:
+            cholesky_alpha = self._cholesky_alpha
+            alpha = self._one_body.alpha + PolynomialTensor(
+                {"++--": _two_body_from_cholesky(cholesky_alpha, cholesky_alpha)}
+            )
+            if self._cholesky_beta is None and self._one_body.beta.is_empty():
+                self._electronic_integrals = ElectronicIntegrals(alpha)
+            else:
+                cholesky_beta = self._cholesky_beta_or_alpha
+                one_body_beta = (
+                    self._one_body.alpha if self._one_body.beta.is_empty() else self._one_body.beta
+                )
+                beta = one_body_beta + PolynomialTensor(
+                    {"++--": _two_body_from_cholesky(cholesky_beta, cholesky_beta)}
+                )
+                beta_alpha = PolynomialTensor(
+                    {"++--": _two_body_from_cholesky(cholesky_beta, cholesky_alpha)}
+                )
+                self._electronic_integrals = ElectronicIntegrals(alpha, beta, beta_alpha)
+        return self._electronic_integrals
+
+    @electronic_integrals.setter
+    def electronic_integrals(self, electronic_integrals: ElectronicIntegrals) -> None:
+        self._one_body, self._cholesky_alpha = _factorize(electronic_integrals)
+        self._cholesky_beta = None
+        self._electronic_integrals = electronic_integrals
+
+    @property
+    def _cholesky_beta_or_alpha(self) -> np.ndarray:
+        return self._cholesky_alpha if self._cholesky_beta is None else self._cholesky_beta
+
+    def coulomb(self, density: ElectronicIntegrals) -> ElectronicIntegrals:
+        r"""Computes the Coulomb term for the given reduced density matrix.
+
+        .. math::
+            J_{qr} = \sum_Q L^Q_{qr} \sum_{ps} L^Q_{ps} D_{ps}
+
+        Args:
+            density: the reduced density matrix.
+
+        Returns:
+            The Coulomb operator coefficients.
+        """
+        density_a = _dense(density.alpha["+-"])
+        density_b = None if density.beta.is_empty() else _dense(density.beta["+-"])
+
+        if self._cholesky_beta is None and self._one_body.beta.is_empty():
+            coulomb_a = 2.0 * _coulomb(self._cholesky_alpha, self._cholesky_alpha, density_a)
+            coulomb_b = None
+            if density_b is not None:
+                coulomb_b = 2.0 * _coulomb(self._cholesky_alpha, self._cholesky_alpha, density_b)
+            return ElectronicIntegrals.from_raw_integrals(coulomb_a, h1_b=coulomb_b, validate=False)
+
+        if density_b is None:
+            density_b = density_a
+        cholesky_a = self._cholesky_alpha
+        cholesky_b = self._cholesky_beta_or_alpha
+        coulomb_a = _coulomb(cholesky_a, cholesky_a, density_a) + _coulomb(
+            cholesky_a, cholesky_b, density_b
+        )
+        coulomb_b = _coulomb(cholesky_b, cholesky_b, density_b) + _coulomb(
+            cholesky_b, cholesky_a.transpose(1, 0, 2), density_a
+        )
+        return ElectronicIntegrals.from_raw_integrals(coulomb_a, h1_b=coulomb_b, validate=False)
+
+    def exchange(self, density: ElectronicIntegrals) -> ElectronicIntegrals:
+        r"""Computes the Exchange term for the given reduced density matrix.
+
+        .. math::
+            K_{pr} = \sum_Q \sum_{qs} L^Q_{ps} D_{qs} L^Q_{qr}
+
+        Args:
+            density: the reduced density matrix.
+
+        Returns:
+            The Exchange operator coefficients.
+        """
+        exchange_a = _exchange(self._cholesky_alpha, _dense(density.alpha["+-"]))
+        exchange_b = None
+        if not density.beta.is_empty():
+            exchange_b = _exchange(self._cholesky_beta_or_alpha, _dense(density.beta["+-"]))
+        elif self._cholesky_beta is not None:
+            exchange_b = _exchange(self._cholesky_beta, _dense(density.alpha["+-"]))
+        return ElectronicIntegrals.from_raw_integrals(exchange_a, h1_b=exchange_b, validate=False)
+
+    def fock(self, density: ElectronicIntegrals) -> ElectronicIntegrals:
+        r"""Computes the Fock operator for the given reduced density matrix.
+
+        .. math::
+            F_{pq} = h_{pq} + J_{pq} - K_{pq}
+
+        where :math:`J` and :math:`K` are the :meth:`coulomb` and :meth:`exchange` terms,
+        respectively. Contrary to the base class, this never constructs the full two-body integrals.
+
+        Args:
+            density: the reduced density matrix.
+
+        Returns:
+            The Fock operator coefficients.
+        """
+        return self._one_body + self.coulomb(density) - self.exchange(density)
+
+
+def modified_cholesky(matrix: np.ndarray, *, threshold: float = 1e-8) -> np.ndarray:
+    """Computes the pivoted (modified) Cholesky decomposition of a positive semi-definite matrix.
+
+    Args:
+        matrix: the symmetric, positive semi-definite matrix to decompose.
+        threshold: the decomposition terminates once the largest remaining diagonal element of the
+            residual matrix drops below this value.
+
+    Returns:
+        The Cholesky vectors as the columns of an array ``L`` such that ``matrix ≈ L @ L.T``.
+    """
+    dim = matrix.shape[0]
+    diagonal = np.array(np.diagonal(matrix), dtype=float)
+    # the number of vectors is not known in advance, so the buffer grows in blocks rather than
+    # reserving the worst-case (dim, dim) upfront
+    vectors = np.zeros((dim, min(dim, _CHOLESKY_BLOCK_SIZE)))
+    num_vectors = 0
+    while num_vectors < dim:
+        pivot = int(np.argmax(diagonal))
+        if diagonal[pivot] <= threshold:
+            break
+        if num_vectors == vectors.shape[1]:
+            vectors = np.hstack(
+                (vectors, np.zeros((dim, min(dim - num_vectors, _CHOLESKY_BLOCK_SIZE))))
+            )
+        residual = matrix[:, pivot] - vectors[:, :num_vectors] @ vectors[pivot, :num_vectors]
+        vectors[:, num_vectors] = residual / np.sqrt(diagonal[pivot])
+        diagonal -= vectors[:, num_vectors] ** 2
+        num_vectors += 1
+    # copy the used columns such that the unused part of the buffer can be released
+    return np.ascontiguousarray(vectors[:, :num_vectors])
+
+
+def _factorize(
+    integrals: ElectronicIntegrals, threshold: float = 1e-8
+) -> tuple[ElectronicIntegrals, np.ndarray]:
+    """Splits integrals into their one-body part and the Cholesky vectors of their two-body part.
+
+    Raises:
+        ValueError: if the integrals contain spin-dependent two-body terms.
+    """
+    if "++--" in integrals.beta or not integrals.beta_alpha.is_empty():
+        raise ValueError(
+            "Only hamiltonians with spin-independent two-body integrals can be factorized."
+        )
+
+    num_orbitals = integrals.register_length
+    if "++--" in integrals.alpha:
+        two_body = integrals.alpha["++--"]
+        if isinstance(two_body, SparseArray):
+            two_body = two_body.todense()
+        chem = to_chemist_ordering(np.asarray(two_body), index_order=IndexType.PHYSICIST)
+        vectors = modified_cholesky(
+            chem.reshape((num_orbitals**2, num_orbitals**2)), threshold=threshold
+        )
+    else:
+        vectors = np.zeros((num_orbitals**2, 0))
+
+    return integrals.one_body, vectors.reshape((num_orbitals, num_orbitals, -1))
+
+
+def _dense(array: np.ndarray | SparseArray) -> np.ndarray:
+    if isinstance(array, SparseArray):
+        return array.todense()
+    return np.asarray(array)
+
+
+def _two_body_from_cholesky(cholesky_left: np.ndarray, cholesky_right: np.ndarray) -> np.ndarray:
+    """Reconstructs the physicist-ordered two-body integrals from two sets of Cholesky vectors."""
+    chem = np.einsum("pqQ,rsQ->pqrs", cholesky_left, cholesky_right, optimize=True)
+    return to_physicist_ordering(chem, index_order=IndexType.CHEMIST)
+
+
+def _coulomb(cholesky_out: np.ndarray, cholesky_in: np.ndarray, density: np.ndarray) -> np.ndarray:
+    """Computes sum_Q L_out[q, r, Q] sum_ps L_in[p, s, Q] D[p, s]."""
+    return np.einsum(
+        "qrQ,Q->qr", cholesky_out, np.einsum("psQ,ps->Q", cholesky_in, density, optimize=True)
+    )
+
+
+def _exchange(cholesky: np.ndarray, density: np.ndarray) -> np.ndarray:
+    """Computes sum_Q sum_qs L[p, s, Q] D[q, s] L[q, r, Q]."""
+    half = np.einsum("psQ,qs->pqQ", cholesky, density, optimize=True)
+    return np.einsum("pqQ,qrQ->pr", half, cholesky, optimize=True)
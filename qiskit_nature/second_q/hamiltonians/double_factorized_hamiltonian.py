@@ -0,0 +1,328 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The double-factorized electronic energy Hamiltonian."""
+
+from __future__ import annotations
+
+from copy import copy
+from typing import MutableMapping, Sequence
+
+import numpy as np
+
+import qiskit_nature  # pylint: disable=unused-import
+from qiskit_nature.second_q.circuit.library import SlaterDeterminant
+from qiskit_nature.second_q.mappers import QubitConverter, QubitMapper
+from qiskit_nature.second_q.operators import ElectronicIntegrals, FermionicOp
+from qiskit_nature.second_q.operators.polynomial_tensor import SparseArray
+from qiskit_nature.second_q.operators.tensor_ordering import (
+    IndexType,
+    to_chemist_ordering,
+    to_physicist_ordering,
+)
+
+from .cholesky_electronic_energy import CholeskyElectronicEnergy
+from .electronic_energy import ElectronicEnergy
+from .hamiltonian import Hamiltonian
+from .quadratic_hamiltonian import QuadraticHamiltonian
+
+
+class DoubleFactorizedHamiltonian(Hamiltonian):
+    r"""The double-factorized (low-rank) form of the electronic energy Hamiltonian.
+
+    Writing the two-body integrals in chemists' index order as a :math:`N^2 \times N^2` matrix and
+    diagonalizing it yields :math:`(pq|rs) = \sum_t \lambda_t M^t_{pq} M^t_{rs}`. Each symmetric
+    matrix :math:`M^t` defines a one-body operator which, in turn, becomes diagonal after an orbital
+    rotation :math:`M^t = U^t \text{diag}(\varepsilon^t) U^{t\dagger}`. Altogether, the Hamiltonian
+    is rewritten as
+
+    .. math::
+        \sum_{pq} \tilde{h}_{pq} E_{pq}
+        + \frac12 \sum_t \lambda_t \left(\sum_{pq} M^t_{pq} E_{pq}\right)^2
+        = \sum_{pq} \tilde{h}_{pq} E_{pq}
+        + \frac12 \sum_t \sum_{kl} Z^t_{kl} n^t_k n^t_l ,
+
+    where :math:`E_{pq}` is the spin-summed excitation operator,
+    :math:`\tilde{h}_{pq} = h_{pq} - \frac12 \sum_{tr} \lambda_t M^t_{pr} M^t_{rq}` are the modified
+    one-body terms, :math:`n^t_k` are the number operators in the rotated basis of factor :math:`t`
+    and :math:`Z^t = \lambda_t \varepsilon^t \varepsilon^{t\top}`.
+
+    Each factor's basis change is obtained from
+    :meth:`~qiskit_nature.second_q.hamiltonians.QuadraticHamiltonian.diagonalizing_bogoliubov_transform`
+    of its :meth:`one_body_operators`, such that the :attr:`orbital_rotations` can directly be
+    passed to the :class:`~qiskit_nature.second_q.circuit.library.BogoliubovTransform` circuit.
+    Likewise, :meth:`slater_determinant` prepares the Givens-rotation circuit of a Slater
+    determinant occupying a chosen set of orbitals in the rotated basis of a factor.
+
+    .. code-block:: python
+
+        hamiltonian: ElectronicEnergy = ...
+
+        from qiskit_nature.second_q.hamiltonians import DoubleFactorizedHamiltonian
+
+        factorized = DoubleFactorizedHamiltonian.from_electronic_energy(
+            hamiltonian, threshold=1e-6
+        )
+        for rotation, diag_coulomb in zip(
+            factorized.orbital_rotations, factorized.diag_coulomb_mats
+        ):
+            ...
+    """
+
+    def __init__(
+        self,
+        one_body_tensor: np.ndarray,
+        eigenvalues: np.ndarray,
+        one_body_squares: np.ndarray,
+        *,
+        one_body_tensor_b: np.ndarray | None = None,
+        constants: MutableMapping[str, float] = None,
+    ) -> None:
+        r"""
+        Args:
+            one_body_tensor: the modified (alpha-spin) one-body terms :math:`\tilde{h}`.
+            eigenvalues: the eigenvalues :math:`\lambda_t` of the two-body matrix.
+            one_body_squares: the matrices :math:`M^t` of shape ``(T, N, N)``.
+            one_body_tensor_b: the modified beta-spin one-body terms. If ``None``, the alpha-spin
+                ones are used.
+            constants: A mapping of constant energy offsets.
+
+        Raises:
+            ValueError: if the number of eigenvalues does not match the number of factors.
+        """
+        if len(eigenvalues) != len(one_body_squares):
+            raise ValueError(
+                f"The number of eigenvalues, {len(eigenvalues)}, does not match the number of "
+                f"factors, {len(one_body_squares)}."
+            )
+        self.one_body_tensor = np.asarray(one_body_tensor)
+        self.one_body_tensor_b = (
+            None if one_body_tensor_b is None else np.asarray(one_body_tensor_b)
+        )
+        self.eigenvalues = np.asarray(eigenvalues)
+        self.one_body_squares = np.asarray(one_body_squares)
+        self.constants = constants if constants is not None else {}
+        self._diagonalized: tuple[np.ndarray, np.ndarray] | None = None
+
+    @classmethod
+    def from_electronic_energy(
+        cls,
+        hamiltonian: ElectronicEnergy,
+        *,
+        threshold: float = 1e-8,
+        max_factors: int | None = None,
+    ) -> DoubleFactorizedHamiltonian:
+        """Computes the double factorization of an existing hamiltonian.
+
+        The two-body integrals get reshaped into a :math:`N^2 \\times N^2` matrix and
+        eigendecomposed. For a
+        :class:`~qiskit_nature.second_q.hamiltonians.CholeskyElectronicEnergy`, the same
+        decomposition is obtained from a singular value decomposition of its Cholesky vectors
+        without ever constructing the full two-body integrals.
+
+        Args:
+            hamiltonian: the hamiltonian to factorize.
+            threshold: all factors whose eigenvalue is smaller than this (in absolute value) get
+                discarded.
+            max_factors: the maximum number of factors to keep. If ``None``, this is unlimited.
+
+        Raises:
+            ValueError: if the hamiltonian contains spin-dependent two-body integrals.
+
+        Returns:
+            The double-factorized hamiltonian.
+        """
+        if isinstance(hamiltonian, CholeskyElectronicEnergy):
+            one_body = hamiltonian.one_body
+            if hamiltonian.cholesky_beta is not None:
+                raise ValueError(
+                    "Only hamiltonians with spin-independent two-body integrals can be factorized."
+                )
+            num_orbitals = hamiltonian.register_length
+            vectors, singular_values, _ = np.linalg.svd(
+                hamiltonian.cholesky_alpha.reshape((num_orbitals**2, -1)), full_matrices=False
+            )
+            eigenvalues = singular_values**2
+        else:
+            integrals = hamiltonian.electronic_integrals
+            one_body = integrals.one_body
+            num_orbitals = integrals.register_length
+            two_body = _spin_independent_two_body(integrals)
+            if two_body is None:
+                eigenvalues = np.zeros(0)
+                vectors = np.zeros((num_orbitals**2, 0))
+            else:
+                eigenvalues, vectors = np.linalg.eigh(
+                    two_body.reshape((num_orbitals**2, num_orbitals**2))
+                )
+
+        order = np.argsort(-np.abs(eigenvalues), kind="stable")
+        order = order[np.abs(eigenvalues[order]) > threshold][:max_factors]
+        eigenvalues = eigenvalues[order]
+        one_body_squares = vectors[:, order].T.reshape((-1, num_orbitals, num_orbitals))
+        one_body_squares = 0.5 * (one_body_squares + one_body_squares.transpose(0, 2, 1))
+
+        # the normal ordering of the two-body terms yields the correction -1/2 sum_r (pr|rq)
+        correction = -0.5 * np.einsum(
+            "t,tpr,trq->pq", eigenvalues, one_body_squares, one_body_squares, optimize=True
+        )
+        h_1_a = _dense(one_body.alpha.get("+-", np.zeros((num_orbitals, num_orbitals))))
+        h_1_b = None
+        if "+-" in one_body.beta:
+            h_1_b = _dense(one_body.beta["+-"]) + correction
+
+        return cls(
+            h_1_a + correction,
+            eigenvalues,
+            one_body_squares,
+            one_body_tensor_b=h_1_b,
+            constants=dict(hamiltonian.constants),
+        )
+
+    @property
+    def num_factors(self) -> int:
+        """Returns the number of retained factors."""
+        return len(self.eigenvalues)
+
+    @property
+    def register_length(self) -> int:
+        return self.one_body_tensor.shape[0]
+
+    def one_body_operators(self) -> list[QuadraticHamiltonian]:
+        r"""Returns the one-body operators :math:`\sum_{pq} M^t_{pq} a^\dagger_p a_q` of all factors.
+
+        Returns:
+            A list of ``QuadraticHamiltonian`` instances.
+        """
+        return [QuadraticHamiltonian(hermitian_part=mat) for mat in self.one_body_squares]
+
+    @property
+    def orbital_rotations(self) -> np.ndarray:
+        r"""Returns the orbital rotations diagonalizing the factors.
+
+        This is an array of shape ``(T, N, N)`` holding the transformation matrices :math:`W^t`
+        returned by :meth:`.QuadraticHamiltonian.diagonalizing_bogoliubov_transform`.
+        """
+        return self._diagonalize()[0]
+
+    @property
+    def diag_coulomb_mats(self) -> np.ndarray:
+        r"""Returns the matrices :math:`Z^t = \lambda_t \varepsilon^t \varepsilon^{t\top}`.
+
+        This is an array of shape ``(T, N, N)`` holding the coefficients of the products of number
+        operators in the rotated basis of each factor.
+        """
+        energies = self._diagonalize()[1]
+        return self.eigenvalues[:, np.newaxis, np.newaxis] * np.einsum(
+            "tk,tl->tkl", energies, energies
+        )
+
+    def slater_determinant(
+        self,
+        factor: int,
+        occupied_orbitals: Sequence[int],
+        qubit_converter: QubitConverter | QubitMapper | None = None,
+    ) -> SlaterDeterminant:
+        r"""Returns the circuit preparing a Slater determinant in the rotated basis of a factor.
+
+        The prepared state occupies the ``occupied_orbitals`` of the basis in which the one-body
+        operator of ``factor`` is diagonal. It is therefore an eigenstate of that operator, with an
+        eigenvalue given by the sum of the corresponding :math:`\varepsilon^t_k`.
+
+        Args:
+            factor: the index of the factor.
+            occupied_orbitals: the indices of the occupied orbitals in the rotated basis.
+            qubit_converter: the ``QubitConverter`` or ``QubitMapper`` passed on to the
+                :class:`~qiskit_nature.second_q.circuit.library.SlaterDeterminant`.
+
+        Returns:
+            The ``SlaterDeterminant`` circuit.
+        """
+        rotation = self.orbital_rotations[factor]
+        return SlaterDeterminant(rotation[list(occupied_orbitals)], qubit_converter=qubit_converter)
+
+    def _diagonalize(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._diagonalized is None:
+            num_orbitals = self.register_length
+            rotations = np.zeros((self.num_factors, num_orbitals, num_orbitals))
+            energies = np.zeros((self.num_factors, num_orbitals))
+            for idx, operator in enumerate(self.one_body_operators()):
+                rotations[idx], energies[idx], _ = operator.diagonalizing_bogoliubov_transform()
+            self._diagonalized = (rotations, energies)
+        return self._diagonalized
+
+    def to_electronic_energy(self) -> ElectronicEnergy:
+        """Reconstructs an :class:`ElectronicEnergy` from the (truncated) factors.
+
+        Returns:
+            The ``ElectronicEnergy`` represented by this double factorization.
+        """
+        two_body = np.einsum(
+            "t,tpq,trs->pqrs",
+            self.eigenvalues,
+            self.one_body_squares,
+            self.one_body_squares,
+            optimize=True,
+        )
+        correction = 0.5 * np.einsum("prrq->pq", two_body)
+        h_1_b = None if self.one_body_tensor_b is None else self.one_body_tensor_b + correction
+        hamiltonian = ElectronicEnergy.from_raw_integrals(
+            self.one_body_tensor + correction,
+            to_physicist_ordering(two_body, index_order=IndexType.CHEMIST),
+            h1_b=h_1_b,
+            auto_index_order=False,
+        )
+        hamiltonian.constants = copy(self.constants)
+        return hamiltonian
+
+    def second_q_op(self) -> FermionicOp:
+        """Returns the second quantized operator constructed from the factors.
+
+        Returns:
+            A ``FermionicOp`` instance.
+        """
+        return self.to_electronic_energy().second_q_op()
+
+    def interpret(
+        self, result: "qiskit_nature.second_q.problems.EigenstateResult"  # type: ignore[name-defined]
+    ) -> None:
+        """Interprets an :class:`~qiskit_nature.second_q.problems.EigenstateResult`.
+
+        In particular, this adds the constant energy shifts stored in this hamiltonian to the result
+        object.
+
+        Args:
+            result: the result to add meaning to.
+        """
+        result.extracted_transformer_energies = copy(self.constants)
+        result.nuclear_repulsion_energy = result.extracted_transformer_energies.pop(
+            "nuclear_repulsion_energy", None
+        )
+
+
+def _dense(array: np.ndarray | SparseArray) -> np.ndarray:
+    if isinstance(array, SparseArray):
+        return array.todense()
+    return np.asarray(array)
+
+
+def _spin_independent_two_body(integrals: ElectronicIntegrals) -> np.ndarray | None:
+    """Returns the chemist-ordered two-body integrals, ensuring that they are spin-independent."""
+    if "++--" not in integrals.alpha:
+        return None
+    two_body = _dense(integrals.alpha["++--"])
+    for other in (integrals.beta, integrals.beta_alpha):
+        if "++--" in other and not np.allclose(_dense(other["++--"]), two_body):
+            raise ValueError(
+                "Only hamiltonians with spin-independent two-body integrals can be factorized."
+            )
+    return to_chemist_ordering(two_body, index_order=IndexType.PHYSICIST)
@@ -20,7 +20,8 @@ from typing import MutableMapping
 import numpy as np
 
 import qiskit_nature  # pylint: disable=unused-import
-from qiskit_nature.second_q.operators import ElectronicIntegrals, FermionicOp, PolynomialTensor
+from qiskit_nature.second_q.operators import ElectronicIntegrals, FermionicOp
+from qiskit_nature.second_q.operators.polynomial_tensor import ARRAY_TYPE, SparseArray
 
 from .hamiltonian import Hamiltonian
 
@@ -219,25 +220,7 @@ class ElectronicEnergy(Hamiltonian):
         Returns:
             The Coulomb operator coefficients.
         """
-        coulomb = ElectronicIntegrals.einsum(
-            {"pqrs,ps->qr": ("++--", "+-", "+-")}, self.electronic_integrals, density
-        )
-
-        if self.electronic_integrals.beta_alpha.is_empty():
-            coulomb *= 2.0  # type: ignore
-        else:
-            coulomb.alpha += PolynomialTensor.einsum(
-                {"pqrs,ps->qr": ("++--", "+-", "+-")},
-                self.electronic_integrals.beta_alpha,
-                density.beta,
-            )
-            coulomb.beta += PolynomialTensor.einsum(
-                {"rspq,ps->rq": ("++--", "+-", "+-")},
-                self.electronic_integrals.beta_alpha,
-                density.alpha,
-            )
-
-        return coulomb
+        return self._coulomb_exchange(density, exchange=False)[0]
 
     def exchange(self, density: ElectronicIntegrals) -> ElectronicIntegrals:
         r"""Computes the Exchange term for the given reduced density matrix.
@@ -251,10 +234,7 @@ class ElectronicEnergy(Hamiltonian):
         Returns:
             The Exchange operator coefficients.
         """
-        exchange = ElectronicIntegrals.einsum(
-            {"pqrs,qs->pr": ("++--", "+-", "+-")}, self.electronic_integrals, density
-        )
-        return exchange
+        return self._coulomb_exchange(density, coulomb=False)[1]
 
     def fock(self, density: ElectronicIntegrals) -> ElectronicIntegrals:
         r"""Computes the Fock operator for the given reduced density matrix.
@@ -263,7 +243,8 @@ class ElectronicEnergy(Hamiltonian):
             F_{pq} = h_{pq} + J_{pq} - K_{pq}
 
         where :math:`J` and :math:`K` are the :meth:`coulomb` and :meth:`exchange` terms,
-        respectively.
+        respectively. Both terms are built together, such that every distinct contraction of the
+        two-body integrals is evaluated only once.
 
         Args:
             density: the reduced density matrix.
@@ -271,4 +252,107 @@ class ElectronicEnergy(Hamiltonian):
         Returns:
             The Fock operator coefficients.
         """
-        return self.electronic_integrals.one_body + self.coulomb(density) - self.exchange(density)
+        coulomb, exchange = self._coulomb_exchange(density)
+        return self.electronic_integrals.one_body + coulomb - exchange
+
+    def _coulomb_exchange(
+        self, density: ElectronicIntegrals, *, coulomb: bool = True, exchange: bool = True
+    ) -> tuple[ElectronicIntegrals | None, ElectronicIntegrals | None]:
+        """Builds the Coulomb and/or Exchange terms for the given reduced density matrix.
+
+        Empty beta-spin integrals or densities are aliased to their alpha-spin counterparts (rather
+        than being filled with copies), such that the restricted-spin case contracts every distinct
+        pair of tensor and density only once. Furthermore, all densities contracted with the same
+        tensor along the same axes are stacked and handled in a single pass over that tensor.
+        """
+        integrals = self.electronic_integrals
+        tensor_aa = integrals.alpha.get("++--", None)
+        if tensor_aa is None or "+-" not in density.alpha:
+            empty = ElectronicIntegrals()
+            return (empty if coulomb else None, empty if exchange else None)
+
+        tensor_bb = integrals.beta.get("++--", tensor_aa)
+        tensor_ba = integrals.beta_alpha.get("++--", None)
+        density_a = _dense(density.alpha["+-"])
+        # a missing beta-spin density equals the alpha-spin one (as for ElectronicIntegrals). Note,
+        # that this includes the mixed-spin term g_ba D_a in the alpha-spin Coulomb operator of an
+        # unrestricted-spin hamiltonian, which was previously dropped for alpha-only densities.
+        density_b = density_a if "+-" not in density.beta else _dense(density.beta["+-"])
+        with_beta = not (
+            integrals.beta.is_empty() and density.beta.is_empty() and tensor_ba is None
+        )
+
+        contractions = _FusedContractions()
+        # J_qr = sum g_pqrs D_ps and K_pr = sum g_pqrs D_qs
+        coulomb_axes, exchange_axes = (0, 3), (1, 3)
+        coulomb_terms: tuple[list, list] = ([], [])
+        exchange_terms: tuple[list, list] = ([], [])
+        if coulomb:
+            if tensor_ba is None:
+                coulomb_terms[0].append((2.0, tensor_aa, coulomb_axes, density_a))
+                coulomb_terms[1].append((2.0, tensor_bb, coulomb_axes, density_b))
+            else:
+                coulomb_terms[0].append((1.0, tensor_aa, coulomb_axes, density_a))
+                coulomb_terms[0].append((1.0, tensor_ba, coulomb_axes, density_b))
+                coulomb_terms[1].append((1.0, tensor_bb, coulomb_axes, density_b))
+                # J^beta_rq = sum g^{beta alpha}_rspq D^alpha_ps
+                coulomb_terms[1].append((1.0, tensor_ba, (2, 1), density_a))
+        if exchange:
+            exchange_terms[0].append((1.0, tensor_aa, exchange_axes, density_a))
+            exchange_terms[1].append((1.0, tensor_bb, exchange_axes, density_b))
+
+        for terms in coulomb_terms + exchange_terms:
+            for _, tensor, axes, dens in terms:
+                contractions.request(tensor, axes, dens)
+        contractions.evaluate()
+
+        def assemble(terms: tuple[list, list]) -> ElectronicIntegrals:
+            alpha, beta = (
+                sum(factor * contractions.result(*term) for factor, *term in spin_terms)
+                for spin_terms in terms
+            )
+            return ElectronicIntegrals.from_raw_integrals(
+                alpha, h1_b=beta if with_beta else None, validate=False
+            )
+
+        return (
+            assemble(coulomb_terms) if coulomb else None,
+            assemble(exchange_terms) if exchange else None,
+        )
+
+
+class _FusedContractions:
+    """Evaluates contractions of two-body tensors with one-body densities in fused batches.
+
+    Requests are de-duplicated by the identity of the tensor and density. All densities requested
+    for the same tensor and axes are stacked and contracted in a single ``tensordot`` call.
+    """
+
+    def __init__(self) -> None:
+        self._requests: dict[
+            tuple[int, tuple[int, int]], tuple[ARRAY_TYPE, dict[int, np.ndarray]]
+        ] = {}
+        self._results: dict[tuple[int, tuple[int, int], int], np.ndarray] = {}
+
+    def request(self, tensor: ARRAY_TYPE, axes: tuple[int, int], density: np.ndarray) -> None:
+        """Registers the contraction of ``axes`` of ``tensor`` with ``density``."""
+        _, densities = self._requests.setdefault((id(tensor), axes), (tensor, {}))
+        densities[id(density)] = density
+
+    def evaluate(self) -> None:
+        """Evaluates all registered contractions."""
+        for (tensor_id, axes), (tensor, densities) in self._requests.items():
+            stacked = np.stack(list(densities.values()), axis=-1)
+            contracted = np.asarray(np.tensordot(tensor, stacked, axes=(axes, (0, 1))))
+            for idx, density_id in enumerate(densities):
+                self._results[(tensor_id, axes, density_id)] = contracted[..., idx]
+
+    def result(self, tensor: ARRAY_TYPE, axes: tuple[int, int], density: np.ndarray) -> np.ndarray:
+        """Returns the result of an evaluated contraction."""
+        return self._results[(id(tensor), axes, id(density))]
+
+
+def _dense(array: ARRAY_TYPE) -> np.ndarray:
+    if isinstance(array, SparseArray):
+        return array.todense()
+    return np.asarray(array)
@@ -36,7 +36,10 @@ FermionicOp Mappers
    BravyiKitaevMapper
    BravyiKitaevSuperFastMapper
    JordanWignerMapper
+   LinearEncodingMapper
+   ModeReorderingMapper
    ParityMapper
+   TernaryTreeMapper
 
 
 VibrationalOp Mappers
@@ -75,6 +78,9 @@ from .bksf import BravyiKitaevSuperFastMapper
 from .bravyi_kitaev_mapper import BravyiKitaevMapper
 from .jordan_wigner_mapper import JordanWignerMapper
 from .parity_mapper import ParityMapper
+from .linear_encoding_mapper import LinearEncodingMapper
+from .mode_reordering_mapper import ModeReorderingMapper
+from .ternary_tree_mapper import TernaryTreeMapper
 from .linear_mapper import LinearMapper
 from .logarithmic_mapper import LogarithmicMapper
 from .direct_mapper import DirectMapper
@@ -89,7 +95,10 @@ __all__ = [
     "BravyiKitaevSuperFastMapper",
     "DirectMapper",
     "JordanWignerMapper",
+    "LinearEncodingMapper",
+    "ModeReorderingMapper",
     "ParityMapper",
+    "TernaryTreeMapper",
     "LinearMapper",
     "LogarithmicMapper",
     "QubitConverter",
@@ -18,12 +18,45 @@ from functools import lru_cache
 
 import numpy as np
 
+from qiskit.circuit import ParameterExpression
 from qiskit.opflow import PauliSumOp
-from qiskit.quantum_info.operators import Pauli
+from qiskit.quantum_info.operators import Pauli, PauliList, SparsePauliOp
 
 from qiskit_nature.second_q.operators import VibrationalOp
 from .vibrational_mapper import VibrationalMapper
 
+# The local operator codes which can result from applying a sequence of creation and annihilation
+# operators on a single modal (i.e. a single qubit):
+#   0: the identity (no operator applied yet)
+#   1: the creation operator, ``|1><0| = 0.5 * (X - 1j * Y)``
+#   2: the annihilation operator, ``|0><1| = 0.5 * (X + 1j * Y)``
+#   3: the occupation number operator, ``|1><1| = 0.5 * (I - Z)``
+#   4: the vacancy operator, ``|0><0| = 0.5 * (I + Z)``
+#   5: the null operator (e.g. a creation operator applied twice)
+_NULL = 5
+
+# _LOCAL_PRODUCT[code, is_creation] is the code of ``code @ (+ if is_creation else -)``
+_LOCAL_PRODUCT = np.asarray(
+    [
+        [2, 1],
+        [3, _NULL],
+        [_NULL, 4],
+        [_NULL, 1],
+        [2, _NULL],
+        [_NULL, _NULL],
+    ],
+    dtype=np.int8,
+)
+
+# each non-trivial local operator code is the sum of exactly two Pauli operators, whose symplectic
+# (z, x) representations and coefficients are tabulated here (indexed by code - 1)
+_LOCAL_PAULI_Z = np.asarray([[0, 1], [0, 1], [0, 1], [0, 1]], dtype=bool)
+_LOCAL_PAULI_X = np.asarray([[1, 1], [1, 1], [0, 0], [0, 0]], dtype=bool)
+_LOCAL_PAULI_COEFF = np.asarray(
+    [[0.5, -0.5j], [0.5, 0.5j], [0.5, -0.5], [0.5, 0.5]],
+    dtype=complex,
+)
+
 
 class DirectMapper(VibrationalMapper):  # pylint: disable=missing-class-docstring
     def __init__(self):
@@ -50,4 +83,104 @@ class DirectMapper(VibrationalMapper):  # pylint: disable=missing-class-docstrin
         return pauli_table
 
     def _map_single(self, second_q_op: VibrationalOp) -> PauliSumOp:
-        return DirectMapper.mode_based_mapping(second_q_op, sum(second_q_op.num_modals))
+        register_length = sum(second_q_op.num_modals)
+
+        if any(isinstance(coeff, ParameterExpression) for coeff in second_q_op.values()):
+            # the vectorized mapping below requires numeric coefficients
+            return DirectMapper.mode_based_mapping(second_q_op, register_length)
+
+        return PauliSumOp(DirectMapper._vectorized_mapping(second_q_op, register_length))
+
+    @staticmethod
+    def _vectorized_mapping(second_q_op: VibrationalOp, register_length: int) -> SparsePauliOp:
+        """Maps a ``VibrationalOp`` onto a ``SparsePauliOp`` in vectorized form.
+
+        Rather than composing the qubit operators of every single term one after another, the
+        ``(mode, modal)`` index arrays of all terms are translated into register indices using a
+        precomputed table of modal offsets. These arrays are provided by the ``VibrationalOp``
+        directly, such that no labels need to be parsed. Terms of equal length are then processed
+        together: the product of operators acting on each qubit is reduced to one of a handful of
+        local operators, each of which expands into exactly two Pauli operators. This allows all Pauli
+        strings to be written directly into their symplectic representation.
+
+        Args:
+            second_q_op: the ``VibrationalOp`` to be mapped.
+            register_length: the number of qubits.
+
+        Returns:
+            The simplified ``SparsePauliOp``.
+        """
+        offsets = np.cumsum([0] + list(second_q_op.num_modals))
+
+        # make sure the result is not empty by including a zero op
+        z_blocks = [np.zeros((1, register_length), dtype=bool)]
+        x_blocks = [np.zeros((1, register_length), dtype=bool)]
+        coeff_blocks = [np.zeros(1, dtype=complex)]
+
+        # pylint: disable=protected-access
+        for length, (creation, modes, modals, coeffs) in second_q_op._index_arrays().items():
+            coeff_arr = np.asarray(coeffs, dtype=complex)
+
+            if length == 0:
+                z_blocks.append(np.zeros((1, register_length), dtype=bool))
+                x_blocks.append(np.zeros((1, register_length), dtype=bool))
+                coeff_blocks.append(np.asarray([coeff_arr.sum()]))
+                continue
+
+            indices = offsets[modes] + modals
+
+            # different qubits commute, so we can sort each term by its qubit indices, while the
+            # stable sort preserves the order of the operators acting on the same qubit
+            order = np.argsort(indices, axis=1, kind="stable")
+            indices = np.take_along_axis(indices, order, axis=1)
+            creation = np.take_along_axis(creation, order, axis=1)
+
+            # reduce the operators acting on each qubit to a single local operator code
+            codes = np.zeros(indices.shape, dtype=np.int8)
+            codes[:, 0] = _LOCAL_PRODUCT[0, creation[:, 0].astype(int)]
+            for pos in range(1, length):
+                same_qubit = indices[:, pos] == indices[:, pos - 1]
+                previous = np.where(same_qubit, codes[:, pos - 1], 0)
+                codes[:, pos] = _LOCAL_PRODUCT[previous, creation[:, pos].astype(int)]
+
+            # only the last position acting on each qubit holds its final local operator
+            last_on_qubit = np.ones(indices.shape, dtype=bool)
+            last_on_qubit[:, :-1] = indices[:, 1:] != indices[:, :-1]
+
+            # drop all terms which vanish identically
+            non_null = ~np.any(last_on_qubit & (codes == _NULL), axis=1)
+            indices, codes, last_on_qubit = (
+                indices[non_null],
+                codes[non_null],
+                last_on_qubit[non_null],
+            )
+            coeff_arr = coeff_arr[non_null]
+
+            num_qubits_per_term = last_on_qubit.sum(axis=1)
+            for num_qubits in np.unique(num_qubits_per_term):
+                mask = num_qubits_per_term == num_qubits
+                qubits = indices[mask][last_on_qubit[mask]].reshape(-1, num_qubits)
+                local_codes = codes[mask][last_on_qubit[mask]].reshape(-1, num_qubits) - 1
+                num_terms = qubits.shape[0]
+                num_expansions = 2**num_qubits
+
+                # selects one of the two Pauli operators per qubit for each expanded Pauli string
+                choice = (np.arange(num_expansions)[:, None] >> np.arange(num_qubits)) & 1
+                local_codes = local_codes[:, None, :]
+
+                rows = np.arange(num_terms * num_expansions)[:, None]
+                columns = np.repeat(qubits, num_expansions, axis=0)
+                z_block = np.zeros((num_terms * num_expansions, register_length), dtype=bool)
+                x_block = np.zeros((num_terms * num_expansions, register_length), dtype=bool)
+                z_block[rows, columns] = _LOCAL_PAULI_Z[local_codes, choice].reshape(-1, num_qubits)
+                x_block[rows, columns] = _LOCAL_PAULI_X[local_codes, choice].reshape(-1, num_qubits)
+                coeff_block = coeff_arr[mask][:, None] * np.prod(
+                    _LOCAL_PAULI_COEFF[local_codes, choice], axis=2
+                )
+
+                z_blocks.append(z_block)
+                x_blocks.append(x_block)
+                coeff_blocks.append(coeff_block.ravel())
+
+        paulis = PauliList.from_symplectic(np.vstack(z_blocks), np.vstack(x_blocks))
+        return SparsePauliOp(paulis, np.concatenate(coeff_blocks)).simplify()
@@ -23,6 +23,7 @@ from qiskit.quantum_info.operators import Pauli
 
 from qiskit_nature.second_q.operators import FermionicOp
 from .fermionic_mapper import FermionicMapper
+from .linear_encoding_mapper import _pauli_table_from_encoding
 
 
 class JordanWignerMapper(FermionicMapper):  # pylint: disable=missing-class-docstring
@@ -33,19 +34,9 @@ class JordanWignerMapper(FermionicMapper):  # pylint: disable=missing-class-docs
     @classmethod
     @lru_cache(maxsize=32)
     def pauli_table(cls, nmodes: int) -> list[tuple[Pauli, Pauli]]:
-        pauli_table = []
-
-        for i in range(nmodes):
-            a_z = np.asarray([1] * i + [0] + [0] * (nmodes - i - 1), dtype=bool)
-            a_x = np.asarray([0] * i + [1] + [0] * (nmodes - i - 1), dtype=bool)
-            b_z = np.asarray([1] * i + [1] + [0] * (nmodes - i - 1), dtype=bool)
-            b_x = np.asarray([0] * i + [1] + [0] * (nmodes - i - 1), dtype=bool)
-            # c_z = np.asarray([0] * i + [1] + [0] * (nmodes - i - 1), dtype=bool)
-            # c_x = np.asarray([0] * nmodes, dtype=bool)
-            pauli_table.append((Pauli((a_z, a_x)), Pauli((b_z, b_x))))
-            # TODO add Pauli 3-tuple to lookup table
-
-        return pauli_table
+        # the occupation numbers are stored directly in the qubits
+        identity = np.eye(nmodes, dtype=bool)
+        return _pauli_table_from_encoding(identity, identity)
 
     def _map_single(self, second_q_op: FermionicOp) -> PauliSumOp:
         return JordanWignerMapper.mode_based_mapping(second_q_op, second_q_op.register_length)
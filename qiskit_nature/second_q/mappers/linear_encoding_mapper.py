@@ -0,0 +1,155 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The Linear Encoding Mapper."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from qiskit.opflow import PauliSumOp
+from qiskit.quantum_info.operators import Pauli, PauliList, SparsePauliOp
+
+from qiskit_nature import QiskitNatureError
+from qiskit_nature.second_q.operators import FermionicOp
+
+from .fermionic_mapper import FermionicMapper
+
+
+class LinearEncodingMapper(FermionicMapper):
+    r"""A fermion-to-qubit mapping defined by a binary encoding matrix.
+
+    A linear encoding [1] stores the occupation numbers :math:`n` of the fermionic modes in the
+    qubit basis states :math:`b = \beta n \mod 2`, where :math:`\beta` is an invertible binary
+    matrix. The Jordan-Wigner, parity and Bravyi-Kitaev mappings correspond to the identity, the
+    lower-triangular and the Fenwick-tree matrices, respectively:
+
+    .. jupyter-execute::
+
+        import numpy as np
+        from qiskit_nature.second_q.mappers import LinearEncodingMapper
+        from qiskit_nature.second_q.operators import FermionicOp
+
+        parity_mapper = LinearEncodingMapper(np.tril(np.ones((4, 4), dtype=bool)))
+        print(parity_mapper.map(FermionicOp({"+_1 -_2": 1.0}, num_spin_orbitals=4)))
+
+    The Pauli table is derived from :math:`\beta` and its inverse using vectorized GF(2) arithmetic:
+    the creation (annihilation) operator on mode :math:`j` flips the qubits in the update set (the
+    :math:`j`-th column of :math:`\beta`) and acquires the phase of the parity of all modes
+    :math:`k < j`, which is read off the qubits in the rows :math:`k < j` of :math:`\beta^{-1}`.
+
+    [1]: J. T. Seeley, M. J. Richard and P. J. Love, J. Chem. Phys. 137, 224109 (2012).
+    """
+
+    def __init__(self, encoding: np.ndarray) -> None:
+        """
+        Args:
+            encoding: the square and invertible binary encoding matrix. Its dimension must match
+                the register length of the operators being mapped.
+
+        Raises:
+            QiskitNatureError: if the encoding matrix is not square or not invertible over GF(2).
+        """
+        super().__init__(allows_two_qubit_reduction=False)
+        encoding = np.asarray(encoding, dtype=int) % 2
+        if encoding.ndim != 2 or encoding.shape[0] != encoding.shape[1]:
+            raise QiskitNatureError(
+                f"The encoding matrix must be square, not of shape {encoding.shape}."
+            )
+        self._encoding = encoding.astype(bool)
+        self._inverse = _gf2_inverse(self._encoding)
+        self._sparse_pauli_operators: tuple[list[SparsePauliOp], list[SparsePauliOp]] | None = None
+
+    @property
+    def encoding(self) -> np.ndarray:
+        """Returns the binary encoding matrix."""
+        return self._encoding
+
+    def _map_single(self, second_q_op: FermionicOp) -> PauliSumOp:
+        nmodes = self._encoding.shape[0]
+        if second_q_op.register_length > nmodes:
+            raise QiskitNatureError(
+                f"The operator acts on {second_q_op.register_length} modes, but the encoding "
+                f"matrix only encodes {nmodes} modes."
+            )
+
+        if self._sparse_pauli_operators is None:
+            self._sparse_pauli_operators = self._sparse_pauli_operators_from_table(
+                _pauli_table_from_encoding(self._encoding, self._inverse)
+            )
+
+        return self._map_with_sparse_pauli_operators(
+            second_q_op, nmodes, *self._sparse_pauli_operators
+        )
+
+
+def _gf2_inverse(matrix: np.ndarray) -> np.ndarray:
+    """Inverts a binary matrix over GF(2) using vectorized Gauss-Jordan elimination.
+
+    Args:
+        matrix: the square binary matrix to invert.
+
+    Returns:
+        The inverse binary matrix.
+
+    Raises:
+        QiskitNatureError: if the matrix is singular over GF(2).
+    """
+    size = matrix.shape[0]
+    augmented = np.concatenate([matrix.astype(bool), np.eye(size, dtype=bool)], axis=1)
+    for col in range(size):
+        pivots = np.flatnonzero(augmented[col:, col])
+        if pivots.size == 0:
+            raise QiskitNatureError("The encoding matrix is not invertible over GF(2).")
+        pivot = col + pivots[0]
+        if pivot != col:
+            augmented[[col, pivot]] = augmented[[pivot, col]]
+        rows = augmented[:, col].copy()
+        rows[col] = False
+        augmented[rows] ^= augmented[col]
+    return augmented[:, size:]
+
+
+def _pauli_table_from_encoding(
+    encoding: np.ndarray, inverse: np.ndarray | None = None
+) -> list[tuple[Pauli, Pauli]]:
+    """Generates the Pauli-lookup table of a linear encoding.
+
+    The returned table has the same format as :meth:`.QubitMapper.pauli_table`. The real part of
+    mode :math:`j` is :math:`X_{U(j)} Z_{P(j)}`, where the update set :math:`U(j)` is the
+    :math:`j`-th column of the encoding matrix and the parity set :math:`P(j)` is the sum (over
+    GF(2)) of all rows :math:`k < j` of its inverse. The imaginary part additionally includes the
+    occupation :math:`Z_{F(j)}` of mode :math:`j`, where :math:`F(j)` is the :math:`j`-th row of
+    the inverse.
+
+    Args:
+        encoding: the square and invertible binary encoding matrix.
+        inverse: the optional inverse of ``encoding``. This avoids the Gauss-Jordan elimination
+            for encodings whose inverse is known analytically.
+
+    Returns:
+        The Pauli-lookup table.
+    """
+    encoding = np.asarray(encoding, dtype=bool)
+    if inverse is None:
+        inverse = _gf2_inverse(encoding)
+    nmodes = encoding.shape[0]
+
+    parity_sets = np.zeros((nmodes, nmodes), dtype=bool)
+    parity_sets[1:] = np.bitwise_xor.accumulate(inverse[:-1], axis=0)
+
+    no_bits = np.zeros((nmodes, nmodes), dtype=bool)
+    update_paulis = PauliList.from_symplectic(no_bits, encoding.T)
+    real_paulis = update_paulis.dot(PauliList.from_symplectic(parity_sets, no_bits))
+    imag_paulis = 1j * update_paulis.dot(PauliList.from_symplectic(parity_sets ^ inverse, no_bits))
+
+    return [(real_paulis[j], imag_paulis[j]) for j in range(nmodes)]
@@ -0,0 +1,175 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The Mode Reordering Mapper."""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+from qiskit.opflow import PauliSumOp
+
+from qiskit_nature import QiskitNatureError
+from qiskit_nature.second_q.operators import FermionicOp
+
+from .fermionic_mapper import FermionicMapper
+
+
+class ModeReorderingMapper(FermionicMapper):
+    """A mapper which permutes the fermionic modes before delegating to another mapper.
+
+    The Pauli weight of the qubit operators produced by, for example, the
+    :class:`~qiskit_nature.second_q.mappers.JordanWignerMapper` depends strongly on the order of the
+    fermionic modes, since an interaction between two modes gets mapped onto a string of Pauli
+    operators spanning all modes in between. The :meth:`from_operator` factory method searches for a
+    mode permutation which reduces the total (or maximum) Pauli weight of the mapped operator,
+    based on the reverse Cuthill-McKee bandwidth reduction of the interaction graph of the operator:
+
+    .. code-block:: python
+
+        from qiskit_nature.second_q.mappers import JordanWignerMapper, ModeReorderingMapper
+
+        hamiltonian = problem.hamiltonian.second_q_op()
+        mapper = ModeReorderingMapper.from_operator(JordanWignerMapper(), hamiltonian)
+
+        qubit_op = mapper.map(hamiltonian)
+        print(mapper.permutation)
+
+    Every operator mapped by this mapper gets permuted in the same way. This includes auxiliary
+    operators and the Hartree-Fock initial state, such that any results evaluated with this mapper
+    remain expressed in terms of the original mode ordering. The :attr:`permutation` is recorded in
+    order to translate qubit-level data (for example measured bitstrings) between both orderings.
+
+    .. note::
+
+        Permuting the modes in general destroys the structure which is exploited by the two-qubit
+        reduction of the :class:`~qiskit_nature.second_q.mappers.ParityMapper`. Thus, this mapper
+        never allows the two-qubit reduction.
+    """
+
+    def __init__(self, mapper: FermionicMapper, permutation: Sequence[int]) -> None:
+        """
+        Args:
+            mapper: the mapper to apply to the permuted operators.
+            permutation: a permutation of the mode indices, such that the mode with index ``i`` is
+                moved to the index ``permutation[i]``.
+        """
+        super().__init__(allows_two_qubit_reduction=False)
+        self._mapper = mapper
+        self._permutation = list(permutation)
+
+    @property
+    def mapper(self) -> FermionicMapper:
+        """Returns the mapper which is applied to the permuted operators."""
+        return self._mapper
+
+    @property
+    def permutation(self) -> list[int]:
+        """Returns the permutation, which moves the mode with index ``i`` to ``permutation[i]``."""
+        return self._permutation
+
+    @property
+    def inverse_permutation(self) -> list[int]:
+        """Returns the permutation which restores the original order of the modes."""
+        return np.argsort(self._permutation).tolist()
+
+    @classmethod
+    def from_operator(
+        cls,
+        mapper: FermionicMapper,
+        second_q_op: FermionicOp,
+        *,
+        objective: str = "total",
+    ) -> ModeReorderingMapper:
+        """Constructs a ``ModeReorderingMapper`` with a permutation optimized for an operator.
+
+        The identity permutation is compared against the Cuthill-McKee and reverse Cuthill-McKee
+        orderings of the interaction graph of ``second_q_op``, in which two modes are connected
+        when they appear together in any term of the operator. The permutation resulting in the
+        lowest Pauli weight of the mapped operator is selected.
+
+        Args:
+            mapper: the mapper to apply to the permuted operators.
+            second_q_op: the operator (usually the Hamiltonian) for which to optimize the ordering.
+            objective: the Pauli weight which to minimize. This can be either ``"total"`` for the
+                sum of the Pauli weights of all terms or ``"max"`` for the largest Pauli weight of
+                any term.
+
+        Raises:
+            QiskitNatureError: if an unknown ``objective`` is provided.
+
+        Returns:
+            The constructed mapper.
+        """
+        if objective not in ("total", "max"):
+            raise QiskitNatureError(
+                f"The objective must be either 'total' or 'max', not '{objective}'."
+            )
+
+        register_length = second_q_op.register_length
+        identity = list(range(register_length))
+        order = cls._cuthill_mckee_order(second_q_op)
+        candidates = [
+            identity,
+            np.argsort(order).tolist(),
+            np.argsort(order[::-1]).tolist(),
+        ]
+
+        best_permutation = identity
+        best_weight = None
+        for permutation in candidates:
+            qubit_op = mapper.map(second_q_op.permute_indices(permutation))
+            paulis = qubit_op.primitive.paulis
+            weights = np.sum(paulis.x | paulis.z, axis=1)
+            weight = int(np.sum(weights) if objective == "total" else np.max(weights, initial=0))
+            if best_weight is None or weight < best_weight:
+                best_permutation, best_weight = permutation, weight
+
+        return cls(mapper, best_permutation)
+
+    @staticmethod
+    def _cuthill_mckee_order(second_q_op: FermionicOp) -> np.ndarray:
+        """Computes the Cuthill-McKee ordering of the interaction graph of an operator.
+
+        Args:
+            second_q_op: the operator whose interaction graph to order.
+
+        Returns:
+            The mode indices in Cuthill-McKee order.
+        """
+        rows: list[int] = []
+        cols: list[int] = []
+        for terms, _ in second_q_op.terms():
+            indices = sorted({index for _, index in terms})
+            for i, index_i in enumerate(indices):
+                for index_j in indices[i + 1 :]:
+                    rows.append(index_i)
+                    cols.append(index_j)
+
+        register_length = second_q_op.register_length
+        graph = coo_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(register_length, register_length)
+        ).tocsr()
+        # the reversal undoes the reverse step, which we evaluate separately
+        return reverse_cuthill_mckee(graph + graph.T, symmetric_mode=True)[::-1]
+
+    def _map_single(self, second_q_op: FermionicOp) -> PauliSumOp:
+        if second_q_op.register_length != len(self._permutation):
+            raise QiskitNatureError(
+                f"The operator acts on {second_q_op.register_length} modes, but the permutation "
+                f"of this mapper acts on {len(self._permutation)} modes."
+            )
+        return self._mapper.map(second_q_op.permute_indices(self._permutation))
@@ -15,7 +15,6 @@
 from __future__ import annotations
 
 from functools import lru_cache
-from typing import Union, List
 
 import numpy as np
 
@@ -24,6 +23,7 @@ from qiskit.quantum_info.operators import Pauli
 
 from qiskit_nature.second_q.operators import FermionicOp
 from .fermionic_mapper import FermionicMapper
+from .linear_encoding_mapper import _pauli_table_from_encoding
 
 
 class ParityMapper(FermionicMapper):  # pylint: disable=missing-class-docstring
@@ -39,20 +39,11 @@ class ParityMapper(FermionicMapper):  # pylint: disable=missing-class-docstring
     @classmethod
     @lru_cache(maxsize=32)
     def pauli_table(cls, nmodes: int) -> list[tuple[Pauli, Pauli]]:
-        pauli_table = []
-
-        for i in range(nmodes):
-            a_z: Union[List[int], np.ndarray] = [0] * (i - 1) + [1] if i > 0 else []
-            a_x: Union[List[int], np.ndarray] = [0] * (i - 1) + [0] if i > 0 else []
-            b_z: Union[List[int], np.ndarray] = [0] * (i - 1) + [0] if i > 0 else []
-            b_x: Union[List[int], np.ndarray] = [0] * (i - 1) + [0] if i > 0 else []
-            a_z = np.asarray(a_z + [0] + [0] * (nmodes - i - 1), dtype=bool)
-            a_x = np.asarray(a_x + [1] + [1] * (nmodes - i - 1), dtype=bool)
-            b_z = np.asarray(b_z + [1] + [0] * (nmodes - i - 1), dtype=bool)
-            b_x = np.asarray(b_x + [1] + [1] * (nmodes - i - 1), dtype=bool)
-            pauli_table.append((Pauli((a_z, a_x)), Pauli((b_z, b_x))))
-
-        return pauli_table
+        # each qubit stores the parity of all modes up to and including its own
+        encoding = np.tril(np.ones((nmodes, nmodes), dtype=bool))
+        # and the occupation of a mode is the parity difference of two neighboring qubits
+        inverse = np.eye(nmodes, dtype=bool) | np.eye(nmodes, k=-1, dtype=bool)
+        return _pauli_table_from_encoding(encoding, inverse)
 
     def _map_single(self, second_q_op: FermionicOp) -> PauliSumOp:
         return ParityMapper.mode_based_mapping(second_q_op, second_q_op.register_length)
@@ -33,7 +33,7 @@ from qiskit.opflow.converters import TwoQubitReduction
 from qiskit.opflow.primitive_ops import Z2Symmetries
 
 from qiskit_nature import QiskitNatureError
-from qiskit_nature.second_q.operators import SparseLabelOp
+from qiskit_nature.second_q.operators import OperatorCache, SparseLabelOp
 from .qubit_mapper import QubitMapper, _ListOrDict
 
 logger = logging.getLogger(__name__)
@@ -98,6 +98,10 @@ class QubitConverter:
         self._num_particles: Optional[Tuple[int, int]] = None
         self._z2symmetries: Z2Symmetries = self._no_symmetries
 
+        # operators which get converted repeatedly (e.g. the auxiliary operators of every point of a
+        # potential energy surface scan) only get mapped and reduced once
+        self._reduced_op_cache = OperatorCache(maxsize=128)
+
         self._sort_operators: bool = sort_operators
 
     @property
@@ -114,6 +118,7 @@ class QubitConverter:
         """Set mapper"""
         self._mapper = value
         self._z2symmetries = None  # Reset as symmetries my change due to mapper change
+        self._reduced_op_cache.clear()
 
     @property
     def two_qubit_reduction(self) -> bool:
@@ -193,8 +198,7 @@ class QubitConverter:
         Returns:
             PauliSumOp qubit operator
         """
-        qubit_op = self._mapper.map(second_q_op)
-        reduced_op = self._two_qubit_reduce(qubit_op, num_particles)
+        reduced_op = self._map_and_reduce(second_q_op, num_particles)
         tapered_op, z2symmetries = self.find_taper_op(reduced_op, sector_locator)
 
         self._num_particles = num_particles
@@ -221,10 +225,7 @@ class QubitConverter:
         Returns:
             PauliSumOp qubit operator
         """
-        qubit_op = self._mapper.map(second_q_op)
-        reduced_op = self._two_qubit_reduce(qubit_op, num_particles)
-
-        return reduced_op
+        return self._map_and_reduce(second_q_op, num_particles)
 
     def force_match(
         self,
@@ -303,9 +304,7 @@ class QubitConverter:
 
         reduced_ops: _ListOrDict[PauliSumOp] = _ListOrDict()
         for name, second_q_op in iter(wrapped_second_q_ops):
-            qubit_op: PauliSumOp = self._mapper.map(second_q_op)
-            reduced_op: PauliSumOp = self._two_qubit_reduce(qubit_op, self._num_particles)
-            reduced_ops[name] = reduced_op
+            reduced_ops[name] = self._map_and_reduce(second_q_op, self._num_particles)
 
         tapered_ops: _ListOrDict[PauliSumOp] = self._symmetry_reduce(reduced_ops, check_commutes)
 
@@ -315,6 +314,23 @@ class QubitConverter:
 
         return returned_ops
 
+    def _map_and_reduce(
+        self, second_q_op: SparseLabelOp, num_particles: Optional[Tuple[int, int]]
+    ) -> PauliSumOp:
+        def map_and_reduce() -> PauliSumOp:
+            qubit_op = self._mapper.map(second_q_op)
+            return self._two_qubit_reduce(qubit_op, num_particles)
+
+        if second_q_op.is_parameterized():
+            return map_and_reduce()
+
+        key = (
+            second_q_op.fingerprint(exact=True),
+            tuple(num_particles) if isinstance(num_particles, list) else num_particles,
+            self._two_qubit_reduction,
+        )
+        return self._reduced_op_cache.get_or_build(key, map_and_reduce)
+
     def _two_qubit_reduce(
         self, qubit_op: PauliSumOp, num_particles: Optional[Tuple[int, int]]
     ) -> PauliSumOp:
@@ -24,7 +24,7 @@ from qiskit.quantum_info.operators import Pauli, SparsePauliOp
 from qiskit.algorithms.list_or_dict import ListOrDict as ListOrDictType
 
 from qiskit_nature import QiskitNatureError
-from qiskit_nature.second_q.operators import SparseLabelOp
+from qiskit_nature.second_q.operators import OperatorCache, SparseLabelOp
 
 # pylint: disable=invalid-name
 T = TypeVar("T")
@@ -101,6 +101,7 @@ class QubitMapper(ABC):
                 number of qubits in the mapped operator can be reduced accordingly.
         """
         self._allows_two_qubit_reduction = allows_two_qubit_reduction
+        self._map_cache = OperatorCache(maxsize=128)
 
     @property
     def allows_two_qubit_reduction(self) -> bool:
@@ -153,7 +154,7 @@ class QubitMapper(ABC):
 
         qubit_ops: _ListOrDict = _ListOrDict()
         for name, second_q_op in iter(wrapped_second_q_ops):
-            qubit_ops[name] = self._map_single(second_q_op)
+            qubit_ops[name] = self._map_single_cached(second_q_op)
 
         returned_ops: Union[PauliSumOp, ListOrDictType[PauliSumOp]] = qubit_ops.unwrap(
             wrapped_type, suppress_none=suppress_none
@@ -161,6 +162,32 @@ class QubitMapper(ABC):
 
         return returned_ops
 
+    def _map_single_cached(self, second_q_op: SparseLabelOp) -> PauliSumOp:
+        """Maps a single operator, reusing the result of earlier mappings of the same operator.
+
+        Operators are identified by their exact
+        :meth:`~qiskit_nature.second_q.operators.SparseLabelOp.fingerprint`, such that operators
+        which differ by less than their tolerance never share a mapped result. Parameterized
+        operators are always mapped anew.
+
+        Args:
+            second_q_op: the `SparseLabelOp` to be mapped.
+
+        Returns:
+            The `PauliSumOp` corresponding to ``second_q_op``.
+        """
+        if second_q_op.is_parameterized():
+            return self._map_single(second_q_op)
+
+        cache = getattr(self, "_map_cache", None)
+        if cache is None:
+            # subclasses which do not call our initializer
+            cache = self._map_cache = OperatorCache(maxsize=128)
+
+        return cache.get_or_build(
+            second_q_op.fingerprint(exact=True), lambda: self._map_single(second_q_op)
+        )
+
     @classmethod
     @lru_cache(maxsize=32)
     def pauli_table(cls, nmodes: int) -> list[tuple[Pauli, Pauli]]:
@@ -187,6 +214,21 @@ class QubitMapper(ABC):
         Args:
             nmodes: the number of modes for which to generate the operators.
 
+        Returns:
+            Two lists stored in a tuple, consisting of the creation and annihilation  operators,
+            applied on the individual modes.
+        """
+        return cls._sparse_pauli_operators_from_table(cls.pauli_table(nmodes))
+
+    @staticmethod
+    def _sparse_pauli_operators_from_table(
+        pauli_table: list[tuple[Pauli, Pauli]]
+    ) -> tuple[list[SparsePauliOp], list[SparsePauliOp]]:
+        """Constructs the creation and annihilation operators from a Pauli-lookup table.
+
+        Args:
+            pauli_table: the table as generated by :meth:`.QubitMapper.pauli_table`.
+
         Returns:
             Two lists stored in a tuple, consisting of the creation and annihilation  operators,
             applied on the individual modes.
@@ -194,7 +236,7 @@ class QubitMapper(ABC):
         times_creation_op = []
         times_annihilation_op = []
 
-        for paulis in cls.pauli_table(nmodes):
+        for paulis in pauli_table:
             real_part = SparsePauliOp(paulis[0], coeffs=[0.5])
             imag_part = SparsePauliOp(paulis[1], coeffs=[0.5j])
 
@@ -224,8 +266,31 @@ class QubitMapper(ABC):
             QiskitNatureError: If number length of pauli table does not match the number
                 of operator modes, or if the operator has unexpected label content
         """
-        times_creation_op, times_annihilation_op = cls.sparse_pauli_operators(nmodes)
+        return cls._map_with_sparse_pauli_operators(
+            second_q_op, nmodes, *cls.sparse_pauli_operators(nmodes)
+        )
+
+    @staticmethod
+    def _map_with_sparse_pauli_operators(
+        second_q_op: SparseLabelOp,
+        nmodes: int,
+        times_creation_op: list[SparsePauliOp],
+        times_annihilation_op: list[SparsePauliOp],
+    ) -> PauliSumOp:
+        """Maps a `SparseLabelOp` to a `PauliSumOp` using the provided qubit operators.
+
+        Args:
+            second_q_op: the `SparseLabelOp` to be mapped.
+            nmodes: the number of modes.
+            times_creation_op: the qubit operators of the creation operators on each mode.
+            times_annihilation_op: the qubit operators of the annihilation operators on each mode.
 
+        Returns:
+            The `PauliSumOp` corresponding to the problem-Hamiltonian in the qubit space.
+
+        Raises:
+            QiskitNatureError: If the operator has unexpected label content
+        """
         # make sure ret_op_list is not empty by including a zero op
         ret_op_list = [SparsePauliOp("I" * nmodes, coeffs=[0])]
 
@@ -0,0 +1,90 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The Ternary Tree Mapper."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from qiskit.opflow import PauliSumOp
+from qiskit.quantum_info.operators import Pauli, PauliList
+
+from qiskit_nature.second_q.operators import FermionicOp
+from .fermionic_mapper import FermionicMapper
+
+
+class TernaryTreeMapper(FermionicMapper):  # pylint: disable=missing-class-docstring
+    def __init__(self):
+        r"""The ternary tree fermion-to-qubit mapping.
+
+        This mapping [1] arranges the qubits in a complete ternary tree, in which qubit :math:`k` has
+        the children :math:`3k + 1`, :math:`3k + 2` and :math:`3k + 3`, reached via an :math:`X`,
+        :math:`Y` and :math:`Z` edge, respectively. The two Majorana operators of mode :math:`k` are
+        given by the Pauli strings along the path from the root to qubit :math:`k`, followed by an
+        :math:`X` (resp. :math:`Y`) on qubit :math:`k` and a chain of :math:`Z` operators down the
+        corresponding subtree. This results in an average Pauli weight of
+        :math:`\mathcal{O}(\log_3(2n + 1))` per Majorana operator, which is optimal, and
+        additionally maps the fermionic vacuum onto the all-zero qubit state.
+
+        [1]: Z. Jiang, A. Kalev, W. Mruczkiewicz and H. Neven, Quantum 4, 276 (2020).
+        """
+        super().__init__(allows_two_qubit_reduction=False)
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def pauli_table(cls, nmodes: int) -> list[tuple[Pauli, Pauli]]:
+        nodes = np.arange(nmodes)
+
+        # the Pauli strings acting on the ancestors of each node, determined level by level
+        path_z = np.zeros((nmodes, nmodes), dtype=bool)
+        path_x = np.zeros((nmodes, nmodes), dtype=bool)
+        level = nodes[:1]
+        while level.size > 0:
+            for branch, (edge_z, edge_x) in enumerate([(False, True), (True, True), (True, False)]):
+                children = 3 * level + 1 + branch
+                parents = level[children < nmodes]
+                children = children[children < nmodes]
+                path_z[children] = path_z[parents]
+                path_x[children] = path_x[parents]
+                path_z[children, parents] = edge_z
+                path_x[children, parents] = edge_x
+            level = 3 * level[:, None] + np.arange(1, 4)
+            level = level[level < nmodes]
+
+        def z_chains(roots: np.ndarray) -> np.ndarray:
+            # the Z operators on all nodes reached from each root by following the Z edges only
+            chains = np.zeros((nmodes, nmodes), dtype=bool)
+            current = roots.copy()
+            while np.any(current < nmodes):
+                valid = current < nmodes
+                chains[nodes[valid], current[valid]] = True
+                current = 3 * current + 3
+            return chains
+
+        real_z = path_z | z_chains(3 * nodes + 1)
+        real_x = path_x.copy()
+        real_x[nodes, nodes] = True
+
+        imag_z = path_z | z_chains(3 * nodes + 2)
+        imag_z[nodes, nodes] = True
+        imag_x = real_x
+
+        real_paulis = PauliList.from_symplectic(real_z, real_x)
+        imag_paulis = PauliList.from_symplectic(imag_z, imag_x)
+
+        return [(real_paulis[j], imag_paulis[j]) for j in range(nmodes)]
+
+    def _map_single(self, second_q_op: FermionicOp) -> PauliSumOp:
+        return TernaryTreeMapper.mode_based_mapping(second_q_op, second_q_op.register_length)
@@ -23,6 +23,7 @@ Operators and mappers for different systems such as fermionic, vibrational and s
 
    ElectronicIntegrals
    FermionicOp
+   OperatorCache
    SparseLabelOp
    SpinOp
    VibrationalOp
@@ -46,6 +47,7 @@ from .vibrational_op import VibrationalOp
 from .vibrational_integrals import VibrationalIntegrals
 from .polynomial_tensor import PolynomialTensor
 from .sparse_label_op import SparseLabelOp
+from .operator_cache import OperatorCache
 
 __all__ = [
     "ElectronicIntegrals",
@@ -55,4 +57,5 @@ __all__ = [
     "VibrationalIntegrals",
     "PolynomialTensor",
     "SparseLabelOp",
+    "OperatorCache",
 ]
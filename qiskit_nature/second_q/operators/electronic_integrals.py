@@ -25,7 +25,7 @@ from qiskit.quantum_info.operators.mixins import LinearMixin
 from qiskit_nature.exceptions import QiskitNatureError
 import qiskit_nature.optionals as _optionals
 
-from .polynomial_tensor import ARRAY_TYPE, PolynomialTensor
+from .polynomial_tensor import ARRAY_TYPE, PolynomialTensor, _schwarz_factor
 from .tensor_ordering import (
     IndexType,
     find_index_order,
@@ -549,6 +549,77 @@ class ElectronicIntegrals(LinearMixin):
 
         return cls(alpha, beta, beta_alpha)
 
+    def screen(
+        self,
+        threshold: float,
+        *,
+        schwarz: bool = True,
+        sparse_density: float | None = None,
+    ) -> tuple[ElectronicIntegrals, float]:
+        """Removes all insignificant integrals.
+
+        This applies :meth:`qiskit_nature.second_q.operators.PolynomialTensor.screen` to the
+        :attr:`alpha`, :attr:`beta`, and :attr:`beta_alpha` tensors. The Schwarz screening of the
+        :attr:`beta_alpha` integrals is based on the factors of the pure :attr:`beta` (first index
+        pair) and :attr:`alpha` (second index pair) integrals.
+
+        .. code-block:: python
+
+            integrals = ElectronicIntegrals.from_raw_integrals(h1_a, h2_aa)
+
+            screened, error = integrals.screen(1e-10)
+            print(screened.alpha.is_sparse(), error)
+
+        Args:
+            threshold: the absolute value below which integrals are considered insignificant.
+            schwarz: whether to apply the Schwarz screening to the two-body integrals.
+            sparse_density: the density (fraction of non-zero elements) below which screened
+                matrices are stored sparsely. Defaults to
+                :attr:`qiskit_nature.settings.sparse_density_threshold`.
+
+        Returns:
+            The pair of the screened ``ElectronicIntegrals`` and an upper bound on the sum of the
+            absolute values of the discarded coefficients of :meth:`second_q_coeffs`. This also
+            bounds the change in norm of the :class:`~.FermionicOp` built from these integrals.
+        """
+        alpha, errors_a = self.alpha._screen(
+            threshold, schwarz=schwarz, sparse_density=sparse_density
+        )
+        beta, errors_b = alpha, errors_a
+        if not self.beta.is_empty():
+            beta, errors_b = self.beta._screen(
+                threshold, schwarz=schwarz, sparse_density=sparse_density
+            )
+        beta_alpha, errors_ba = self.beta_alpha, {}
+        if not self.beta_alpha.is_empty():
+            factors = None
+            if schwarz:
+                two_body_a = self.alpha["++--"]
+                two_body_b = two_body_a if self.beta.is_empty() else self.beta["++--"]
+                factors = (_schwarz_factor(two_body_b), _schwarz_factor(two_body_a))
+            beta_alpha, errors_ba = self.beta_alpha._screen(
+                threshold,
+                schwarz=schwarz,
+                sparse_density=sparse_density,
+                schwarz_factors=factors,
+            )
+
+        # the one-body blocks enter second_q_coeffs once and the two-body ones with a factor of 1/2
+        error = errors_a.get("+-", 0.0) + errors_b.get("+-", 0.0)
+        error += 0.5 * (errors_a.get("++--", 0.0) + errors_b.get("++--", 0.0))
+        if self.beta_alpha.is_empty():
+            if self.beta.is_empty():
+                # the alpha integrals also fill both mixed-spin blocks
+                error += errors_a.get("++--", 0.0)
+        else:
+            # the beta-alpha integrals fill both mixed-spin blocks
+            error += errors_ba.get("++--", 0.0)
+
+        if self.beta.is_empty():
+            beta = None
+
+        return self.__class__(alpha, beta, beta_alpha, validate=False), error
+
     def second_q_coeffs(self) -> PolynomialTensor:
         """Constructs the total ``PolynomialTensor`` contained the second-quantized coefficients.
 
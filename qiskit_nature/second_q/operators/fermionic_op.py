@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import re
 from collections import defaultdict
-from collections.abc import Collection, Mapping
+from collections.abc import Collection, Mapping, Sequence
 from typing import cast, Iterator
 
 import numpy as np
@@ -555,6 +555,37 @@ class FermionicOp(SparseLabelOp):
         new_label = " ".join(f"{term[0]}_{term[1]}" for term in terms)
         return new_label, coeff
 
+    def permute_indices(self, permutation: Sequence[int]) -> FermionicOp:
+        """Permutes the mode indices of this operator.
+
+        Relabeling the fermionic modes is an automorphism of the canonical anticommutation
+        relations, so the order of the operations within each label (and, thus, the coefficients)
+        remains unaffected.
+
+        Returns a new operator (the original operator is not modified).
+
+        Args:
+            permutation: a permutation of ``range(register_length)``, such that the mode with index
+                ``i`` is moved to the index ``permutation[i]``.
+
+        Raises:
+            ValueError: if ``permutation`` is not a permutation of the register indices.
+
+        Returns:
+            The permuted operator.
+        """
+        if sorted(permutation) != list(range(self.register_length)):
+            raise ValueError(
+                f"The provided permutation, {permutation}, is not a permutation of the "
+                f"{self.register_length} indices of this operator."
+            )
+
+        data = {}
+        for terms, coeff in self.terms():
+            data[" ".join(f"{char}_{permutation[index]}" for char, index in terms)] = coeff
+
+        return self._new_instance(data)
+
     def is_hermitian(self, atol: float | None = None) -> bool:
         """Checks whether the operator is hermitian.
 
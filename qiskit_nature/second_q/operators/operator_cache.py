@@ -0,0 +1,158 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The OperatorCache class."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Callable, TypeVar
+
+from .sparse_label_op import SparseLabelOp
+
+# pylint: disable=invalid-name
+T = TypeVar("T")
+_TSparseLabelOp = TypeVar("_TSparseLabelOp", bound=SparseLabelOp)
+
+
+class OperatorCache:
+    """A bounded, least-recently-used cache for second-quantized operators and derived objects.
+
+    Many parts of the stack rebuild identical operators over and over again. Examples are the
+    operators of the electronic properties (which only depend on the number of spatial orbitals) or
+    the qEOM hopping operators. This cache serves two purposes:
+
+    1. it *interns* operators: :meth:`intern` returns an already stored operator with the same
+       :meth:`~qiskit_nature.second_q.operators.SparseLabelOp.fingerprint` instead of the provided
+       one, such that repeated instances collapse onto a single object.
+    2. it *memoizes* arbitrary objects: :meth:`get_or_build` only invokes the provided builder when
+       no entry for the given key exists yet.
+
+    .. code-block:: python
+
+        from qiskit_nature.second_q.operators import FermionicOp, OperatorCache
+
+        cache = OperatorCache(maxsize=16)
+
+        op_a = cache.intern(FermionicOp({"+_0 -_1": 1.0, "+_1 -_0": 1.0}))
+        op_b = cache.intern(FermionicOp({"+_1 -_0": 1.0, "+_0 -_1": 1.0 + 1e-12}))
+        assert op_a is op_b
+
+    Once more than ``maxsize`` entries are stored, the least recently used one gets evicted.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Args:
+            maxsize: the maximum number of entries kept in the cache.
+
+        Raises:
+            ValueError: if ``maxsize`` is not a positive integer.
+        """
+        if maxsize < 1:
+            raise ValueError(f"The maximum cache size must be positive, not {maxsize}.")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Returns the maximum number of cached entries."""
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        """Returns the number of lookups which were served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Returns the number of lookups which were not served from the cache."""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Looks up a cached entry.
+
+        Args:
+            key: the key of the entry.
+            default: the value to return when no entry exists.
+
+        Returns:
+            The cached entry or ``default``.
+        """
+        if key not in self._entries:
+            self._misses += 1
+            return default
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Stores an entry, evicting the least recently used one if the cache is full.
+
+        Args:
+            key: the key of the entry.
+            value: the value to store.
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def get_or_build(self, key: Hashable, builder: Callable[[], T]) -> T:
+        """Returns the entry stored under ``key``, building and storing it first if necessary.
+
+        Args:
+            key: the key of the entry.
+            builder: a callable without arguments constructing the entry.
+
+        Returns:
+            The (possibly newly built) entry.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is sentinel:
+            value = builder()
+            self.put(key, value)
+        return value
+
+    def intern(self, op: _TSparseLabelOp, atol: float | None = None) -> _TSparseLabelOp:
+        """Returns the canonical instance of an operator.
+
+        If an operator with the same fingerprint has been interned before, that instance is returned.
+        Otherwise, ``op`` itself gets stored and returned. Parameterized operators are never
+        interned, since their parameters can only be compared by name.
+
+        Args:
+            op: the operator to intern.
+            atol: the tolerance used for computing the operator fingerprint.
+
+        Returns:
+            The canonical operator instance.
+        """
+        if op.is_parameterized():
+            return op
+        return self.get_or_build(("intern", op.fingerprint(atol)), lambda: op)
+
+    def clear(self) -> None:
+        """Removes all entries and resets the hit statistics."""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
@@ -14,7 +14,8 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Mapping, Sequence
+from functools import lru_cache
 from itertools import product
 from numbers import Number
 from typing import Iterator, Type, Union, cast
@@ -30,10 +31,11 @@ from qiskit.quantum_info.operators.mixins import (
 
 from qiskit_nature.settings import settings
 import qiskit_nature.optionals as _optionals
-from qiskit_nature.utils import get_einsum
+from qiskit_nature.utils import get_einsum, get_einsum_expression
 
 if _optionals.HAS_SPARSE:
     # pylint: disable=import-error
+    import sparse as sp
     from sparse import SparseArray, COO, DOK, GCXS, zeros_like
 else:
 
@@ -329,6 +331,83 @@ class PolynomialTensor(LinearMixin, GroupMixin, TolerancesMixin, Mapping):
                 sparse_dict[key] = value
         return PolynomialTensor(sparse_dict, validate=False)
 
+    def screen(
+        self,
+        threshold: float,
+        *,
+        schwarz: bool = False,
+        sparse_density: float | None = None,
+    ) -> tuple[PolynomialTensor, float]:
+        r"""Removes all insignificant coefficients from this tensor.
+
+        Coefficients whose absolute value lies below ``threshold`` get discarded. Additionally, when
+        ``schwarz`` is enabled, the two-body (``"++--"``) coefficients get screened using the
+        Schwarz inequality. In physicists' order this reads
+
+        .. math::
+
+            |g_{pqrs}| \leq Q_{ps} Q_{qr}, \quad Q_{ps} = \sqrt{|g_{ppss}|},
+
+        which allows entire blocks of orbital pairs :math:`(p, s)` to be discarded without
+        inspecting their coefficients, when :math:`Q_{ps} \max Q < threshold`. This requires the
+        two-body coefficients to be actual electron repulsion integrals, which is why it is disabled
+        by default here but enabled by :meth:`.ElectronicIntegrals.screen`.
+
+        After screening, matrices which are no denser than ``sparse_density`` are stored as
+        :class:`sparse.COO` arrays (if ``sparse`` is installed), such that all subsequent operations
+        (like the construction of a :class:`~.FermionicOp`) scale with the number of significant
+        coefficients.
+
+        Args:
+            threshold: the absolute value below which coefficients are considered insignificant.
+            schwarz: whether to apply the Schwarz screening to the two-body coefficients.
+            sparse_density: the density (fraction of non-zero elements) below which screened
+                matrices are stored sparsely. Defaults to
+                :attr:`qiskit_nature.settings.sparse_density_threshold`.
+
+        Returns:
+            The pair of the screened ``PolynomialTensor`` and an upper bound on the sum of the
+            absolute values of all discarded coefficients. Since every operator term has a norm of at
+            most one, the latter also bounds the change in norm of the operator built from this
+            tensor.
+        """
+        screened, errors = self._screen(threshold, schwarz=schwarz, sparse_density=sparse_density)
+        return screened, sum(errors.values())
+
+    def _screen(
+        self,
+        threshold: float,
+        *,
+        schwarz: bool = False,
+        sparse_density: float | None = None,
+        schwarz_factors: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> tuple[PolynomialTensor, dict[str, float]]:
+        """Implements :meth:`screen`, reporting the error bound of every key separately.
+
+        The ``schwarz_factors`` of the first and second pair of indices of the two-body matrix can
+        be provided explicitly (e.g. for mixed-spin integrals). Otherwise, these are derived from
+        the two-body matrix itself.
+        """
+        if sparse_density is None:
+            sparse_density = settings.sparse_density_threshold
+
+        new_data: dict[str, ARRAY_TYPE | Number] = {}
+        errors: dict[str, float] = {}
+        for key, value in self._data.items():
+            if np.ndim(value) == 0:
+                new_data[key] = value
+                continue
+            factors = None
+            if schwarz and key == "++--":
+                if schwarz_factors is None:
+                    factor = _schwarz_factor(value)
+                    factors = (factor, factor)
+                else:
+                    factors = schwarz_factors
+            new_data[key], errors[key] = _screen_array(value, threshold, factors, sparse_density)
+
+        return PolynomialTensor(new_data, validate=False), errors
+
     def _multiply(self, other: complex) -> PolynomialTensor:
         """Scalar multiplication of a PolynomialTensor with a scalar.
 
@@ -516,10 +595,13 @@ class PolynomialTensor(LinearMixin, GroupMixin, TolerancesMixin, Mapping):
             amat = cast(ARRAY_TYPE, a[akey])
             bmat = cast(ARRAY_TYPE, b[bkey])
 
-            outer = np.outer(amat, bmat).reshape(amat.shape + bmat.shape)
+            if _prefers_sparse(amat, bmat):
+                outer = _compact(_sparse_outer(amat, bmat))
+            else:
+                outer = np.outer(_as_dense(amat), _as_dense(bmat)).reshape(amat.shape + bmat.shape)
 
             if new_key in new_data:
-                new_data[new_key] = new_data[new_key] + outer
+                new_data[new_key] = _accumulate(new_data[new_key], outer)
             else:
                 new_data[new_key] = outer
 
@@ -573,38 +655,36 @@ class PolynomialTensor(LinearMixin, GroupMixin, TolerancesMixin, Mapping):
         # NOTE: mypy really does not like Number, so a lot of casts are necessary for the time being
         new_data: dict[str, ARRAY_TYPE | Number] = {}
         for akey, bkey in product(a, b):
-            # expand a-matrix into upper left sector
             amat = cast(ARRAY_TYPE, a[akey])
-            adim = len(amat.shape)
-            aones = np.zeros((2,) * adim)
-            aones[(0,) * adim] = 1.0
-            amat = np.kron(aones, amat)
-            aeinsum = string.ascii_lowercase[:adim] if adim > 0 else ""
-
-            # expand b-matrix into lower right sector
             bmat = cast(ARRAY_TYPE, b[bkey])
-            bdim = len(bmat.shape)
-            bones = np.zeros((2,) * bdim)
-            bones[(1,) * bdim] = 1.0
-            bmat = np.kron(bones, bmat)
-            beinsum = string.ascii_lowercase[-bdim:] if bdim > 0 else ""
-
-            make_sparse = False
-            if isinstance(amat, SparseArray):
-                # pylint: disable=no-member
-                amat = amat.todense()
-                make_sparse = True
-            if isinstance(bmat, SparseArray):
-                # pylint: disable=no-member
-                bmat = bmat.todense()
-                make_sparse = True
-            einsum = np.einsum(f"{aeinsum},{beinsum}", amat, bmat)
-            if make_sparse:
-                einsum = COO(einsum)
+
+            if _prefers_sparse(amat, bmat):
+                # place the non-zero elements directly into their sectors without densifying
+                einsum = _compact(_sparse_outer(_embed_sparse(amat, 0), _embed_sparse(bmat, 1)))
+            else:
+                # expand a-matrix into upper left sector
+                amat = _as_dense(amat)
+                adim = len(amat.shape)
+                aones = np.zeros((2,) * adim)
+                aones[(0,) * adim] = 1.0
+                amat = np.kron(aones, amat)
+                aeinsum = string.ascii_lowercase[:adim] if adim > 0 else ""
+
+                # expand b-matrix into lower right sector
+                bmat = _as_dense(bmat)
+                bdim = len(bmat.shape)
+                bones = np.zeros((2,) * bdim)
+                bones[(1,) * bdim] = 1.0
+                bmat = np.kron(bones, bmat)
+                beinsum = string.ascii_lowercase[-bdim:] if bdim > 0 else ""
+
+                einsum = np.einsum(f"{aeinsum},{beinsum}", amat, bmat)
+                if isinstance(a[akey], SparseArray) or isinstance(b[bkey], SparseArray):
+                    einsum = COO(einsum)
 
             new_key = akey + bkey
             if new_key in new_data:
-                new_data[new_key] = new_data[new_key] + einsum
+                new_data[new_key] = _accumulate(new_data[new_key], einsum)
             else:
                 new_data[new_key] = einsum
 
@@ -724,11 +804,19 @@ class PolynomialTensor(LinearMixin, GroupMixin, TolerancesMixin, Mapping):
 
         .. note::
 
-           :class:`sparse.SparseArray` supports ``opt_einsum.contract` if ``opt_einsum`` is installed.
-           It does not support ``numpy.einsum``. In this case, the resultant
-           ``PolynomialTensor`` will contain all dense numpy arrays. If a user would like to work
-           with a sparse array instead, they should install ``opt_einsum`` or
-           they should convert it explicitly using the :meth:`to_sparse` method.
+           When at least one of the sparse arrays taking part in a contraction is no denser than
+           :attr:`qiskit_nature.settings.sparse_density_threshold`, the contraction is carried out
+           pairwise (following the contraction order planned by :func:`numpy.einsum_path`) on the
+           sparse arrays themselves. Dense operands are only multiplied with, never converted
+           into, sparse arrays and the result is kept sparse unless it ends up denser than that
+           threshold. This keeps the memory requirements proportional to the number of non-zero
+           elements.
+
+           Other contractions involving :class:`sparse.SparseArray` operands are handed to
+           ``opt_einsum.contract`` if ``opt_einsum`` is installed. Otherwise, the operands get
+           converted to dense numpy arrays and the resultant ``PolynomialTensor`` will contain
+           dense arrays. To work with a sparse array in that case, it should be converted
+           explicitly using the :meth:`to_sparse` method.
 
         Args:
             einsum_map: a dictionary, mapping from :meth:`numpy.einsum` subscripts to a tuple of
@@ -742,22 +830,291 @@ class PolynomialTensor(LinearMixin, GroupMixin, TolerancesMixin, Mapping):
         Returns:
             A new ``PolynomialTensor``.
         """
-        einsum_func, uses_sparse = get_einsum()
-        operand_list = list(operands) if uses_sparse else [op.to_dense() for op in operands]
+        _, uses_sparse = get_einsum()
         new_data: dict[str, ARRAY_TYPE] = {}
         for einsum, terms in einsum_map.items():
             *inputs, output = terms
             try:
-                result = einsum_func(
-                    einsum,
-                    *[operand_list[idx]._data[term] for idx, term in enumerate(inputs)],
-                    optimize=settings.optimize_einsum,
-                )
+                arrays = [operands[idx]._data[term] for idx, term in enumerate(inputs)]
             except KeyError:
                 continue
+            shapes = tuple(tuple(np.shape(array)) for array in arrays)
+            if "->" in einsum and "." not in einsum and _prefers_sparse(*arrays):
+                result = _sparse_einsum(einsum, shapes, arrays)
+            else:
+                if not uses_sparse:
+                    arrays = [_as_dense(array) for array in arrays]
+                # the planned contraction gets cached for repeated use with the same operand shapes
+                expression = get_einsum_expression(
+                    einsum, *shapes, optimize=settings.optimize_einsum
+                )
+                result = expression(*arrays)
             if output in new_data:
-                new_data += result
+                new_data[output] = _accumulate(new_data[output], result)
             else:
                 new_data[output] = result
 
         return cls(new_data, validate=validate)
+
+
+def _schwarz_factor(two_body: ARRAY_TYPE) -> np.ndarray:
+    """Returns the Schwarz factors ``Q[p, s] = sqrt(|g[p, p, s, s]|)`` of physicist-ordered integrals.
+
+    Args:
+        two_body: the two-body integrals in physicists' order.
+
+    Returns:
+        The matrix of Schwarz factors.
+    """
+    if isinstance(two_body, SparseArray):
+        coo = two_body.asformat("coo")
+        coords = coo.coords
+        diagonal = (coords[0] == coords[1]) & (coords[2] == coords[3])
+        factors = np.zeros(two_body.shape[1:3])
+        factors[coords[0, diagonal], coords[2, diagonal]] = np.sqrt(np.abs(coo.data[diagonal]))
+        return factors
+    return np.sqrt(np.abs(np.einsum("ppss->ps", np.asarray(two_body))))
+
+
+def _screen_array(
+    array: ARRAY_TYPE,
+    threshold: float,
+    schwarz_factors: tuple[np.ndarray, np.ndarray] | None,
+    sparse_density: float,
+) -> tuple[ARRAY_TYPE, float]:
+    """Screens a single matrix, returning it along with a bound on the discarded absolute sum.
+
+    With ``schwarz_factors`` ``(Q1, Q2)`` the element ``[p, q, r, s]`` is bounded by
+    ``Q1[p, s] * Q2[q, r]``. For dense arrays only the elements of significant index pairs get
+    inspected; the skipped ones contribute their Schwarz bound to the reported error.
+    """
+    shape = array.shape
+    error = 0.0
+    if isinstance(array, SparseArray):
+        coo = array.asformat("coo")
+        coords, data = coo.coords, coo.data
+        keep = np.abs(data) >= threshold
+        if schwarz_factors is not None:
+            first, second = schwarz_factors
+            keep &= first[coords[0], coords[3]] * second[coords[1], coords[2]] >= threshold
+        error = float(np.sum(np.abs(data[~keep])))
+        coords, data = coords[:, keep], data[keep]
+    elif schwarz_factors is not None:
+        first, second = schwarz_factors
+        # a pair is significant, if any of its elements can reach the threshold
+        pairs_1 = np.nonzero(first * np.max(second, initial=0.0) >= threshold)
+        pairs_2 = np.nonzero(second * np.max(first, initial=0.0) >= threshold)
+        sum_1, sum_2 = np.sum(first), np.sum(second)
+        error = float(sum_1 * sum_2 - np.sum(first[pairs_1]) * np.sum(second[pairs_2]))
+        p_idx, s_idx = (idx[:, None] for idx in pairs_1)
+        q_idx, r_idx = (idx[None, :] for idx in pairs_2)
+        values = np.asarray(array)[p_idx, q_idx, r_idx, s_idx]
+        keep = np.abs(values) >= threshold
+        error += float(np.sum(np.abs(values[~keep])))
+        rows, cols = np.nonzero(keep)
+        coords = np.stack([pairs_1[0][rows], pairs_2[0][cols], pairs_2[1][cols], pairs_1[1][rows]])
+        data = values[keep]
+    else:
+        array = np.asarray(array)
+        keep = np.abs(array) >= threshold
+        error = float(np.sum(np.abs(array[~keep])))
+        coords = np.stack(np.nonzero(keep))
+        data = array[keep]
+
+    if _optionals.HAS_SPARSE and (
+        isinstance(array, SparseArray) or data.size <= sparse_density * np.prod(shape)
+    ):
+        return COO(coords, data, shape=shape), error
+
+    dense = np.zeros(shape, dtype=data.dtype)
+    dense[tuple(coords)] = data
+    return dense, error
+
+
+def _density(array: ARRAY_TYPE | Number) -> float:
+    """Returns the fraction of non-zero elements of an array."""
+    size = np.size(array)
+    if size == 0:
+        return 0.0
+    if isinstance(array, SparseArray):
+        return array.nnz / size
+    return np.count_nonzero(array) / size
+
+
+def _prefers_sparse(*arrays: ARRAY_TYPE | Number) -> bool:
+    """Returns whether an operation on these arrays should be carried out in sparse format.
+
+    This is the case when any of the arrays is a sparse array which is no denser than
+    :attr:`qiskit_nature.settings.sparse_density_threshold`.
+    """
+    return any(
+        isinstance(array, SparseArray)
+        and np.ndim(array) > 0
+        and _density(array) <= settings.sparse_density_threshold
+        for array in arrays
+    )
+
+
+def _as_dense(array: ARRAY_TYPE | Number) -> np.ndarray | Number:
+    if isinstance(array, SparseArray):
+        return array.todense()
+    return array
+
+
+def _as_coo(array: ARRAY_TYPE | Number) -> COO:
+    if isinstance(array, COO):
+        return array
+    if isinstance(array, SparseArray):
+        return array.asformat("coo")
+    return COO.from_numpy(np.asarray(array))
+
+
+def _compact(array: ARRAY_TYPE | Number) -> ARRAY_TYPE | Number:
+    """Converts a sparse result which is denser than the sparse density threshold to a dense one."""
+    if isinstance(array, SparseArray) and (
+        np.ndim(array) == 0 or _density(array) > settings.sparse_density_threshold
+    ):
+        return array.todense()
+    return array
+
+
+def _accumulate(total: ARRAY_TYPE | Number, term: ARRAY_TYPE | Number) -> ARRAY_TYPE | Number:
+    """Adds two arrays, falling back to dense storage when only one of them is sparse."""
+    if isinstance(total, SparseArray) != isinstance(term, SparseArray):
+        return _as_dense(total) + _as_dense(term)
+    return total + term
+
+
+def _sparse_outer(amat: ARRAY_TYPE | Number, bmat: ARRAY_TYPE | Number) -> ARRAY_TYPE | Number:
+    """Returns the outer product of two arrays, at least one of which is sparse."""
+    if np.ndim(amat) == 0:
+        return np.asarray(_as_dense(amat))[()] * bmat
+    if np.ndim(bmat) == 0:
+        return amat * np.asarray(_as_dense(bmat))[()]
+    return sp.tensordot(_as_coo(amat), _as_coo(bmat), axes=0)
+
+
+def _embed_sparse(array: ARRAY_TYPE | Number, sector: int) -> ARRAY_TYPE | Number:
+    """Embeds an array into the diagonal ``sector`` of an array with every dimension doubled.
+
+    This is the sparse equivalent of ``np.kron(ones, array)`` where ``ones`` is a ``(2,) * ndim``
+    array whose only non-zero element is a one at index ``(sector,) * ndim``. Scalars are returned
+    unchanged.
+    """
+    if np.ndim(array) == 0:
+        return array
+    coo = _as_coo(array)
+    shape = np.asarray(coo.shape, dtype=np.intp)
+    coords = coo.coords + sector * shape[:, None]
+    return COO(coords, coo.data, shape=tuple(2 * shape), has_duplicates=False)
+
+
+def _sparse_einsum(
+    subscripts: str, shapes: tuple[tuple[int, ...], ...], arrays: Sequence[ARRAY_TYPE | Number]
+) -> ARRAY_TYPE | Number:
+    """Evaluates an einsum contraction pairwise without converting sparse operands to dense ones.
+
+    The pairwise contraction order is planned by :func:`numpy.einsum_path`. Pairs of dense operands
+    are contracted with :func:`numpy.einsum`, all other pairs with :func:`sparse.tensordot` (or
+    :func:`sparse.einsum` if the pair cannot be expressed as a tensor dot product). Intermediate
+    results which are denser than the sparse density threshold continue as dense arrays.
+    """
+    operands = list(arrays)
+    for idx_a, idx_b, term_a, term_b, term_out in _sparse_einsum_plan(
+        subscripts, shapes, settings.optimize_einsum
+    ):
+        if idx_b is None:
+            array = operands.pop(idx_a)
+            if isinstance(array, SparseArray):
+                result = sp.einsum(f"{term_a}->{term_out}", array)
+            else:
+                result = np.einsum(f"{term_a}->{term_out}", array)
+            operands.append(_compact(result))
+            continue
+
+        array_b = operands.pop(idx_b)
+        array_a = operands.pop(idx_a)
+        operands.append(_contract_pair(term_a, array_a, term_b, array_b, term_out))
+
+    (result,) = operands
+    return _compact(result)
+
+
+def _contract_pair(
+    term_a: str,
+    array_a: ARRAY_TYPE | Number,
+    term_b: str,
+    array_b: ARRAY_TYPE | Number,
+    term_out: str,
+) -> ARRAY_TYPE | Number:
+    if not isinstance(array_a, SparseArray) and not isinstance(array_b, SparseArray):
+        return np.einsum(f"{term_a},{term_b}->{term_out}", array_a, array_b)
+
+    shared = set(term_a) & set(term_b)
+    if (
+        len(set(term_a)) == len(term_a)
+        and len(set(term_b)) == len(term_b)
+        and set(term_out) == set(term_a) ^ set(term_b)
+    ):
+        axes = (
+            [term_a.index(idx) for idx in sorted(shared)],
+            [term_b.index(idx) for idx in sorted(shared)],
+        )
+        result = sp.tensordot(array_a, array_b, axes=axes)
+        kept = [idx for idx in term_a if idx not in shared] + [
+            idx for idx in term_b if idx not in shared
+        ]
+        if kept != list(term_out):
+            result = result.transpose([kept.index(idx) for idx in term_out])
+    else:
+        result = sp.einsum(f"{term_a},{term_b}->{term_out}", array_a, array_b)
+
+    return _compact(result)
+
+
+@lru_cache(maxsize=128)
+def _sparse_einsum_plan(
+    subscripts: str, shapes: tuple[tuple[int, ...], ...], optimize: bool
+) -> list[tuple[int, int | None, str, str, str]]:
+    """Plans the pairwise evaluation of an einsum contraction.
+
+    Each step of the returned plan is a tuple ``(idx_a, idx_b, term_a, term_b, term_out)``. The
+    operands at positions ``idx_a < idx_b`` get removed from the list of operands and the result of
+    contracting them into ``term_out`` gets appended to it. A leading single-operand step (with
+    ``idx_b`` set to ``None``) reduces an operand on its own.
+    """
+    inputs, output = subscripts.replace(" ", "").split("->")
+    terms = inputs.split(",")
+
+    steps: list[tuple[int, int | None, str, str, str]] = []
+    if len(terms) == 1:
+        steps.append((0, None, terms[0], "", output))
+        return steps
+
+    if optimize:
+        dummies = [np.broadcast_to(0.0, shape) for shape in shapes]
+        path, _ = np.einsum_path(subscripts, *dummies, optimize="greedy")
+        pairs = [tuple(sorted(pair)) for pair in path[1:]]
+    else:
+        pairs = [(0, 1)] * (len(terms) - 1)
+
+    for pair in pairs:
+        if len(pair) == 1:
+            (idx,) = pair
+            term = terms.pop(idx)
+            needed = set(output).union(*terms)
+            reduced = "".join(dict.fromkeys(idx for idx in term if idx in needed))
+            terms.append(reduced)
+            steps.append((idx, None, term, "", reduced))
+            continue
+        idx_a, idx_b = pair
+        term_b = terms.pop(idx_b)
+        term_a = terms.pop(idx_a)
+        needed = set(output).union(*terms)
+        term_out = "".join(dict.fromkeys(idx for idx in term_a + term_b if idx in needed))
+        if not terms:
+            term_out = output
+        terms.append(term_out)
+        steps.append((idx_a, idx_b, term_a, term_b, term_out))
+
+    return steps
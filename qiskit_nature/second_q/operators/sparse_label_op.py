@@ -20,6 +20,7 @@ from numbers import Complex
 from typing import Iterator, Sequence, Union
 
 import cmath
+import hashlib
 import numpy as np
 from qiskit.circuit import ParameterExpression
 from qiskit.quantum_info.operators.mixins import (
@@ -359,6 +360,71 @@ class SparseLabelOp(LinearMixin, AdjointMixin, GroupMixin, TolerancesMixin, ABC,
 
         return self._data == other._data
 
+    def fingerprint(self, atol: float | None = None, *, exact: bool = False) -> str:
+        """Returns a stable structural hash of this operator.
+
+        The fingerprint is independent of the order in which the terms are stored and is
+        tolerance-aware: the real and imaginary parts of every coefficient are quantized to integer
+        multiples of ``atol`` before hashing and terms which quantize to zero are ignored. Thus, two
+        operators which only differ in the order of their terms or by numerical noise below ``atol``
+        will (barring values which fall right onto a quantization boundary) share the same
+        fingerprint. Parameterized coefficients are included through their string representation.
+
+        With ``exact=True`` the coefficients are hashed without any quantization and no terms are
+        ignored, such that only operators with identical terms share the same fingerprint. This
+        is required wherever the fingerprint identifies results which must be exact for their input,
+        such as the cached mappings of a
+        :class:`~qiskit_nature.second_q.mappers.QubitMapper`.
+
+        Unlike Python's built-in ``hash`` of strings, the fingerprint is stable across interpreter
+        sessions and processes, which makes it suitable as a cache key. The fingerprint is not
+        memoized on the instance, because metadata like the ``num_spin_orbitals`` of a
+        :class:`~qiskit_nature.second_q.operators.FermionicOp` may still be changed after
+        construction.
+
+        Args:
+            atol: the quantization tolerance. If ``None``, :attr:`atol` will be used. This is
+                ignored when ``exact`` is set.
+            exact: whether to hash the coefficients exactly rather than quantizing them.
+
+        Returns:
+            The hexadecimal digest identifying this operator.
+        """
+        atol = None if exact else atol if atol is not None else self.atol
+
+        terms = []
+        for key, value in self._data.items():
+            if isinstance(value, ParameterExpression):
+                terms.append((key, str(value)))
+                continue
+            value = complex(value)
+            if atol is None:
+                terms.append((key, (value.real, value.imag)))
+                continue
+            quantized = (round(value.real / atol), round(value.imag / atol))
+            if quantized == (0, 0):
+                continue
+            terms.append((key, quantized))
+        terms.sort(key=lambda term: term[0])
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((self.__class__.__name__, self._fingerprint_metadata())).encode())
+        for term in terms:
+            digest.update(repr(term).encode())
+        return digest.hexdigest()
+
+    def _fingerprint_metadata(self) -> tuple:
+        """Returns the non-term data which distinguishes operators of this type.
+
+        Subclasses carrying additional information which affects the meaning of their terms (for
+        example the spin value of a :class:`~qiskit_nature.second_q.operators.SpinOp`) should
+        overwrite this method such that it is taken into account by :meth:`fingerprint`.
+
+        Returns:
+            A tuple of hashable data.
+        """
+        return (self.register_length,)
+
     def __getitem__(self, __k: str) -> _TCoeff:
         """Get the requested element of the ``SparseLabelOp``."""
         return self._data.__getitem__(__k)
@@ -232,6 +232,9 @@ class SpinOp(SparseLabelOp):
     def register_length(self) -> int | None:
         return self.num_spins
 
+    def _fingerprint_metadata(self) -> tuple:
+        return (self.num_spins, str(self.spin))
+
     def _new_instance(self, data: Mapping[str, _TCoeff], *, other: SpinOp | None = None) -> SpinOp:
         num_s = self.num_spins
         spin = self.spin
@@ -224,6 +224,9 @@ class VibrationalOp(SparseLabelOp):
     def register_length(self) -> int | None:
         return sum(self.num_modals) if self.num_modals is not None else None
 
+    def _fingerprint_metadata(self) -> tuple:
+        return (tuple(self.num_modals) if self.num_modals is not None else None,)
+
     def _new_instance(
         self, data: Mapping[str, _TCoeff], *, other: VibrationalOp | None = None
     ) -> VibrationalOp:
@@ -286,35 +289,55 @@ class VibrationalOp(SparseLabelOp):
         cls._validate_polynomial_tensor_key(tensor.keys())
 
         data: dict[str, _TCoeff] = {}
-
-        def _reshape_index(index):
-            new_index = []
-            for idx in range(0, len(index), 3):
-                new_index.extend([index[idx], index[idx + 1], index[idx], index[idx + 2]])
-            return new_index
+        index_arrays: dict[int, tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+        num_modals = np.zeros(0, dtype=int)
 
         for key in tensor:
             if key == "":
                 # TODO: deal with complexity
                 data[""] = cast(float, tensor[key])
+                index_arrays[0] = (
+                    np.zeros((1, 0), dtype=bool),
+                    np.zeros((1, 0), dtype=int),
+                    np.zeros((1, 0), dtype=int),
+                    np.asarray([data[""]]),
+                )
                 continue
 
-            label_template = " ".join(f"{op}_{{}}_{{}}" for op in key.replace("_", ""))
-
             mat = tensor[key]
             if isinstance(mat, np.ndarray):
-                for index in np.ndindex(*mat.shape):
-                    data[label_template.format(*_reshape_index(index))] = mat[index]
+                coords = np.indices(mat.shape).reshape((mat.ndim, -1))
+                values = mat.ravel()
             else:
                 _optionals.HAS_SPARSE.require_now("SparseArray")
                 import sparse as sp  # pylint: disable=import-error
 
-                if isinstance(mat, sp.SparseArray):
-                    coo = sp.as_coo(mat)
-                    for value, *index in zip(coo.data, *coo.coords):
-                        data[label_template.format(*_reshape_index(index))] = value
-
-        return cls(data)
+                if not isinstance(mat, sp.SparseArray):
+                    continue
+                coo = sp.as_coo(mat)
+                coords, values = coo.coords, coo.data
+
+            # each (mode, modal_1, modal_2) index triple expands into "+_mode_modal_1 -_mode_modal_2"
+            n_body = len(key) // 3
+            triples = coords.reshape((n_body, 3, -1))
+            modes = np.repeat(triples[:, 0], 2, axis=0).T
+            modals = triples[:, 1:].reshape((2 * n_body, -1)).T
+            creation = np.broadcast_to(np.tile([True, False], n_body), modes.shape)
+
+            label_template = " ".join(["+_%d_%d -_%d_%d"] * n_body)
+            labels = np.stack((modes, modals), axis=2).reshape((modes.shape[0], -1))
+            data.update(zip((label_template % tuple(index) for index in labels.tolist()), values))
+            index_arrays[2 * n_body] = (creation, modes, modals, values)
+
+            if modes.size > 0:
+                if modes.max() >= num_modals.size:
+                    num_modals = np.pad(num_modals, (0, modes.max() + 1 - num_modals.size))
+                np.maximum.at(num_modals, modes.ravel(), modals.ravel() + 1)
+
+        op = cls(data, num_modals=num_modals.tolist(), copy=False)
+        # the index arrays are already known and do not need to be parsed from the labels again
+        op.__dict__["_index_array_cache"] = index_arrays
+        return op
 
     def __repr__(self) -> str:
         data_str = f"{dict(self.items())}"
@@ -352,6 +375,46 @@ class VibrationalOp(SparseLabelOp):
             terms = [self._build_register_label(lbl, partial_sum_modals) for lbl in label.split()]
             yield (terms, self[label])
 
+    def _index_arrays(self) -> dict[int, tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]]:
+        """Returns the terms of this operator as arrays, grouped by their number of operators.
+
+        This allows vectorized consumers (like the :class:`~.DirectMapper`) to process the terms
+        without parsing every label individually. Operators constructed via
+        :meth:`from_polynomial_tensor` already provide these arrays; for all others they are parsed
+        from the labels once. Since operators are not modified in-place, the result is cached.
+
+        Returns:
+            A dictionary mapping the number of operators in a term, ``L``, to a tuple of four
+            arrays: the ``(T, L)`` boolean array indicating the creation operators, the ``(T, L)``
+            arrays of the mode and modal indices, and the ``(T,)`` array of coefficients, where
+            ``T`` is the number of terms of length ``L``.
+        """
+        index_arrays = self.__dict__.get("_index_array_cache", None)
+        if index_arrays is not None:
+            return index_arrays
+
+        groups: dict[int, tuple[list[str], list[_TCoeff]]] = defaultdict(lambda: ([], []))
+        for label, coeff in self._data.items():
+            split_label = label.split()
+            labels, coeffs = groups[len(split_label)]
+            labels.extend(split_label)
+            coeffs.append(coeff)
+
+        index_arrays = {}
+        for length, (labels, coeffs) in groups.items():
+            parts = np.asarray([lbl.split("_") for lbl in labels], dtype=str).reshape(
+                (len(coeffs), length, 3)
+            )
+            index_arrays[length] = (
+                parts[:, :, 0] == "+",
+                parts[:, :, 1].astype(int),
+                parts[:, :, 2].astype(int),
+                np.asarray(coeffs),
+            )
+
+        self.__dict__["_index_array_cache"] = index_arrays
+        return index_arrays
+
     def _build_register_label(self, label: str, partial_sum_modals: list[int]) -> tuple[str, int]:
         op, mode_index, modal_index = label.split("_")
         index = partial_sum_modals[int(mode_index)] + int(modal_index)
@@ -131,3 +131,106 @@ class VibrationalBasis(ABC):
                 # update the matrix in all permuted locations
                 for i in product(*index_permutations):
                     yield (coeff, tuple(chain(*i)))
+
+    def _map_arrays(
+        self, coefficients: np.ndarray, modes: np.ndarray
+    ) -> dict[int, tuple[np.ndarray, np.ndarray]]:
+        """Maps many coefficients to this second-quantization basis at once.
+
+        This is the vectorized variant of :meth:`map`. The integrals of every mode get evaluated
+        once per power and kind of term, after which the expansion into modals is done with array
+        operations for all coefficients sharing the same pattern of mode powers.
+
+        Args:
+            coefficients: the 1D array of coefficients.
+            modes: the 2D array of mode indices, one row per coefficient. Rows whose indices are
+                all negative belong to kinetic terms.
+
+        Returns:
+            A dictionary mapping the number of distinct modes (the n-body order) to the pair of
+            index array (with ``3 * n`` rows of ``(mode, modal_1, modal_2, ...)`` indices) and the
+            array of integral values. The same index may occur multiple times, in which case the
+            values need to be summed.
+        """
+        kinetic = np.any(modes < 0, axis=1)
+        modes = np.abs(modes)
+
+        # the number of times which an index occurs corresponds to the power of the operator and
+        # the modes are expanded in the order of their first occurrence
+        first = np.ones(modes.shape, dtype=bool)
+        powers = np.zeros(modes.shape, dtype=int)
+        for j in range(modes.shape[1]):
+            first[:, j] = ~np.any(modes[:, :j] == modes[:, j : j + 1], axis=1)
+            powers[:, j] = np.sum(modes == modes[:, j : j + 1], axis=1)
+        order = np.argsort(~first, axis=1, kind="stable")
+        distinct_modes = np.take_along_axis(modes, order, axis=1)
+        distinct_powers = np.take_along_axis(np.where(first, powers, 0), order, axis=1)
+
+        tables: dict[tuple[int, bool], tuple[np.ndarray, ...]] = {}
+
+        def table(power: int, kinetic_term: bool) -> tuple[np.ndarray, ...]:
+            # the non-negligible integrals of all modes, with a row-pointer into them per mode
+            key = (power, kinetic_term)
+            if key not in tables:
+                modal_1: list[int] = []
+                modal_2: list[int] = []
+                integrals: list[complex] = []
+                counts: list[int] = []
+                for mode, num_modals in enumerate(self.num_modals):
+                    num_entries = len(integrals)
+                    for m, n in zip(*np.tril_indices(num_modals)):
+                        integral = self.eval_integral(
+                            mode, int(m), int(n), power, kinetic_term=kinetic_term
+                        )
+                        if integral is None:
+                            continue
+                        modal_1.append(m)
+                        modal_2.append(n)
+                        integrals.append(integral)
+                        if m != n:
+                            modal_1.append(n)
+                            modal_2.append(m)
+                            integrals.append(integral)
+                    counts.append(len(integrals) - num_entries)
+                counts_arr = np.asarray(counts, dtype=int)
+                tables[key] = (
+                    np.asarray(modal_1, dtype=int),
+                    np.asarray(modal_2, dtype=int),
+                    np.asarray(integrals, dtype=complex),
+                    np.cumsum(counts_arr) - counts_arr,
+                    counts_arr,
+                )
+            return tables[key]
+
+        results: dict[int, tuple[list[np.ndarray], list[np.ndarray]]] = {}
+        patterns, group = np.unique(
+            np.column_stack((distinct_powers, kinetic)), axis=0, return_inverse=True
+        )
+        for pattern_index, pattern in enumerate(patterns):
+            terms = np.flatnonzero(group.ravel() == pattern_index)
+            pattern_powers = pattern[:-1][pattern[:-1] > 0]
+            values = coefficients[terms].astype(complex)
+            coords: list[np.ndarray] = []
+            for level, power in enumerate(pattern_powers):
+                mode = distinct_modes[terms, level] - 1
+                modal_1, modal_2, integrals, pointers, counts = table(int(power), bool(pattern[-1]))
+                # expand every term into all non-negligible integrals of its mode
+                term_counts = counts[mode]
+                repeat = np.repeat(np.arange(len(terms)), term_counts)
+                entry = np.arange(term_counts.sum()) - np.repeat(
+                    np.cumsum(term_counts) - term_counts, term_counts
+                )
+                entry += np.repeat(pointers[mode], term_counts)
+                terms = terms[repeat]
+                values = values[repeat] * integrals[entry]
+                coords = [coord[repeat] for coord in coords]
+                coords += [mode[repeat], modal_1[entry], modal_2[entry]]
+
+            coords_list, values_list = results.setdefault(len(pattern_powers), ([], []))
+            coords_list.append(np.asarray(coords, dtype=int).reshape((len(coords), -1)))
+            values_list.append(values)
+
+        return {
+            n_body: (np.concatenate(coords_list, axis=1), np.concatenate(values_list))
+            for n_body, (coords_list, values_list) in results.items()
+        }
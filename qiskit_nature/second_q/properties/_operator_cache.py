@@ -0,0 +1,34 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The cache shared by the operator factories of the properties."""
+
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable, Hashable
+
+from qiskit_nature.second_q.operators import FermionicOp, OperatorCache
+
+# the operators of the properties only depend on their (few) attributes, so we can avoid rebuilding
+# them whenever a new problem instance with the same system size is constructed
+PROPERTY_OPERATOR_CACHE = OperatorCache(maxsize=64)
+
+
+def cached_operator(key: Hashable, builder: Callable[[], FermionicOp]) -> FermionicOp:
+    """Returns a copy of the cached operator stored under ``key``, building it first if necessary.
+
+    The cached instance is never handed out, since changing its attributes (for example its
+    ``num_spin_orbitals``) would otherwise leak into all later users. A shallow copy suffices
+    because the terms of an operator are never modified in place.
+    """
+    return copy.copy(PROPERTY_OPERATOR_CACHE.get_or_build(key, builder))
@@ -16,14 +16,14 @@ from __future__ import annotations
 
 from typing import Mapping
 
-import itertools
-
 import numpy as np
 
 import qiskit_nature  # pylint: disable=unused-import
 from qiskit_nature.second_q.operators import FermionicOp, PolynomialTensor
 from qiskit_nature.second_q.operators.tensor_ordering import IndexType, to_physicist_ordering
 
+from ._operator_cache import cached_operator
+
 
 class AngularMomentum:
     """The AngularMomentum property.
@@ -48,6 +48,10 @@ class AngularMomentum:
         Returns:
             A mapping of strings to `FermionicOp` objects.
         """
+        op = cached_operator((self.__class__, self.num_spatial_orbitals), self._build_second_q_op)
+        return {self.__class__.__name__: op}
+
+    def _build_second_q_op(self) -> FermionicOp:
         x_h1, x_h2 = _calc_s_x_squared_ints(self.num_spatial_orbitals)
         y_h1, y_h2 = _calc_s_y_squared_ints(self.num_spatial_orbitals)
         z_h1, z_h2 = _calc_s_z_squared_ints(self.num_spatial_orbitals)
@@ -58,9 +62,7 @@ class AngularMomentum:
             {"+-": h_1, "++--": to_physicist_ordering(h_2, index_order=IndexType.CHEMIST)}
         )
 
-        op = FermionicOp.from_polynomial_tensor(tensor).simplify()
-
-        return {self.__class__.__name__: op}
+        return FermionicOp.from_polynomial_tensor(tensor).simplify()
 
     def interpret(
         self, result: "qiskit_nature.second_q.problems.EigenstateResult"  # type: ignore[name-defined]
@@ -89,141 +91,57 @@ class AngularMomentum:
 
 
 def _calc_s_x_squared_ints(num_spatial_orbitals: int) -> tuple[np.ndarray, np.ndarray]:
-    return _calc_squared_ints(
-        num_spatial_orbitals, _modify_s_x_squared_ints_neq, _modify_s_x_squared_ints_eq
-    )
+    return _calc_squared_ints(num_spatial_orbitals, _S_X_SQUARED_NEQ, _S_X_SQUARED_EQ)
 
 
 def _calc_s_y_squared_ints(num_spatial_orbitals: int) -> tuple[np.ndarray, np.ndarray]:
-    return _calc_squared_ints(
-        num_spatial_orbitals, _modify_s_y_squared_ints_neq, _modify_s_y_squared_ints_eq
-    )
+    return _calc_squared_ints(num_spatial_orbitals, _S_Y_SQUARED_NEQ, _S_Y_SQUARED_EQ)
 
 
 def _calc_s_z_squared_ints(num_spatial_orbitals: int) -> tuple[np.ndarray, np.ndarray]:
-    return _calc_squared_ints(
-        num_spatial_orbitals, _modify_s_z_squared_ints_neq, _modify_s_z_squared_ints_eq
-    )
+    return _calc_squared_ints(num_spatial_orbitals, _S_Z_SQUARED_NEQ, _S_Z_SQUARED_EQ)
 
 
 def _calc_squared_ints(
-    num_spatial_orbitals: int, func_neq, func_eq
+    num_spatial_orbitals: int, spin_neq: np.ndarray, spin_eq: np.ndarray
 ) -> tuple[np.ndarray, np.ndarray]:
     # calculates 1- and 2-body integrals for a given angular momentum axis (x or y or z,
-    # specified by func_neq and func_eq)
+    # specified by spin_neq and spin_eq). The 2-body integrals (in chemist ordering) only couple the
+    # spatial orbitals (p, p, q, q); the values for the spin indices of these elements are given by
+    # spin_neq for p != q and by spin_eq for p == q.
     num_spin_orbitals = 2 * num_spatial_orbitals
-    h_1 = np.zeros((num_spin_orbitals, num_spin_orbitals))
-    h_2 = np.zeros((num_spin_orbitals, num_spin_orbitals, num_spin_orbitals, num_spin_orbitals))
-
-    # pylint: disable=invalid-name
-    for p, q in itertools.product(range(num_spatial_orbitals), repeat=2):
-        if p != q:
-            h_2 = func_neq(h_2, p, q, num_spatial_orbitals)
-        else:
-            h_2 = func_eq(h_2, p, num_spatial_orbitals)
-            h_1[p, p] += 1.0
-            h_1[p + num_spatial_orbitals, p + num_spatial_orbitals] += 1.0
-    h_1 *= 0.25
-    h_2 *= 0.25
+    # the spin-orbital index is spin * num_spatial_orbitals + spatial orbital
+    h_2 = np.zeros((2, num_spatial_orbitals) * 4)
+    off_diagonal = 1.0 - np.eye(num_spatial_orbitals)
+    # np.einsum returns writeable views onto the (p, p, q, q) and (p, p, p, p) elements
+    np.einsum("apbpcqdq->abcdpq", h_2)[:] = np.einsum("abcd,pq->abcdpq", spin_neq, off_diagonal)
+    np.einsum("apbpcpdp->abcdp", h_2)[:] = spin_eq[..., np.newaxis]
+    h_2 = 0.25 * h_2.reshape((num_spin_orbitals,) * 4)
+    h_1 = 0.25 * np.eye(num_spin_orbitals)
     return h_1, h_2
 
 
-def _modify_s_x_squared_ints_neq(
-    h_2: np.ndarray, p_ind: int, q_ind: int, num_spatial_orbitals: int
-) -> np.ndarray:
-    indices = [
-        (p_ind, p_ind + num_spatial_orbitals, q_ind, q_ind + num_spatial_orbitals),
-        (p_ind + num_spatial_orbitals, p_ind, q_ind, q_ind + num_spatial_orbitals),
-        (p_ind, p_ind + num_spatial_orbitals, q_ind + num_spatial_orbitals, q_ind),
-        (p_ind + num_spatial_orbitals, p_ind, q_ind + num_spatial_orbitals, q_ind),
-    ]
-    values = [1, 1, 1, 1]
-    # adds provided values to values of 2-body integrals (x axis of angular momentum) at given
-    # indices in case p not equal to q
-    return _add_values_to_s_squared_ints(h_2, indices, values)
-
-
-def _modify_s_x_squared_ints_eq(
-    h_2: np.ndarray, p_ind: int, num_spatial_orbitals: int
-) -> np.ndarray:
-    indices = [
-        (p_ind, p_ind + num_spatial_orbitals, p_ind, p_ind + num_spatial_orbitals),
-        (p_ind + num_spatial_orbitals, p_ind, p_ind + num_spatial_orbitals, p_ind),
-        (p_ind, p_ind, p_ind + num_spatial_orbitals, p_ind + num_spatial_orbitals),
-        (p_ind + num_spatial_orbitals, p_ind + num_spatial_orbitals, p_ind, p_ind),
-    ]
-    values = [-1, -1, -1, -1]
-    # adds provided values to values of 2-body integrals (x axis of angular momentum) at given
-    # indices in case p equal to q
-    return _add_values_to_s_squared_ints(h_2, indices, values)
-
-
-def _modify_s_y_squared_ints_neq(
-    h_2: np.ndarray, p_ind: int, q_ind: int, num_spatial_orbitals: int
-) -> np.ndarray:
-    indices = [
-        (p_ind, p_ind + num_spatial_orbitals, q_ind, q_ind + num_spatial_orbitals),
-        (p_ind + num_spatial_orbitals, p_ind, q_ind, q_ind + num_spatial_orbitals),
-        (p_ind, p_ind + num_spatial_orbitals, q_ind + num_spatial_orbitals, q_ind),
-        (p_ind + num_spatial_orbitals, p_ind, q_ind + num_spatial_orbitals, q_ind),
-    ]
-    values = [-1, 1, 1, -1]
-    # adds provided values to values of 2-body integrals (y axis of angular momentum) at given
-    # indices in case p not equal to q
-    return _add_values_to_s_squared_ints(h_2, indices, values)
-
-
-def _modify_s_y_squared_ints_eq(
-    h_2: np.ndarray, p_ind: int, num_spatial_orbitals: int
-) -> np.ndarray:
-    indices = [
-        (p_ind, p_ind + num_spatial_orbitals, p_ind, p_ind + num_spatial_orbitals),
-        (p_ind + num_spatial_orbitals, p_ind, p_ind + num_spatial_orbitals, p_ind),
-        (p_ind, p_ind, p_ind + num_spatial_orbitals, p_ind + num_spatial_orbitals),
-        (p_ind + num_spatial_orbitals, p_ind + num_spatial_orbitals, p_ind, p_ind),
-    ]
-    values = [1, 1, -1, -1]
-    # adds provided values to values of 2-body integrals (y axis of angular momentum) at given
-    # indices in case p equal to q
-    return _add_values_to_s_squared_ints(h_2, indices, values)
-
-
-def _modify_s_z_squared_ints_neq(
-    h_2: np.ndarray, p_ind: int, q_ind: int, num_spatial_orbitals: int
-) -> np.ndarray:
-    indices = [
-        (p_ind, p_ind, q_ind, q_ind),
-        (p_ind + num_spatial_orbitals, p_ind + num_spatial_orbitals, q_ind, q_ind),
-        (p_ind, p_ind, q_ind + num_spatial_orbitals, q_ind + num_spatial_orbitals),
-        (
-            p_ind + num_spatial_orbitals,
-            p_ind + num_spatial_orbitals,
-            q_ind + num_spatial_orbitals,
-            q_ind + num_spatial_orbitals,
-        ),
-    ]
-    values = [1, -1, -1, 1]
-    # adds provided values to values of 2-body integrals (z axis of angular momentum) at given
-    # indices in case p not equal to q
-    return _add_values_to_s_squared_ints(h_2, indices, values)
-
-
-def _modify_s_z_squared_ints_eq(
-    h_2: np.ndarray, p_ind: int, num_spatial_orbitals: int
-) -> np.ndarray:
-    indices = [
-        (p_ind, p_ind + num_spatial_orbitals, p_ind + num_spatial_orbitals, p_ind),
-        (p_ind + num_spatial_orbitals, p_ind, p_ind, p_ind + num_spatial_orbitals),
-    ]
-    values = [1, 1]
-    # adds provided values to values of 2-body integrals (z axis of angular momentum) at given
-    # indices in case p equal to q
-    return _add_values_to_s_squared_ints(h_2, indices, values)
-
-
-def _add_values_to_s_squared_ints(
-    h_2: np.ndarray, indices: list[tuple[int, int, int, int]], values: list[int]
-) -> np.ndarray:
-    for index, value in zip(indices, values):
-        h_2[index] += value
-    return h_2
+def _spin_block(entries: dict[tuple[int, int, int, int], float]) -> np.ndarray:
+    block = np.zeros((2, 2, 2, 2))
+    for index, value in entries.items():
+        block[index] = value
+    return block
+
+
+_PAULI_X = np.array([[0.0, 1.0], [1.0, 0.0]])
+_PAULI_Y = np.array([[0.0, -1.0j], [1.0j, 0.0]])
+_PAULI_Z = np.array([[1.0, 0.0], [0.0, -1.0]])
+
+# for p != q the 2-body terms are given by the outer products of the Pauli matrices
+_S_X_SQUARED_NEQ = np.einsum("ab,cd->abcd", _PAULI_X, _PAULI_X)
+_S_Y_SQUARED_NEQ = np.einsum("ab,cd->abcd", _PAULI_Y, _PAULI_Y).real
+_S_Z_SQUARED_NEQ = np.einsum("ab,cd->abcd", _PAULI_Z, _PAULI_Z)
+
+# for p == q the 2-body terms are complemented by the 1-body integrals
+_S_X_SQUARED_EQ = _spin_block(
+    {(0, 1, 0, 1): -1.0, (1, 0, 1, 0): -1.0, (0, 0, 1, 1): -1.0, (1, 1, 0, 0): -1.0}
+)
+_S_Y_SQUARED_EQ = _spin_block(
+    {(0, 1, 0, 1): 1.0, (1, 0, 1, 0): 1.0, (0, 0, 1, 1): -1.0, (1, 1, 0, 0): -1.0}
+)
+_S_Z_SQUARED_EQ = _spin_block({(0, 1, 1, 0): 1.0, (1, 0, 0, 1): 1.0})
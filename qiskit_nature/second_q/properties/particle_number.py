@@ -19,6 +19,8 @@ from typing import Mapping
 import qiskit_nature  # pylint: disable=unused-import
 from qiskit_nature.second_q.operators import FermionicOp
 
+from ._operator_cache import cached_operator
+
 
 class ParticleNumber:
     """The ParticleNumber property.
@@ -43,14 +45,16 @@ class ParticleNumber:
         Returns:
             A mapping of strings to `FermionicOp` objects.
         """
+        op = cached_operator((self.__class__, self.num_spatial_orbitals), self._build_second_q_op)
+        return {self.__class__.__name__: op}
+
+    def _build_second_q_op(self) -> FermionicOp:
         num_spin_orbitals = 2 * self.num_spatial_orbitals
-        op = FermionicOp(
+        return FermionicOp(
             {f"+_{o} -_{o}": 1.0 for o in range(num_spin_orbitals)},
             num_spin_orbitals=num_spin_orbitals,
         )
 
-        return {self.__class__.__name__: op}
-
     def interpret(
         self, result: "qiskit_nature.second_q.problems.EigenstateResult"  # type: ignore[name-defined]
     ) -> None:
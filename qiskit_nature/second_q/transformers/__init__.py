@@ -23,17 +23,20 @@ Transformers (:mod:`qiskit_nature.second_q.transformers`)
    BaseTransformer
    BasisTransformer
    ActiveSpaceTransformer
+   ActiveSpaceSession
    FreezeCoreTransformer
 """
 
 from .base_transformer import BaseTransformer
 from .basis_transformer import BasisTransformer
 from .active_space_transformer import ActiveSpaceTransformer
+from .active_space_session import ActiveSpaceSession
 from .freeze_core_transformer import FreezeCoreTransformer
 
 __all__ = [
     "BaseTransformer",
     "BasisTransformer",
     "ActiveSpaceTransformer",
+    "ActiveSpaceSession",
     "FreezeCoreTransformer",
 ]
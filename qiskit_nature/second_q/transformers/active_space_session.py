@@ -0,0 +1,187 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""The ActiveSpaceSession class."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from qiskit.utils import algorithm_globals
+
+from qiskit_nature.exceptions import QiskitNatureError
+from qiskit_nature.second_q.hamiltonians import CholeskyElectronicEnergy
+from qiskit_nature.second_q.operators import ElectronicIntegrals
+from qiskit_nature.second_q.problems import ElectronicStructureProblem
+
+from .active_space_transformer import ActiveSpaceTransformer, _fock
+
+# the session of a worker process, sent to it once by _init_worker
+_WORKER_SESSION: ActiveSpaceSession | None = None
+
+
+class ActiveSpaceSession:
+    """A session for reducing one problem to many different active spaces.
+
+    Scanning multiple active spaces with the :class:`.ActiveSpaceTransformer` repeatedly
+    evaluates the contributions of the same occupied orbitals to the inactive Fock operator. This
+    session computes the parts which are independent of the chosen active space only once per
+    problem: the total (diagonal) density of all occupied orbitals, its Fock operator and the MO
+    integrals. The inactive Fock operator of each candidate active space is then derived
+    incrementally, by subtracting the contributions of the few occupied orbitals inside of the
+    active space from the total Fock operator.
+
+    .. code-block:: python
+
+        from qiskit_nature.second_q.transformers import ActiveSpaceSession, ActiveSpaceTransformer
+
+        session = ActiveSpaceSession(problem)
+
+        reduced = session.transform(ActiveSpaceTransformer(2, 2))
+
+        candidates = [ActiveSpaceTransformer(2, num_orbs) for num_orbs in range(2, 6)]
+        reduced_problems = session.transform_many(candidates)
+    """
+
+    def __init__(self, problem: ElectronicStructureProblem) -> None:
+        """
+        Args:
+            problem: the problem which gets reduced to the various active spaces.
+        """
+        self._problem = problem
+        self._precomputed = False
+        self._integrals: ElectronicIntegrals | None = None
+        self._occupation: tuple[np.ndarray, np.ndarray] | None = None
+        self._fock: tuple[np.ndarray, np.ndarray] | None = None
+
+    @property
+    def problem(self) -> ElectronicStructureProblem:
+        """Returns the problem of this session."""
+        return self._problem
+
+    def transform(self, transformer: ActiveSpaceTransformer) -> ElectronicStructureProblem:
+        """Reduces the problem of this session to the active space of a transformer.
+
+        Args:
+            transformer: the transformer specifying the active space.
+
+        Returns:
+            The reduced problem, identical to ``transformer.transform(session.problem)``.
+        """
+        # pylint: disable=protected-access
+        return transformer._transform_electronic_structure_problem(self._problem, session=self)
+
+    def transform_many(
+        self,
+        transformers: Sequence[ActiveSpaceTransformer],
+        *,
+        num_processes: int | None = None,
+    ) -> list[ElectronicStructureProblem]:
+        """Reduces the problem of this session to the active spaces of multiple transformers.
+
+        The active-space independent parts are computed once before the reductions get distributed
+        over multiple processes. Each process receives this session only once, rather than once per
+        transformer.
+
+        Args:
+            transformers: the transformers specifying the active spaces.
+            num_processes: the maximum number of parallel processes. Defaults to
+                ``qiskit.utils.algorithm_globals.num_processes``. With a single process, all
+                reductions run sequentially in the current process.
+
+        Returns:
+            The list of reduced problems, in the order of ``transformers``.
+        """
+        self._precompute()
+        transformers = list(transformers)
+        if num_processes is None:
+            num_processes = algorithm_globals.num_processes
+        num_processes = max(1, min(num_processes, len(transformers)))
+
+        if num_processes == 1:
+            return [self.transform(transformer) for transformer in transformers]
+
+        with ProcessPoolExecutor(
+            max_workers=num_processes, initializer=_init_worker, initargs=(self,)
+        ) as executor:
+            return list(executor.map(_transform_in_worker, transformers))
+
+    def _precompute(self) -> None:
+        """Computes the active-space independent parts of the inactive Fock operator."""
+        if self._precomputed:
+            return
+
+        hamiltonian = self._problem.hamiltonian
+        if isinstance(hamiltonian, CholeskyElectronicEnergy):
+            # the Cholesky vectors already allow cheap reductions
+            self._precomputed = True
+            return
+
+        occupation_alpha = self._problem.orbital_occupations
+        occupation_beta = self._problem.orbital_occupations_b
+        if occupation_alpha is None or occupation_beta is None:
+            raise QiskitNatureError(
+                "An ActiveSpaceSession requires the orbital occupations to be set on the problem."
+            )
+
+        self._integrals = hamiltonian.electronic_integrals
+        self._occupation = (np.asarray(occupation_alpha), np.asarray(occupation_beta))
+        occupied = self._occupied(np.arange(self._problem.num_spatial_orbitals))
+        _, _, fock_a, fock_b = _fock(
+            self._integrals,
+            np.arange(self._problem.num_spatial_orbitals),
+            occupied,
+            (self._occupation[0][occupied], self._occupation[1][occupied]),
+        )
+        self._fock = (fock_a, fock_b)
+        self._precomputed = True
+
+    def _occupied(self, orbitals: np.ndarray) -> np.ndarray:
+        """Returns those of ``orbitals`` which are occupied by any electron."""
+        occupation_alpha, occupation_beta = self._occupation
+        return orbitals[(occupation_alpha[orbitals] != 0) | (occupation_beta[orbitals] != 0)]
+
+    def _inactive_fock(
+        self, orbitals: np.ndarray, active_orbs: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Computes the one-body terms and the inactive Fock operator restricted to ``orbitals``.
+
+        This returns the same as ``ActiveSpaceTransformer._inactive_fock``. Since the Fock operator
+        is linear in the density, the inactive one is the total Fock operator minus the two-body
+        contributions of the occupied orbitals in ``active_orbs``.
+        """
+        self._precompute()
+        occupied = self._occupied(active_orbs)
+        h_1_a, h_1_b, fock_a, fock_b = _fock(
+            self._integrals,
+            orbitals,
+            occupied,
+            (self._occupation[0][occupied], self._occupation[1][occupied]),
+        )
+        selection = np.ix_(orbitals, orbitals)
+        return (
+            h_1_a,
+            h_1_b,
+            self._fock[0][selection] - (fock_a - h_1_a),
+            self._fock[1][selection] - (fock_b - h_1_b),
+        )
+
+
+def _init_worker(session: ActiveSpaceSession) -> None:
+    global _WORKER_SESSION  # pylint: disable=global-statement
+    _WORKER_SESSION = session
+
+
+def _transform_in_worker(transformer: ActiveSpaceTransformer) -> ElectronicStructureProblem:
+    return _WORKER_SESSION.transform(transformer)
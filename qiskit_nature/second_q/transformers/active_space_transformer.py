@@ -17,13 +17,18 @@ from __future__ import annotations
 import logging
 
 from copy import deepcopy
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 import numpy as np
 
 from qiskit_nature import QiskitNatureError
-from qiskit_nature.second_q.hamiltonians import ElectronicEnergy, Hamiltonian
-from qiskit_nature.second_q.operators import ElectronicIntegrals
+from qiskit_nature.second_q.hamiltonians import (
+    CholeskyElectronicEnergy,
+    ElectronicEnergy,
+    Hamiltonian,
+)
+from qiskit_nature.second_q.operators import ElectronicIntegrals, PolynomialTensor
+from qiskit_nature.second_q.operators.polynomial_tensor import SparseArray
 from qiskit_nature.second_q.problems import BaseProblem, ElectronicBasis, ElectronicStructureProblem
 from qiskit_nature.second_q.properties import (
     AngularMomentum,
@@ -34,7 +39,9 @@ from qiskit_nature.second_q.properties import (
 )
 
 from .base_transformer import BaseTransformer
-from .basis_transformer import BasisTransformer
+
+if TYPE_CHECKING:
+    from .active_space_session import ActiveSpaceSession
 
 LOGGER = logging.getLogger(__name__)
 
@@ -114,9 +121,8 @@ class ActiveSpaceTransformer(BaseTransformer):
 
         self._mo_occ_total: np.ndarray = None
         self._active_orbs_indices: list[int] = None
-        self._transform_active: BasisTransformer = None
-        self._density_active: ElectronicIntegrals = None
-        self._density_total: ElectronicIntegrals = None
+        self._inactive_orbs_indices: np.ndarray = None
+        self._inactive_occupation: tuple[np.ndarray, np.ndarray] = None
 
     def _check_configuration(self):
         if isinstance(self._num_electrons, (int, np.integer)):
@@ -185,7 +191,7 @@ class ActiveSpaceTransformer(BaseTransformer):
             )
 
     def _transform_electronic_structure_problem(
-        self, problem: ElectronicStructureProblem
+        self, problem: ElectronicStructureProblem, session: ActiveSpaceSession | None = None
     ) -> ElectronicStructureProblem:
 
         if problem.basis != ElectronicBasis.MO:
@@ -215,31 +221,27 @@ class ActiveSpaceTransformer(BaseTransformer):
         # determine the active space
         self._active_orbs_indices = self._determine_active_space(problem)
 
-        # initialize size-reducing basis transformation
-        coeff_alpha = np.zeros((num_spatial_orbitals, self._num_spatial_orbitals))
-        coeff_alpha[self._active_orbs_indices, range(self._num_spatial_orbitals)] = 1.0
-        coeff_beta = np.zeros((num_spatial_orbitals, self._num_spatial_orbitals))
-        coeff_beta[self._active_orbs_indices, range(self._num_spatial_orbitals)] = 1.0
-        self._transform_active = BasisTransformer(
-            ElectronicBasis.MO,
-            ElectronicBasis.MO,
-            ElectronicIntegrals.from_raw_integrals(coeff_alpha, h1_b=coeff_beta, validate=False),
-        )
-
-        self._density_total = ElectronicIntegrals.from_raw_integrals(
-            np.diag(occupation_alpha), h1_b=np.diag(occupation_beta)
+        # since we work in the MO basis, the active space is a pure selection of orbitals. Thus,
+        # all integrals get reduced by slicing and the inactive Fock operator only depends on the
+        # slices of the occupied orbitals outside of the active space.
+        inactive_orbs_indices = np.setdiff1d(
+            np.arange(num_spatial_orbitals), self._active_orbs_indices
         )
-
-        self._density_active = self._transform_active.transform_electronic_integrals(
-            self._density_total
+        occupied = (occupation_alpha[inactive_orbs_indices] != 0) | (
+            occupation_beta[inactive_orbs_indices] != 0
         )
-        self._density_active.beta_alpha = None
-        self._density_active = self._transform_active.invert().transform_electronic_integrals(
-            self._density_active
+        self._inactive_orbs_indices = inactive_orbs_indices[occupied]
+        self._inactive_occupation = (
+            occupation_alpha[self._inactive_orbs_indices],
+            occupation_beta[self._inactive_orbs_indices],
         )
-        self._density_active.beta_alpha = None
 
-        electronic_energy = cast(ElectronicEnergy, self.transform_hamiltonian(problem.hamiltonian))
+        if session is not None and isinstance(problem.hamiltonian, ElectronicEnergy):
+            electronic_energy = self._transform_electronic_energy(problem.hamiltonian, session)
+        else:
+            electronic_energy = cast(
+                ElectronicEnergy, self.transform_hamiltonian(problem.hamiltonian)
+            )
 
         # construct new ElectronicStructureProblem
         new_problem = ElectronicStructureProblem(electronic_energy)
@@ -265,7 +267,7 @@ class ActiveSpaceTransformer(BaseTransformer):
                     self._transform_electronic_dipole_moment(prop)
                 )
             elif isinstance(prop, ElectronicDensity):
-                transformed = self._transform_active.transform_electronic_integrals(prop)
+                transformed = _select_orbitals(prop, self._active_orbs_indices)
                 new_problem.properties.electronic_density = ElectronicDensity(
                     transformed.alpha, transformed.beta, transformed.beta_alpha
                 )
@@ -372,7 +374,7 @@ class ActiveSpaceTransformer(BaseTransformer):
         if isinstance(hamiltonian, ElectronicEnergy):
             # TODO: implement the standalone usage of this method
             # See also: https://github.com/Qiskit/qiskit-nature/issues/847
-            if self._transform_active is None:
+            if self._active_orbs_indices is None:
                 raise NotImplementedError(
                     "This transformer does not yet support the standalone use of the "
                     "transform_hamiltonian method. See also "
@@ -385,50 +387,109 @@ class ActiveSpaceTransformer(BaseTransformer):
                 "transformer."
             )
 
-    def _transform_electronic_energy(self, hamiltonian: ElectronicEnergy) -> ElectronicEnergy:
-        total_fock_operator = hamiltonian.fock(self._density_total)
+    def _transform_electronic_energy(
+        self, hamiltonian: ElectronicEnergy, session: ActiveSpaceSession | None = None
+    ) -> ElectronicEnergy:
+        occupation_alpha, occupation_beta = self._inactive_occupation
 
-        active_fock_operator = (
-            hamiltonian.fock(self._density_active) - hamiltonian.electronic_integrals.one_body
+        # the inactive Fock operator is only required on the active and inactive orbitals
+        num_active = len(self._active_orbs_indices)
+        orbitals = np.concatenate(
+            [np.asarray(self._active_orbs_indices, dtype=int), self._inactive_orbs_indices]
         )
 
-        inactive_fock_operator = total_fock_operator - active_fock_operator
+        if isinstance(hamiltonian, CholeskyElectronicEnergy):
+            h_1_a, h_1_b, fock_a, fock_b = self._inactive_fock_cholesky(hamiltonian, orbitals)
+        elif session is not None:
+            # pylint: disable=protected-access
+            h_1_a, h_1_b, fock_a, fock_b = session._inactive_fock(
+                orbitals, np.asarray(self._active_orbs_indices, dtype=int)
+            )
+        else:
+            h_1_a, h_1_b, fock_a, fock_b = self._inactive_fock(
+                hamiltonian.electronic_integrals, orbitals
+            )
 
-        e_inactive: ElectronicIntegrals = cast(
-            ElectronicIntegrals,
-            0.5
-            * ElectronicIntegrals.einsum(
-                {"ij,ji": ("+-", "+-", "")},
-                total_fock_operator + hamiltonian.electronic_integrals.one_body,
-                self._density_total,
-            ),
-        )
-        e_inactive -= ElectronicIntegrals.einsum(
-            {"ij,ji": ("+-", "+-", "")}, total_fock_operator, self._density_active
-        )
-        e_inactive += cast(
-            ElectronicIntegrals,
-            0.5
-            * ElectronicIntegrals.einsum(
-                {"ij,ji": ("+-", "+-", "")}, active_fock_operator, self._density_active
-            ),
-        )
-        e_inactive_sum = (
-            e_inactive.alpha.get("", 0.0)
-            + e_inactive.beta.get("", 0.0)
-            + e_inactive.beta_alpha.get("", 0.0)
+        # E^I = 1/2 sum_i (h_ii + F^I_ii) D_ii
+        inactive_diagonal = np.arange(num_active, len(orbitals))
+        e_inactive_sum = 0.5 * (
+            np.dot(
+                occupation_alpha,
+                (h_1_a + fock_a)[inactive_diagonal, inactive_diagonal],
+            )
+            + np.dot(
+                occupation_beta,
+                (h_1_b + fock_b)[inactive_diagonal, inactive_diagonal],
+            )
         )
 
-        new_hamil = ElectronicEnergy(
-            self._transform_active.transform_electronic_integrals(
-                inactive_fock_operator + hamiltonian.electronic_integrals.two_body
-            )
+        active_one_body = ElectronicIntegrals.from_raw_integrals(
+            fock_a[:num_active, :num_active],
+            h1_b=fock_b[:num_active, :num_active],
+            validate=False,
         )
+        new_hamil: ElectronicEnergy
+        if isinstance(hamiltonian, CholeskyElectronicEnergy):
+            active = np.ix_(self._active_orbs_indices, self._active_orbs_indices)
+            new_hamil = CholeskyElectronicEnergy(
+                active_one_body,
+                hamiltonian.cholesky_alpha[active],
+                None if hamiltonian.cholesky_beta is None else hamiltonian.cholesky_beta[active],
+            )
+        else:
+            new_hamil = ElectronicEnergy(
+                active_one_body
+                + _select_orbitals(
+                    hamiltonian.electronic_integrals.two_body, self._active_orbs_indices
+                )
+            )
         new_hamil.constants = deepcopy(hamiltonian.constants)
         new_hamil.constants[self.__class__.__name__] = e_inactive_sum
 
         return new_hamil
 
+    def _inactive_fock(
+        self, integrals: ElectronicIntegrals, orbitals: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Computes the one-body terms and the inactive Fock operator restricted to ``orbitals``."""
+        return _fock(integrals, orbitals, self._inactive_orbs_indices, self._inactive_occupation)
+
+    def _inactive_fock_cholesky(
+        self, hamiltonian: CholeskyElectronicEnergy, orbitals: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Computes the one-body terms and the inactive Fock operator restricted to ``orbitals``.
+
+        The Fock operator is evaluated from the Cholesky vectors restricted to ``orbitals``, which
+        scales as O(N^3 N_Q) without ever constructing the two-body integrals.
+        """
+        occupation_alpha, occupation_beta = self._inactive_occupation
+        one_body = hamiltonian.one_body
+
+        h_1_a = _get_block(one_body.alpha, "+-", [orbitals] * 2)
+        h_1_b = _get_block(
+            one_body.alpha if one_body.beta.is_empty() else one_body.beta, "+-", [orbitals] * 2
+        )
+
+        num_active = len(self._active_orbs_indices)
+        selection = np.ix_(orbitals, orbitals)
+        sub_hamiltonian = CholeskyElectronicEnergy(
+            ElectronicIntegrals.from_raw_integrals(
+                h_1_a, h1_b=None if one_body.beta.is_empty() else h_1_b, validate=False
+            ),
+            hamiltonian.cholesky_alpha[selection],
+            None if hamiltonian.cholesky_beta is None else hamiltonian.cholesky_beta[selection],
+        )
+        density = ElectronicIntegrals.from_raw_integrals(
+            np.diag(np.concatenate([np.zeros(num_active), occupation_alpha])),
+            h1_b=np.diag(np.concatenate([np.zeros(num_active), occupation_beta])),
+            validate=False,
+        )
+        fock = sub_hamiltonian.fock(density)
+        fock_a = np.asarray(fock.alpha["+-"])
+        fock_b = fock_a if fock.beta.is_empty() else np.asarray(fock.beta["+-"])
+
+        return h_1_a, h_1_b, fock_a, fock_b
+
     def _transform_electronic_dipole_moment(
         self, dipole_moment: ElectronicDipoleMoment
     ) -> ElectronicDipoleMoment:
@@ -438,18 +499,17 @@ class ActiveSpaceTransformer(BaseTransformer):
             # In the dipole case, there are no two-body terms. Thus, the inactive Fock operator
             # is unaffected by the density and equals the one-body terms.
             one_body = dipole.one_body
+            occupation_alpha, occupation_beta = self._inactive_occupation
+            inactive = [self._inactive_orbs_indices] * 2
 
-            e_inactive = ElectronicIntegrals.einsum(
-                {"ij,ji": ("+-", "+-", "")}, one_body, self._density_total
-            )
-            e_inactive -= ElectronicIntegrals.einsum(
-                {"ij,ji": ("+-", "+-", "")}, one_body, self._density_active
+            dip_a = _get_block(one_body.alpha, "+-", inactive)
+            dip_b = _get_block(
+                one_body.alpha if one_body.beta.is_empty() else one_body.beta, "+-", inactive
             )
-            dipoles.append(self._transform_active.transform_electronic_integrals(one_body))
+            dipoles.append(_select_orbitals(one_body, self._active_orbs_indices))
             dip_inactive.append(
-                e_inactive.alpha.get("", 0.0)
-                + e_inactive.beta.get("", 0.0)
-                + e_inactive.beta_alpha.get("", 0.0)
+                np.dot(occupation_alpha, np.diagonal(dip_a))
+                + np.dot(occupation_beta, np.diagonal(dip_b))
             )
 
         new_dipole_moment = ElectronicDipoleMoment(
@@ -467,3 +527,132 @@ class ActiveSpaceTransformer(BaseTransformer):
         new_dipole_moment.nuclear_dipole_moment = dipole_moment.nuclear_dipole_moment
 
         return new_dipole_moment
+
+
+def _sub_block(array: np.ndarray | SparseArray, indices: list[int | np.ndarray]):
+    """Extracts a sub-block from an array by indexing one axis at a time.
+
+    This works for dense and sparse arrays alike. Integer indices are applied first (starting from
+    the last axis to keep the remaining axes in place) which yields cheap views of dense arrays.
+    """
+    remaining = []
+    for axis in reversed(range(len(indices))):
+        index = indices[axis]
+        if isinstance(index, (int, np.integer)):
+            array = array[(slice(None),) * axis + (index,)]
+        else:
+            remaining.insert(0, index)
+    for axis, index in enumerate(remaining):
+        array = array[(slice(None),) * axis + (np.asarray(index, dtype=int),)]
+    return array
+
+
+def _dense_sub_block(
+    array: np.ndarray | SparseArray, indices: list[int | np.ndarray]
+) -> np.ndarray:
+    block = _sub_block(array, indices)
+    if isinstance(block, SparseArray):
+        block = block.todense()
+    return block
+
+
+def _get_block(tensor: PolynomialTensor, key: str, indices: list[np.ndarray]) -> np.ndarray:
+    if key not in tensor:
+        return np.zeros(tuple(len(index) for index in indices))
+    return _dense_sub_block(tensor[key], indices)
+
+
+def _fock(
+    integrals: ElectronicIntegrals,
+    orbitals: np.ndarray,
+    occupied_orbs: np.ndarray,
+    occupation: tuple[np.ndarray, np.ndarray],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Computes the one-body terms and the Fock operator of a diagonal density.
+
+    The density is given by the ``occupation`` of the ``occupied_orbs`` and both, the one-body terms
+    and the Fock operator, are restricted to ``orbitals``.
+    """
+    occupation_alpha, occupation_beta = occupation
+
+    h_1_a = _get_block(integrals.alpha, "+-", [orbitals] * 2)
+    h_1_b = _get_block(
+        integrals.alpha if integrals.beta.is_empty() else integrals.beta, "+-", [orbitals] * 2
+    )
+    fock_a = h_1_a
+    fock_b = h_1_b
+
+    h_2_aa = integrals.alpha.get("++--", None)
+    if h_2_aa is not None:
+        h_2_bb = h_2_aa if integrals.beta.is_empty() else integrals.beta.get("++--", h_2_aa)
+        h_2_ba = integrals.beta_alpha.get("++--", None)
+
+        # J_qr = sum_i g_iqri D_ii and K_pr = sum_i g_piri D_ii (see ElectronicEnergy.fock)
+        density = (occupied_orbs, orbitals)
+        fock_a = fock_a - _contract_inactive(h_2_aa, (1, 3), occupation_alpha, *density)
+        fock_b = fock_b - _contract_inactive(h_2_bb, (1, 3), occupation_beta, *density)
+        if h_2_ba is None:
+            fock_a = fock_a + 2.0 * _contract_inactive(h_2_aa, (0, 3), occupation_alpha, *density)
+            fock_b = fock_b + 2.0 * _contract_inactive(h_2_bb, (0, 3), occupation_beta, *density)
+        else:
+            fock_a = (
+                fock_a
+                + _contract_inactive(h_2_aa, (0, 3), occupation_alpha, *density)
+                + _contract_inactive(h_2_ba, (0, 3), occupation_beta, *density)
+            )
+            fock_b = (
+                fock_b
+                + _contract_inactive(h_2_bb, (0, 3), occupation_beta, *density)
+                + _contract_inactive(h_2_ba, (1, 2), occupation_alpha, *density)
+            )
+
+    return h_1_a, h_1_b, fock_a, fock_b
+
+
+def _contract_inactive(
+    two_body: np.ndarray | SparseArray,
+    inactive_axes: tuple[int, int],
+    occupation: np.ndarray,
+    inactive_orbs: np.ndarray,
+    orbitals: np.ndarray,
+) -> np.ndarray:
+    """Contracts two axes of the two-body integrals with the (diagonal) inactive density.
+
+    Only the slices of the inactive orbitals are touched and the remaining axes are restricted to
+    ``orbitals``, making this O(N^2 n_inactive) rather than O(N^4).
+    """
+    result = np.zeros((len(orbitals), len(orbitals)))
+    for orb, occ in zip(inactive_orbs, occupation):
+        if occ == 0:
+            continue
+        indices: list[int | np.ndarray] = [orbitals] * 4
+        for axis in inactive_axes:
+            indices[axis] = orb
+        result = result + occ * _dense_sub_block(two_body, indices)
+    return result
+
+
+def _select_orbitals(integrals: ElectronicIntegrals, orbitals: list[int]) -> ElectronicIntegrals:
+    """Restricts the one- and two-body terms of some integrals to a selection of orbitals.
+
+    This is equivalent to (but much cheaper than) transforming the integrals with a
+    :class:`.BasisTransformer` whose alpha- and beta-spin coefficients select ``orbitals``. Thus,
+    empty beta-spin terms are filled with the alpha-spin ones.
+    """
+
+    def select(tensor: PolynomialTensor, keys: tuple[str, ...]) -> PolynomialTensor:
+        return PolynomialTensor(
+            {key: _sub_block(tensor[key], [orbitals] * len(key)) for key in keys if key in tensor},
+            validate=False,
+        )
+
+    # selecting the alpha-spin terms only once keeps empty beta-spin terms aliased to them
+    alpha = select(integrals.alpha, ("+-", "++--"))
+    beta = alpha if integrals.beta.is_empty() else select(integrals.beta, ("+-", "++--"))
+    if integrals.beta_alpha.is_empty():
+        beta_alpha = PolynomialTensor(
+            {"++--": alpha["++--"]} if "++--" in alpha else {}, validate=False
+        )
+    else:
+        beta_alpha = select(integrals.beta_alpha, ("++--",))
+    return ElectronicIntegrals(alpha, beta, beta_alpha, validate=False)
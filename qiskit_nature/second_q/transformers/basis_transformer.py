@@ -15,13 +15,22 @@
 from __future__ import annotations
 
 import logging
+import os
+import tempfile
+from collections.abc import Sequence
 from typing import cast
 
+import h5py
 import numpy as np
 
 from qiskit_nature.exceptions import QiskitNatureError
-from qiskit_nature.second_q.hamiltonians import ElectronicEnergy, Hamiltonian
+from qiskit_nature.second_q.hamiltonians import (
+    CholeskyElectronicEnergy,
+    ElectronicEnergy,
+    Hamiltonian,
+)
 from qiskit_nature.second_q.operators import ElectronicIntegrals, PolynomialTensor
+from qiskit_nature.second_q.operators.tensor_ordering import IndexType, to_physicist_ordering
 from qiskit_nature.second_q.problems import BaseProblem, ElectronicBasis, ElectronicStructureProblem
 from qiskit_nature.second_q.properties import (
     AngularMomentum,
@@ -35,6 +44,22 @@ from .base_transformer import BaseTransformer
 
 LOGGER = logging.getLogger(__name__)
 
+_ONE_BODY_EINSUM_MAP = {"jk,ji,kl->il": ("+-",) * 4}
+
+# The two-body terms are transformed by four sequential quarter-transformations, each of which scales
+# as O(N^5), rather than by a single contraction over all five operands. Altogether, these are
+# equivalent to "prsq,pi,qj,rk,sl->iklj".
+_QUARTER_TRANSFORM_EINSUM_MAPS = (
+    {"prsq,pi->irsq": ("++--", "+-", "++--")},
+    {"irsq,qj->irsj": ("++--", "+-", "++--")},
+    {"irsj,rk->iksj": ("++--", "+-", "++--")},
+    {"iksj,sl->iklj": ("++--", "+-", "++--")},
+)
+
+# The default number of elements (8 bytes each) which are held in memory at once during the
+# out-of-core transformation of the two-body terms.
+_DEFAULT_CHUNK_ELEMENTS = 2**24
+
 
 class BasisTransformer(BaseTransformer):
     """A transformer to map from one basis to another.
@@ -176,27 +201,131 @@ class BasisTransformer(BaseTransformer):
                 f"coefficients of type, {type(self.coefficients)}, rather than ElectronicIntegrals."
             )
 
-        einsum_map = {
-            "jk,ji,kl->il": ("+-",) * 4,
-            "prsq,pi,qj,rk,sl->iklj": ("++--", *("+-",) * 4, "++--"),
-        }
-
         transformed_integrals = ElectronicIntegrals.einsum(
-            einsum_map, integrals, *(self.coefficients,) * 4
+            _ONE_BODY_EINSUM_MAP, integrals, *(self.coefficients,) * 2
         )
 
-        if not self.coefficients.beta.is_empty() and transformed_integrals.beta_alpha.is_empty():
-            transformed_integrals.beta_alpha = PolynomialTensor.einsum(
-                {"prsq,pi,qj,rk,sl->iklj": ("++--", *("+-",) * 4, "++--")},
-                integrals.alpha if integrals.beta_alpha.is_empty() else integrals.beta_alpha,
-                *(self.coefficients.beta,) * 2,
-                *(self.coefficients.alpha,) * 2,
+        two_body = integrals.two_body
+        if not two_body.alpha.is_empty():
+            for einsum_map in _QUARTER_TRANSFORM_EINSUM_MAPS:
+                # the intermediate tensors are not square and, thus, cannot be validated
+                two_body = ElectronicIntegrals.einsum(
+                    einsum_map, two_body, self.coefficients, validate=False
+                )
+            transformed_integrals = transformed_integrals + ElectronicIntegrals(
+                two_body.alpha, two_body.beta
             )
 
+        beta_alpha = integrals.alpha if integrals.beta_alpha.is_empty() else integrals.beta_alpha
+        if not self.coefficients.beta.is_empty() and "++--" in beta_alpha:
+            beta_alpha = PolynomialTensor({"++--": beta_alpha["++--"]}, validate=False)
+            for einsum_map, coefficients in zip(
+                _QUARTER_TRANSFORM_EINSUM_MAPS,
+                (self.coefficients.beta,) * 2 + (self.coefficients.alpha,) * 2,
+            ):
+                beta_alpha = PolynomialTensor.einsum(
+                    einsum_map, beta_alpha, coefficients, validate=False
+                )
+            transformed_integrals.beta_alpha = beta_alpha
+
         return transformed_integrals
 
+    def transform_two_body_out_of_core(
+        self,
+        eri: h5py.Dataset | np.ndarray,
+        *,
+        active_orbitals: Sequence[int] | None = None,
+        chunk_size: int | None = None,
+        scratch_dir: str | None = None,
+    ) -> ElectronicIntegrals:
+        """Transforms two-body integrals stored on disk without loading them into memory at once.
+
+        The two-body integrals are expected in chemists' index order, :math:`(pq|rs)`, as for example
+        stored by :meth:`~qiskit_nature.second_q.formats.qcschema.QCSchema.to_hdf5`. Their layout
+        may be the full rank-four tensor, a :math:`N^2 \\times N^2` matrix or a flattened array of
+        length :math:`N^4` (where :math:`N` is the number of basis functions in the
+        :attr:`initial_basis`).
+
+        The transformation is performed in two half-transformations. First, the second index pair
+        is transformed chunk by chunk (reading only a few rows of ``eri`` at a time) and the
+        intermediate :math:`(pq|kl)` is written into a scratch HDF5 file. Afterwards, the first index
+        pair is transformed while reading the intermediate in chunks again. Only the final tensor
+        in the :attr:`final_basis` (or just its active block) ever resides in memory completely.
+
+        .. code-block:: python
+
+            import h5py
+
+            with h5py.File("eri.hdf5", "r") as file:
+                two_body = transformer.transform_two_body_out_of_core(
+                    file["eri"], active_orbitals=[2, 3, 4, 5]
+                )
+
+        Args:
+            eri: the two-body integrals in the :attr:`initial_basis`. Any object supporting
+                ``numpy``-style slicing along its first axis (e.g. an ``h5py.Dataset``) can be used.
+            active_orbitals: the indices of the orbitals of the :attr:`final_basis` to which the
+                result gets restricted. If ``None``, all orbitals are kept.
+            chunk_size: the number of leading indices processed per chunk. If ``None``, it is chosen
+                such that roughly :math:`2^{24}` elements are held in memory at once.
+            scratch_dir: the directory in which the temporary HDF5 file storing the
+                half-transformed integrals gets created. If ``None``, the default temporary
+                directory is used.
+
+        Raises:
+            QiskitNatureError: when using this method on a ``BasisTransformer`` that does not store
+                its :attr:`coefficients` as ``ElectronicIntegrals``.
+            ValueError: if the size of ``eri`` does not match the number of basis functions.
+
+        Returns:
+            The transformed ``ElectronicIntegrals`` containing only the two-body terms in
+            physicists' index order.
+        """
+        if not isinstance(self.coefficients, ElectronicIntegrals):
+            raise QiskitNatureError(
+                "You cannot transform two-body integrals with a BasisTransformer containing "
+                f"coefficients of type, {type(self.coefficients)}, rather than ElectronicIntegrals."
+            )
+
+        coeff_a = np.asarray(self.coefficients.alpha["+-"])
+        coeff_b = None
+        if not self.coefficients.beta.is_empty():
+            coeff_b = np.asarray(self.coefficients.beta["+-"])
+        if active_orbitals is not None:
+            coeff_a = coeff_a[:, list(active_orbitals)]
+            if coeff_b is not None:
+                coeff_b = coeff_b[:, list(active_orbitals)]
+
+        nao = coeff_a.shape[0]
+        if int(np.prod(eri.shape)) != nao**4:
+            raise ValueError(
+                f"The two-body integrals of shape {eri.shape} do not match the {nao} basis functions "
+                "of the transformation coefficients."
+            )
+
+        def to_tensor(chem: np.ndarray) -> PolynomialTensor:
+            return PolynomialTensor(
+                {"++--": to_physicist_ordering(chem, index_order=IndexType.CHEMIST)}
+            )
+
+        with tempfile.TemporaryDirectory(dir=scratch_dir) as tmpdir:
+            with h5py.File(os.path.join(tmpdir, "half_transformed.hdf5"), "w") as scratch:
+                half_a = _half_transform(eri, coeff_a, scratch, "alpha", chunk_size)
+                alpha = to_tensor(_finish_transform(half_a, coeff_a, chunk_size))
+                if coeff_b is None:
+                    return ElectronicIntegrals(alpha)
+
+                beta_alpha = to_tensor(_finish_transform(half_a, coeff_b, chunk_size))
+                del scratch["alpha"]
+                half_b = _half_transform(eri, coeff_b, scratch, "beta", chunk_size)
+                beta = to_tensor(_finish_transform(half_b, coeff_b, chunk_size))
+
+        return ElectronicIntegrals(alpha, beta, beta_alpha)
+
     def transform_hamiltonian(self, hamiltonian: Hamiltonian) -> Hamiltonian:
-        if isinstance(hamiltonian, ElectronicEnergy):
+        if isinstance(hamiltonian, CholeskyElectronicEnergy):
+            return self._transform_cholesky_electronic_energy(hamiltonian)
+        elif isinstance(hamiltonian, ElectronicEnergy):
             integrals = hamiltonian.electronic_integrals
             hamiltonian.electronic_integrals = self.transform_electronic_integrals(integrals)
             return hamiltonian
@@ -206,6 +335,39 @@ class BasisTransformer(BaseTransformer):
                 "transformer."
             )
 
+    def _transform_cholesky_electronic_energy(
+        self, hamiltonian: CholeskyElectronicEnergy
+    ) -> CholeskyElectronicEnergy:
+        """Transforms a :class:`qiskit_nature.second_q.hamiltonians.CholeskyElectronicEnergy`.
+
+        The Cholesky vectors get transformed directly, which scales as O(N^3 N_Q) and never
+        constructs the full two-body integrals.
+
+        Args:
+            hamiltonian: the ``CholeskyElectronicEnergy`` to transform.
+
+        Raises:
+            QiskitNatureError: when using this method on a ``BasisTransformer`` that does not store
+                its :attr:`coefficients` as ``ElectronicIntegrals``.
+
+        Returns:
+            The transformed ``CholeskyElectronicEnergy``.
+        """
+        hamiltonian.one_body = self.transform_electronic_integrals(hamiltonian.one_body)
+
+        coeff_a = self.coefficients.alpha["+-"]
+        cholesky_alpha = hamiltonian.cholesky_alpha
+        cholesky_beta = hamiltonian.cholesky_beta
+        hamiltonian.cholesky_alpha = _transform_cholesky_vectors(cholesky_alpha, coeff_a)
+        if not self.coefficients.beta.is_empty():
+            hamiltonian.cholesky_beta = _transform_cholesky_vectors(
+                cholesky_alpha if cholesky_beta is None else cholesky_beta,
+                self.coefficients.beta["+-"],
+            )
+        elif cholesky_beta is not None:
+            hamiltonian.cholesky_beta = _transform_cholesky_vectors(cholesky_beta, coeff_a)
+        return hamiltonian
+
     def _transform_electronic_dipole_moment(
         self, dipole_moment: ElectronicDipoleMoment
     ) -> ElectronicDipoleMoment:
@@ -225,3 +387,54 @@ class BasisTransformer(BaseTransformer):
         new_dipole_moment.reverse_dipole_sign = dipole_moment.reverse_dipole_sign
         new_dipole_moment.nuclear_dipole_moment = dipole_moment.nuclear_dipole_moment
         return new_dipole_moment
+
+
+def _read_rows(eri: h5py.Dataset | np.ndarray, start: int, stop: int, nao: int) -> np.ndarray:
+    """Reads the rows ``start:stop`` of the first index of chemist-ordered two-body integrals."""
+    if len(eri.shape) == 4:
+        block = eri[start:stop]
+    elif len(eri.shape) == 2:
+        block = eri[start * nao : stop * nao]
+    else:
+        block = eri[start * nao**3 : stop * nao**3]
+    return np.asarray(block).reshape((stop - start, nao, nao, nao))
+
+
+def _half_transform(
+    eri: h5py.Dataset | np.ndarray,
+    coeff: np.ndarray,
+    scratch: h5py.File,
+    name: str,
+    chunk_size: int | None,
+) -> h5py.Dataset:
+    """Transforms the second index pair, ``(pq|rs) -> (pq|kl)``, storing the result in ``scratch``."""
+    nao, nmo = coeff.shape
+    if chunk_size is None:
+        chunk_size = max(1, _DEFAULT_CHUNK_ELEMENTS // nao**3)
+    half = scratch.create_dataset(name, shape=(nao, nao, nmo, nmo), dtype=np.result_type(coeff))
+    for start in range(0, nao, chunk_size):
+        stop = min(start + chunk_size, nao)
+        block = _read_rows(eri, start, stop, nao)
+        block = np.tensordot(block, coeff, axes=(2, 0))
+        half[start:stop] = np.tensordot(block, coeff, axes=(2, 0))
+    return half
+
+
+def _finish_transform(half: h5py.Dataset, coeff: np.ndarray, chunk_size: int | None) -> np.ndarray:
+    """Transforms the first index pair of the half-transformed integrals, ``(pq|kl) -> (ij|kl)``."""
+    nao, nmo = coeff.shape
+    if chunk_size is None:
+        chunk_size = max(1, _DEFAULT_CHUNK_ELEMENTS // (nao * nao * nmo))
+    result = np.zeros((nmo,) * 4, dtype=np.result_type(coeff, half.dtype))
+    for start in range(0, half.shape[2], chunk_size):
+        stop = min(start + chunk_size, half.shape[2])
+        block = np.tensordot(half[:, :, start:stop, :], coeff, axes=(0, 0))
+        block = np.tensordot(block, coeff, axes=(0, 0))
+        result[:, :, start:stop, :] = block.transpose(2, 3, 0, 1)
+    return result
+
+
+def _transform_cholesky_vectors(cholesky: np.ndarray, coeff: np.ndarray) -> np.ndarray:
+    """Transforms Cholesky vectors of shape ``(N, N, N_Q)`` one orbital index at a time."""
+    half = np.tensordot(coeff, cholesky, axes=(0, 0))
+    return np.tensordot(half, coeff, axes=(1, 0)).transpose(0, 2, 1)
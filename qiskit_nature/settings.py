@@ -27,6 +27,7 @@ class QiskitNatureSettings:
     def __init__(self) -> None:
         self._dict_aux_operators: bool = True
         self._optimize_einsum: bool = True
+        self._sparse_density_threshold: float = 0.1
         self._deprecation_shown: bool = False
 
     @property
@@ -85,5 +86,28 @@ class QiskitNatureSettings:
         """
         self._optimize_einsum = optimize_einsum
 
+    @property
+    def sparse_density_threshold(self) -> float:
+        """Returns the density below which sparse arrays are contracted in sparse format.
+
+        The density of an array is its fraction of non-zero elements. When at least one sparse
+        operand of a :meth:`~qiskit_nature.second_q.operators.PolynomialTensor.einsum`,
+        :meth:`~qiskit_nature.second_q.operators.PolynomialTensor.compose` or
+        :meth:`~qiskit_nature.second_q.operators.PolynomialTensor.tensor` operation is at most this
+        dense, the operation is carried out without converting it to a dense array. Results which
+        end up denser than this threshold are stored as dense arrays.
+        """
+        return self._sparse_density_threshold
+
+    @sparse_density_threshold.setter
+    def sparse_density_threshold(self, sparse_density_threshold: float) -> None:
+        """Sets the density below which sparse arrays are contracted in sparse format."""
+        if not 0.0 <= sparse_density_threshold <= 1.0:
+            raise ValueError(
+                "The sparse density threshold must lie within [0, 1], not "
+                f"{sparse_density_threshold}."
+            )
+        self._sparse_density_threshold = sparse_density_threshold
+
 
 settings = QiskitNatureSettings()
@@ -28,6 +28,6 @@ Linear algebra utilities
 """
 
 from .linalg import apply_matrix_to_slices, givens_matrix
-from .opt_einsum import get_einsum
+from .opt_einsum import get_einsum, get_einsum_expression
 
-__all__ = ["apply_matrix_to_slices", "givens_matrix", "get_einsum"]
+__all__ = ["apply_matrix_to_slices", "givens_matrix", "get_einsum", "get_einsum_expression"]
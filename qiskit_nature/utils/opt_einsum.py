@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache, partial
 from typing import Callable
 import numpy as np
 import qiskit_nature.optionals as _optionals
@@ -36,3 +37,48 @@ def get_einsum() -> tuple[Callable, bool]:
         return contract, True
 
     return np.einsum, False
+
+
+def get_einsum_expression(
+    subscripts: str, *shapes: tuple[int, ...], optimize: bool = True
+) -> Callable:
+    """Returns a pre-planned ``einsum`` contraction for the given subscripts and operand shapes.
+
+    Finding a good contraction order is not free and, when the same contraction gets applied to
+    operands of the same shapes many times (for example, when transforming the integrals of many
+    geometries from the AO to the MO basis), repeating it every time is wasteful. This function
+    caches the planned contraction keyed by ``subscripts``, ``shapes`` and ``optimize``.
+
+    If ``opt_einsum`` is installed, the returned callable is an ``opt_einsum.contract_expression``
+    (which also supports sparse arrays). Otherwise this falls back to ``np.einsum`` with a
+    precomputed ``np.einsum_path``.
+
+    Args:
+        subscripts: the einsum subscripts.
+        shapes: the shapes of the operands.
+        optimize: whether to optimize the contraction order.
+
+    Returns:
+        A callable which takes the operands as its positional arguments and returns the result of
+        the contraction.
+    """
+    return _build_einsum_expression(subscripts, tuple(map(tuple, shapes)), optimize)
+
+
+@lru_cache(maxsize=128)
+def _build_einsum_expression(
+    subscripts: str, shapes: tuple[tuple[int, ...], ...], optimize: bool
+) -> Callable:
+    if _optionals.HAS_OPT_EINSUM:
+        # pylint: disable=import-error
+        from opt_einsum import contract_expression
+
+        return contract_expression(subscripts, *shapes, optimize=optimize)
+
+    if not optimize:
+        return partial(np.einsum, subscripts, optimize=False)
+
+    # the contraction path only depends on the shapes, so we can plan it on zero-strided dummies
+    dummies = [np.broadcast_to(0.0, shape) for shape in shapes]
+    path, _ = np.einsum_path(subscripts, *dummies, optimize=True)
+    return partial(np.einsum, subscripts, optimize=path)
@@ -90,6 +90,11 @@ class TestDriverGaussianLog(QiskitNatureTestCase):
         result = GaussianLogResult(line)
         self.assertListEqual(result.log, line.split("\n"))
 
+    def test_gaussian_log_result_missing_file(self):
+        """Test that a missing log file raises on construction"""
+        with self.assertRaises(FileNotFoundError):
+            _ = GaussianLogResult("does_not_exist.log")
+
     def test_multi_line_data(self):
         """Test if data is found on multiple lines.
 
@@ -147,6 +152,35 @@ class TestDriverGaussianLog(QiskitNatureTestCase):
         ]
         self.assertListEqual(qfc, expected)
 
+    def test_force_constant_arrays(self):
+        """Test the structured arrays of all force constants"""
+        result = GaussianLogResult(self.logfile)
+        arrays = result.force_constant_arrays
+        self.assertEqual(sorted(arrays.keys()), [2, 3, 4])
+        for order, constants in (
+            (2, result.quadratic_force_constants),
+            (3, result.cubic_force_constants),
+            (4, result.quartic_force_constants),
+        ):
+            with self.subTest(order=order):
+                array = arrays[order]
+                self.assertEqual(array.dtype.names, ("indices", "constants"))
+                self.assertEqual(array.shape, (len(constants),))
+                self.assertEqual(array["indices"].shape, (len(constants), order))
+                np.testing.assert_array_equal(
+                    array["indices"], [entry[:order] for entry in constants]
+                )
+                np.testing.assert_array_equal(
+                    array["constants"], [entry[order:] for entry in constants]
+                )
+
+        with self.subTest("from a list of lines"):
+            with open(self.logfile, "r", encoding="utf8") as file:
+                lines = file.read().split("\n")
+            other = GaussianLogResult(lines).force_constant_arrays
+            for order, array in arrays.items():
+                np.testing.assert_array_equal(other[order], array)
+
     def test_watson_hamiltonian(self):
         """Test the WatsonHamiltonian."""
         import sparse as sp  # pylint: disable=import-error
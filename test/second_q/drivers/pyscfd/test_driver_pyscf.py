@@ -12,12 +12,16 @@
 
 """ Test Driver PySCF """
 
+import os
+import tempfile
 import unittest
 from test import QiskitNatureTestCase
 from test.second_q.drivers.test_driver import TestDriver
 
+import numpy as np
+
 from qiskit_nature.units import DistanceUnit
-from qiskit_nature.second_q.drivers import PySCFDriver
+from qiskit_nature.second_q.drivers import MethodType, PySCFDriver
 from qiskit_nature import QiskitNatureError
 import qiskit_nature.optionals as _optionals
 
@@ -70,6 +74,108 @@ class TestDriverPySCF(QiskitNatureTestCase, TestDriver):
         driver_result = driver.run()
         self.assertAlmostEqual(driver_result.reference_energy, -1.0661086493179366, places=5)
 
+    def test_cache_dir(self):
+        """Check the result cache and the SCF warm-start of nearby geometries"""
+        # pylint: disable=protected-access
+        with tempfile.TemporaryDirectory() as cache_dir:
+            driver = PySCFDriver(atom="H 0 0 0; H 0 0 0.735", cache_dir=cache_dir)
+            problem = driver.run()
+            cache_file = os.path.join(cache_dir, f"{driver._cache_key()}.hdf5")
+            self.assertTrue(os.path.exists(cache_file))
+
+            with self.subTest("cached run"):
+                # the same molecule, formatted differently, is loaded without running PySCF
+                cached_driver = PySCFDriver(atom=["H 0.0 0.0 0.0", "H 0.0 0.0 0.7350"])
+                cached_driver.cache_dir = cache_dir
+                cached_problem = cached_driver.run()
+                self.assertIsNone(cached_driver._calc)
+                self.assertAlmostEqual(cached_problem.reference_energy, problem.reference_energy)
+                self.assertTrue(
+                    cached_problem.hamiltonian.electronic_integrals.equiv(
+                        problem.hamiltonian.electronic_integrals
+                    )
+                )
+                self.assertTrue(
+                    cached_problem.properties.electronic_dipole_moment.reverse_dipole_sign
+                )
+
+            with self.subTest("basis name normalization"):
+                self.assertEqual(
+                    PySCFDriver(atom="H 0 0 0; H 0 0 0.735", basis="STO-3G")._cache_key(),
+                    driver._cache_key(),
+                )
+
+            with self.subTest("cached run after a calculation"):
+                # the PySCF objects of the previous calculation no longer apply
+                driver.run()
+                self.assertIsNone(driver._mol)
+                self.assertIsNone(driver._calc)
+
+            with self.subTest("warm-started run"):
+                warm_chkfile = os.path.join(
+                    cache_dir, f"{driver._cache_key(include_geometry=False)}.chk"
+                )
+                self.assertTrue(os.path.exists(warm_chkfile))
+                nearby_problem = PySCFDriver(atom="H 0 0 0; H 0 0 0.745", cache_dir=cache_dir).run()
+                reference = PySCFDriver(atom="H 0 0 0; H 0 0 0.745").run()
+                self.assertAlmostEqual(
+                    nearby_problem.reference_energy, reference.reference_energy, places=8
+                )
+
+    def test_warm_start(self):
+        """Check that repeated runs start from the projected previous density matrix"""
+        # pylint: disable=protected-access
+        for method in (MethodType.RHF, MethodType.UHF):
+            with self.subTest(method=method):
+                driver = PySCFDriver(basis="631g", method=method, warm_start=True)
+                for dist in (1.5, 1.52, 1.54):
+                    driver.atom = f"Li 0 0 0; H 0 0 {dist}"
+                    problem = driver.run()
+                    reference = PySCFDriver(atom=driver.atom, basis="631g", method=method)
+                    reference_problem = reference.run()
+                    self.assertAlmostEqual(
+                        problem.reference_energy, reference_problem.reference_energy, places=8
+                    )
+                    if dist > 1.5:
+                        self.assertLess(driver._calc.cycles, reference._calc.cycles)
+
+    def test_qcschema_eri(self):
+        """Check the symmetry-aware two-body integral transformation and the optional AO integrals"""
+        # pylint: disable=protected-access
+        driver = PySCFDriver(atom="H 0 0 0; H 0 0 0.735; H 0 0 1.5", spin=1, method=MethodType.UHF)
+        driver.run_pyscf()
+        eri_ao = driver._mol.intor("int2e", aosym=1)
+        nao = eri_ao.shape[0]
+
+        qcschema = driver.to_qcschema()
+        wavefunction = qcschema.wavefunction
+        np.testing.assert_allclose(np.ravel(wavefunction.scf_eri), eri_ao.ravel(), atol=1e-12)
+
+        coeff_a = np.reshape(wavefunction.scf_orbitals_a, (nao, -1))
+        coeff_b = np.reshape(wavefunction.scf_orbitals_b, (nao, -1))
+        for name, (coeff_1, coeff_2) in {
+            "scf_eri_mo_aa": (coeff_a, coeff_a),
+            "scf_eri_mo_ba": (coeff_b, coeff_a),
+            "scf_eri_mo_bb": (coeff_b, coeff_b),
+        }.items():
+            with self.subTest(name):
+                expected = np.einsum(
+                    "pqrs,pi,qj,rk,sl->ijkl", eri_ao, coeff_1, coeff_1, coeff_2, coeff_2
+                )
+                np.testing.assert_allclose(
+                    np.ravel(getattr(wavefunction, name)), expected.ravel(), atol=1e-12
+                )
+
+        with self.subTest("without AO integrals"):
+            reduced = driver.to_qcschema(include_ao_eri=False)
+            self.assertIsNone(reduced.wavefunction.scf_eri)
+            problem = driver._qcschema_to_problem(reduced)
+            self.assertTrue(
+                problem.hamiltonian.electronic_integrals.equiv(
+                    driver._qcschema_to_problem(qcschema).hamiltonian.electronic_integrals
+                )
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
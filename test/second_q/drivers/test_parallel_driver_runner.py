@@ -0,0 +1,125 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests the ParallelDriverRunner."""
+
+import os
+import tempfile
+import unittest
+from test import QiskitNatureTestCase
+
+import qiskit_nature.optionals as _optionals
+from qiskit_nature.second_q.drivers import ParallelDriverRunner, PySCFDriver
+from qiskit_nature.second_q.formats import MoleculeInfo
+from qiskit_nature.second_q.formats.qcschema import QCSchema
+
+
+class TestParallelDriverRunner(QiskitNatureTestCase):
+    """ParallelDriverRunner tests."""
+
+    @unittest.skipIf(not _optionals.HAS_PYSCF, "pyscf not available.")
+    def setUp(self):
+        super().setUp()
+        self.molecules = [
+            MoleculeInfo(["H", "H"], [(0.0, 0.0, 0.0), (0.0, 0.0, dist)])
+            for dist in (0.6, 0.735, 0.9)
+        ]
+        self.reference_energies = [
+            PySCFDriver.from_molecule(molecule).run().reference_energy
+            for molecule in self.molecules
+        ]
+
+    def test_run(self):
+        """Test the sequential and the parallel execution."""
+        for num_processes in (1, 2):
+            with self.subTest(num_processes=num_processes):
+                runner = ParallelDriverRunner(
+                    PySCFDriver, num_processes=num_processes, num_threads=1
+                )
+                results = runner.run(self.molecules)
+                self.assertEqual([result.index for result in results], [0, 1, 2])
+                for result, energy in zip(results, self.reference_energies):
+                    self.assertTrue(result.success)
+                    self.assertEqual(result.attempts, 1)
+                    self.assertAlmostEqual(result.problem.reference_energy, energy)
+
+    def test_fallback(self):
+        """Test that failed calculations are retried with the fallback settings."""
+        with self.subTest("without fallback"):
+            runner = ParallelDriverRunner(
+                PySCFDriver, driver_kwargs={"max_cycle": 1}, num_processes=1
+            )
+            for result in runner.run(self.molecules):
+                self.assertFalse(result.success)
+                self.assertIsNone(result.problem)
+                self.assertEqual(result.attempts, 1)
+
+        with self.subTest("with fallback"):
+            runner = ParallelDriverRunner(
+                PySCFDriver,
+                driver_kwargs={"max_cycle": 1},
+                fallback_driver_kwargs={"max_cycle": 50},
+                num_processes=1,
+            )
+            for result, energy in zip(runner.run(self.molecules), self.reference_energies):
+                self.assertTrue(result.success)
+                self.assertEqual(result.attempts, 2)
+                self.assertAlmostEqual(result.problem.reference_energy, energy)
+
+    def test_output_dir(self):
+        """Test storing the results as HDF5 files."""
+        with tempfile.TemporaryDirectory() as output_dir:
+            runner = ParallelDriverRunner(PySCFDriver, num_processes=2, output_dir=output_dir)
+            for result in runner.run_iter(self.molecules):
+                self.assertIsNone(result.problem)
+                self.assertTrue(os.path.exists(result.path))
+                qcschema = QCSchema.from_hdf5(result.path)
+                self.assertAlmostEqual(
+                    qcschema.properties.return_energy, self.reference_energies[result.index]
+                )
+                # the AO two-body integrals are not stored by default
+                self.assertIsNone(qcschema.wavefunction.scf_eri)
+                self.assertIsNotNone(qcschema.wavefunction.scf_eri_mo_aa)
+
+            with self.subTest("existing files are reused"):
+                for result in runner.run(self.molecules):
+                    self.assertTrue(result.success)
+                    self.assertEqual(result.attempts, 0)
+
+            with self.subTest("different geometries are recomputed"):
+                # the same indices of a different scan must not pick up the existing files
+                molecules = [
+                    MoleculeInfo(["H", "H"], [(0.0, 0.0, 0.0), (0.0, 0.0, dist)])
+                    for dist in (0.65, 0.8)
+                ]
+                for result, molecule in zip(runner.run(molecules), molecules):
+                    self.assertTrue(result.success)
+                    self.assertEqual(result.attempts, 1)
+                    qcschema = QCSchema.from_hdf5(result.path)
+                    self.assertAlmostEqual(
+                        qcschema.properties.return_energy,
+                        PySCFDriver.from_molecule(molecule).run().reference_energy,
+                    )
+                self.assertEqual(len(os.listdir(output_dir)), 5)
+
+            with self.subTest("AO two-body integrals"):
+                runner = ParallelDriverRunner(
+                    PySCFDriver, num_processes=1, output_dir=output_dir, include_ao_eri=True
+                )
+                (result,) = runner.run(self.molecules[:1])
+                # a file without the AO integrals must not be reused
+                self.assertEqual(result.attempts, 1)
+                self.assertIsNotNone(QCSchema.from_hdf5(result.path).wavefunction.scf_eri)
+
+
+if __name__ == "__main__":
+    unittest.main()
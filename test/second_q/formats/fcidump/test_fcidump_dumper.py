@@ -12,6 +12,8 @@
 
 """ Test FCIDump Dumping """
 
+import gzip
+import itertools
 import tempfile
 import unittest
 from abc import ABC, abstractmethod
@@ -186,6 +188,56 @@ class TestFCIDumpDumpOH(QiskitNatureTestCase):
                     for ref, res in zip(reference.readlines(), result.readlines()):
                         self.assertEqual(ref.strip(), res.strip())
 
+    def test_dump_gzip(self):
+        """Tests dumping to and loading from a gzip-compressed file."""
+        path = self.get_resource_path("test_fcidump_oh.fcidump", "second_q/formats/fcidump")
+        fcidump = FCIDump.from_file(path)
+        with tempfile.TemporaryDirectory() as dump_dir:
+            dump_file = Path(dump_dir) / "fcidump"
+            fcidump.to_file(dump_file)
+            gzip_file = Path(dump_dir) / "fcidump.gz"
+            fcidump.to_file(gzip_file)
+
+            with gzip.open(gzip_file, "rt", encoding="utf-8") as compressed:
+                self.assertEqual(compressed.read(), dump_file.read_text(encoding="utf-8"))
+
+            loaded = FCIDump.from_file(gzip_file)
+            for name in ("hij", "hij_b", "hijkl", "hijkl_ba", "hijkl_bb"):
+                with self.subTest(name):
+                    np.testing.assert_array_almost_equal(
+                        getattr(loaded, name), getattr(fcidump, name)
+                    )
+
+    def test_hdf5_round_trip(self):
+        """Tests the lossless round trip through the binary HDF5 format."""
+        path = self.get_resource_path("test_fcidump_oh.fcidump", "second_q/formats/fcidump")
+        fcidump = FCIDump.from_file(path)
+        with tempfile.TemporaryDirectory() as dump_dir:
+            reference_file = Path(dump_dir) / "reference"
+            fcidump.to_file(reference_file)
+            for pack_symmetry, mmap in itertools.product((True, False), repeat=2):
+                with self.subTest(pack_symmetry=pack_symmetry, mmap=mmap):
+                    hdf5_file = Path(dump_dir) / "fcidump.hdf5"
+                    fcidump.to_hdf5(hdf5_file, pack_symmetry=pack_symmetry)
+                    loaded = FCIDump.from_hdf5(hdf5_file, mmap=mmap)
+                    self.assertEqual(
+                        isinstance(loaded.hijkl, np.memmap), mmap and not pack_symmetry
+                    )
+                    self.assertEqual(loaded.num_electrons, fcidump.num_electrons)
+                    self.assertEqual(loaded.multiplicity, fcidump.multiplicity)
+                    self.assertEqual(loaded.orbsym, fcidump.orbsym)
+                    self.assertEqual(loaded.isym, fcidump.isym)
+                    self.assertEqual(loaded.constant_energy, fcidump.constant_energy)
+                    for name in ("hij", "hij_b", "hijkl", "hijkl_ba", "hijkl_bb"):
+                        np.testing.assert_array_equal(getattr(loaded, name), getattr(fcidump, name))
+
+                    text_file = Path(dump_dir) / "fcidump"
+                    loaded.to_file(text_file)
+                    self.assertEqual(
+                        text_file.read_text(encoding="utf-8"),
+                        reference_file.read_text(encoding="utf-8"),
+                    )
+
 
 if __name__ == "__main__":
     unittest.main()
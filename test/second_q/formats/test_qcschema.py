@@ -25,6 +25,7 @@ from test.second_q.formats.qcschema.water_output_v3 import EXPECTED as EXPECTED_
 from ddt import ddt, data, unpack
 
 import h5py
+import numpy as np
 
 from qiskit_nature.second_q.formats.qcschema import QCSchema, QCSchemaInput
 
@@ -55,6 +56,71 @@ class TestQCSchemaJSON(QiskitNatureTestCase):
         qcs = QCSchema.from_json(json_string)
         self.assertEqual(qcs, EXPECTED_WATER_OUTPUT_V3)
 
+    def test_ndarray_storage(self):
+        """Tests that the wavefunction data is stored as numpy arrays."""
+        qcs = QCSchema.from_json(
+            self.get_resource_path(
+                "legacy_electronic_structure_driver_result.json", "second_q/formats/qcschema"
+            )
+        )
+        self.assertIsInstance(qcs.wavefunction.scf_orbitals_a, np.ndarray)
+        self.assertEqual(QCSchema.from_json(qcs.to_json()), qcs)
+
+        with self.subTest("to_dict converts to lists"):
+            wavefunction = qcs.to_dict()["wavefunction"]
+            self.assertIsInstance(wavefunction["scf_orbitals_a"], list)
+            self.assertEqual(
+                wavefunction["scf_orbitals_a"], qcs.wavefunction.scf_orbitals_a.tolist()
+            )
+
+        with self.subTest("HDF5 datasets are read as arrays"):
+            with TemporaryDirectory() as tmp_dir:
+                file_path = Path(tmp_dir) / "tmp.hdf5"
+                with h5py.File(file_path, "w") as file:
+                    qcs.wavefunction.to_hdf5(file)
+                    self.assertIsInstance(file["scf_orbitals_a"], h5py.Dataset)
+                wavefunction = type(qcs.wavefunction).from_hdf5(file_path)
+            self.assertIsInstance(wavefunction.scf_orbitals_a, np.ndarray)
+            self.assertEqual(wavefunction, qcs.wavefunction)
+
+    def test_hdf5_storage_options(self):
+        """Tests the chunked, compressed, symmetry-packed and lazily loaded HDF5 datasets."""
+        qcs = QCSchema.from_json(
+            self.get_resource_path(
+                "legacy_electronic_structure_driver_result.json", "second_q/formats/qcschema"
+            )
+        )
+        with TemporaryDirectory() as tmp_dir:
+            file_path = Path(tmp_dir) / "tmp.hdf5"
+            with h5py.File(file_path, "w") as file:
+                qcs.to_hdf5(file, compression="gzip", compression_opts=4, pack_symmetry=True)
+                dataset = file["wavefunction/scf_eri_mo_aa"]
+                self.assertEqual(dataset.compression, "gzip")
+                self.assertIsNotNone(dataset.chunks)
+                self.assertEqual(dataset.attrs["packing"], "s8")
+                self.assertLess(dataset.size, qcs.wavefunction.scf_eri_mo_aa.size)
+
+            with self.subTest("eager loading"):
+                wavefunction = QCSchema.from_hdf5(file_path).wavefunction
+                self.assertIsInstance(wavefunction.scf_eri_mo_aa, np.ndarray)
+                np.testing.assert_allclose(
+                    wavefunction.scf_eri_mo_aa, qcs.wavefunction.scf_eri_mo_aa, atol=1e-12
+                )
+
+            with self.subTest("lazy loading"):
+                wavefunction = QCSchema.from_hdf5(file_path, lazy=True).wavefunction
+                lazy_eri = wavefunction.scf_eri_mo_aa
+                self.assertNotIsInstance(lazy_eri, np.ndarray)
+                self.assertEqual(lazy_eri.shape, qcs.wavefunction.scf_eri_mo_aa.shape)
+                np.testing.assert_allclose(
+                    np.asarray(lazy_eri), qcs.wavefunction.scf_eri_mo_aa, atol=1e-12
+                )
+                np.testing.assert_array_equal(
+                    wavefunction.scf_orbitals_a[2:5], qcs.wavefunction.scf_orbitals_a[2:5]
+                )
+                with self.assertRaises(ValueError):
+                    lazy_eri.__array__(copy=False)
+
 
 @unittest.skip("Skip until we have settled on the HDF5 specification.")
 @ddt
@@ -0,0 +1,189 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test CholeskyElectronicEnergy"""
+
+import unittest
+
+from test import QiskitNatureTestCase
+
+import numpy as np
+
+from qiskit_nature.second_q.hamiltonians import CholeskyElectronicEnergy, ElectronicEnergy
+from qiskit_nature.second_q.hamiltonians.cholesky_electronic_energy import modified_cholesky
+from qiskit_nature.second_q.operators import ElectronicIntegrals
+from qiskit_nature.second_q.problems import ElectronicBasis
+from qiskit_nature.second_q.transformers import BasisTransformer
+
+
+class TestCholeskyElectronicEnergy(QiskitNatureTestCase):
+    """Test CholeskyElectronicEnergy"""
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(7)
+        self.num_orbitals = 4
+        cholesky = rng.random((self.num_orbitals, self.num_orbitals, 6))
+        self.cholesky_alpha = cholesky + cholesky.transpose(1, 0, 2)
+        cholesky = rng.random((self.num_orbitals, self.num_orbitals, 6))
+        self.cholesky_beta = cholesky + cholesky.transpose(1, 0, 2)
+        h_1 = rng.random((self.num_orbitals, self.num_orbitals))
+        self.h_1 = h_1 + h_1.T
+        density = rng.random((2, self.num_orbitals, self.num_orbitals))
+        self.density = ElectronicIntegrals.from_raw_integrals(
+            density[0] + density[0].T, h1_b=density[1] + density[1].T
+        )
+
+    def assertIntegralsEqual(self, first, second):
+        """Asserts that two ``ElectronicIntegrals`` are numerically equal."""
+        first_coeffs = first.second_q_coeffs()
+        second_coeffs = second.second_q_coeffs()
+        self.assertEqual(set(first_coeffs), set(second_coeffs))
+        for key in first_coeffs:
+            np.testing.assert_array_almost_equal(first_coeffs[key], second_coeffs[key])
+
+    def test_from_electronic_energy(self):
+        """Test the Cholesky decomposition of an existing hamiltonian."""
+        eri = np.einsum("pqQ,rsQ->pqrs", self.cholesky_alpha, self.cholesky_alpha)
+        hamiltonian = ElectronicEnergy.from_raw_integrals(self.h_1, eri)
+        hamiltonian.nuclear_repulsion_energy = 1.0
+
+        factorized = CholeskyElectronicEnergy.from_electronic_energy(hamiltonian, threshold=1e-12)
+
+        with self.subTest("number of vectors"):
+            self.assertLessEqual(factorized.num_cholesky_vectors, 6)
+        with self.subTest("constants"):
+            self.assertEqual(factorized.nuclear_repulsion_energy, 1.0)
+        with self.subTest("integrals"):
+            self.assertIntegralsEqual(
+                factorized.electronic_integrals, hamiltonian.electronic_integrals
+            )
+        with self.subTest("storage"):
+            # the Cholesky vectors must not keep a larger buffer alive
+            cholesky_alpha = factorized.cholesky_alpha
+            buffer = cholesky_alpha if cholesky_alpha.base is None else cholesky_alpha.base
+            self.assertEqual(buffer.nbytes, cholesky_alpha.nbytes)
+
+    def test_from_raw_integrals(self):
+        """Test the construction from raw integrals."""
+        eri = np.einsum("pqQ,rsQ->pqrs", self.cholesky_alpha, self.cholesky_alpha)
+        factorized = CholeskyElectronicEnergy.from_raw_integrals(self.h_1, eri, threshold=1e-12)
+        self.assertIsInstance(factorized, CholeskyElectronicEnergy)
+        self.assertIntegralsEqual(
+            factorized.electronic_integrals,
+            ElectronicEnergy.from_raw_integrals(self.h_1, eri).electronic_integrals,
+        )
+
+    def test_modified_cholesky(self):
+        """Test the decomposition of a matrix requiring more vectors than a single block."""
+        rng = np.random.default_rng(11)
+        factors = rng.random((100, 80))
+        matrix = factors @ factors.T
+        vectors = modified_cholesky(matrix, threshold=1e-10)
+        self.assertEqual(vectors.shape, (100, 80))
+        self.assertTrue(vectors.flags.c_contiguous)
+        np.testing.assert_allclose(vectors @ vectors.T, matrix, atol=1e-8)
+
+    def test_set_electronic_integrals(self):
+        """Test that assigning new integrals factorizes them anew."""
+        one_body = ElectronicIntegrals.from_raw_integrals(self.h_1)
+        factorized = CholeskyElectronicEnergy(one_body, self.cholesky_alpha, self.cholesky_beta)
+
+        eri = np.einsum("pqQ,rsQ->pqrs", self.cholesky_alpha, self.cholesky_alpha)
+        integrals = ElectronicIntegrals.from_raw_integrals(2.0 * self.h_1, eri)
+        factorized.electronic_integrals = integrals
+        self.assertIs(factorized.electronic_integrals, integrals)
+        self.assertIsNone(factorized.cholesky_beta)
+        self.assertIntegralsEqual(factorized.one_body, integrals.one_body)
+
+        dense = ElectronicEnergy(integrals)
+        self.assertIntegralsEqual(factorized.fock(self.density), dense.fock(self.density))
+
+        with self.assertRaises(ValueError):
+            factorized.electronic_integrals = ElectronicIntegrals.from_raw_integrals(
+                self.h_1, eri, self.h_1, eri, eri, auto_index_order=True
+            )
+
+    def test_from_electronic_energy_unrestricted(self):
+        """Test that spin-dependent two-body integrals cannot be factorized."""
+        eri = np.einsum("pqQ,rsQ->pqrs", self.cholesky_alpha, self.cholesky_alpha)
+        hamiltonian = ElectronicEnergy.from_raw_integrals(
+            self.h_1, eri, self.h_1, eri, eri, auto_index_order=True
+        )
+        with self.assertRaises(ValueError):
+            _ = CholeskyElectronicEnergy.from_electronic_energy(hamiltonian)
+
+    def test_fock(self):
+        """Test the coulomb, exchange and fock terms against the full integrals."""
+        one_body = ElectronicIntegrals.from_raw_integrals(self.h_1)
+        for cholesky_beta in (None, self.cholesky_beta):
+            factorized = CholeskyElectronicEnergy(one_body, self.cholesky_alpha, cholesky_beta)
+            dense = ElectronicEnergy(factorized.electronic_integrals)
+            for method in ("coulomb", "exchange", "fock"):
+                with self.subTest(method=method, unrestricted=cholesky_beta is not None):
+                    self.assertIntegralsEqual(
+                        getattr(factorized, method)(self.density),
+                        getattr(dense, method)(self.density),
+                    )
+
+    def test_second_q_op(self):
+        """Test that the operator matches the one of the full integrals."""
+        one_body = ElectronicIntegrals.from_raw_integrals(self.h_1)
+        factorized = CholeskyElectronicEnergy(one_body, self.cholesky_alpha, self.cholesky_beta)
+        dense = ElectronicEnergy(factorized.electronic_integrals)
+        self.assertTrue(factorized.second_q_op().equiv(dense.second_q_op()))
+
+    def test_basis_transformer(self):
+        """Test that the BasisTransformer transforms the Cholesky vectors."""
+        rng = np.random.default_rng(11)
+        coeff_a = rng.random((self.num_orbitals, self.num_orbitals))
+        coeff_b = rng.random((self.num_orbitals, self.num_orbitals))
+        one_body = ElectronicIntegrals.from_raw_integrals(self.h_1)
+
+        for coeff_b_in in (None, coeff_b):
+            for cholesky_beta in (None, self.cholesky_beta):
+                with self.subTest(
+                    unrestricted=coeff_b_in is not None, cholesky_beta=cholesky_beta is not None
+                ):
+                    trafo = BasisTransformer(
+                        ElectronicBasis.AO,
+                        ElectronicBasis.MO,
+                        ElectronicIntegrals.from_raw_integrals(coeff_a, h1_b=coeff_b_in),
+                    )
+                    factorized = CholeskyElectronicEnergy(
+                        one_body, self.cholesky_alpha, cholesky_beta
+                    )
+                    result = trafo.transform_hamiltonian(factorized)
+
+                    # spell out the beta-spin coefficients to also transform the beta-alpha terms
+                    dense_trafo = BasisTransformer(
+                        ElectronicBasis.AO,
+                        ElectronicBasis.MO,
+                        ElectronicIntegrals.from_raw_integrals(
+                            coeff_a, h1_b=coeff_a if coeff_b_in is None else coeff_b_in
+                        ),
+                    )
+                    dense = ElectronicEnergy(
+                        CholeskyElectronicEnergy(
+                            one_body, self.cholesky_alpha, cholesky_beta
+                        ).electronic_integrals
+                    )
+                    expected = dense_trafo.transform_hamiltonian(dense)
+
+                    self.assertIsInstance(result, CholeskyElectronicEnergy)
+                    self.assertIntegralsEqual(
+                        result.electronic_integrals, expected.electronic_integrals
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test DoubleFactorizedHamiltonian"""
+
+import unittest
+
+from test import QiskitNatureTestCase
+
+import numpy as np
+from qiskit.quantum_info import Statevector
+
+from qiskit_nature.second_q.circuit.library import BogoliubovTransform
+from qiskit_nature.second_q.hamiltonians import (
+    CholeskyElectronicEnergy,
+    DoubleFactorizedHamiltonian,
+    ElectronicEnergy,
+)
+from qiskit_nature.second_q.mappers import JordanWignerMapper
+from qiskit_nature.second_q.operators import FermionicOp
+
+
+class TestDoubleFactorizedHamiltonian(QiskitNatureTestCase):
+    """Test DoubleFactorizedHamiltonian"""
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(5)
+        self.num_orbitals = 3
+        cholesky = rng.random((self.num_orbitals, self.num_orbitals, 4))
+        cholesky = cholesky + cholesky.transpose(1, 0, 2)
+        h_1 = rng.random((self.num_orbitals, self.num_orbitals))
+        eri = np.einsum("pqQ,rsQ->pqrs", cholesky, cholesky)
+        self.hamiltonian = ElectronicEnergy.from_raw_integrals(h_1 + h_1.T, eri)
+        self.hamiltonian.nuclear_repulsion_energy = 1.0
+
+    def _excitation_op(self, matrix: np.ndarray) -> FermionicOp:
+        """Constructs the spin-summed one-body operator of a matrix."""
+        num_orbitals = self.num_orbitals
+        return FermionicOp(
+            {
+                f"+_{p + spin * num_orbitals} -_{q + spin * num_orbitals}": matrix[p, q]
+                for p in range(num_orbitals)
+                for q in range(num_orbitals)
+                for spin in (0, 1)
+            },
+            num_spin_orbitals=2 * num_orbitals,
+        )
+
+    def test_factorized_form(self):
+        """Test that the factorized form reproduces the original operator."""
+        expected = self.hamiltonian.second_q_op().normal_order()
+        for hamiltonian in (
+            self.hamiltonian,
+            CholeskyElectronicEnergy.from_electronic_energy(self.hamiltonian, threshold=1e-14),
+        ):
+            with self.subTest(type(hamiltonian).__name__):
+                factorized = DoubleFactorizedHamiltonian.from_electronic_energy(hamiltonian)
+                self.assertEqual(factorized.num_factors, 4)
+                self.assertEqual(factorized.constants["nuclear_repulsion_energy"], 1.0)
+
+                op = self._excitation_op(factorized.one_body_tensor)
+                for eigenvalue, matrix in zip(factorized.eigenvalues, factorized.one_body_squares):
+                    factor = self._excitation_op(matrix)
+                    op += 0.5 * eigenvalue * (factor @ factor)
+                self.assertTrue(op.normal_order().equiv(expected))
+                self.assertTrue(factorized.second_q_op().normal_order().equiv(expected))
+
+    def test_truncation(self):
+        """Test the truncation of the factorization."""
+        factorized = DoubleFactorizedHamiltonian.from_electronic_energy(
+            self.hamiltonian, max_factors=2
+        )
+        self.assertEqual(factorized.num_factors, 2)
+        full = DoubleFactorizedHamiltonian.from_electronic_energy(self.hamiltonian)
+        np.testing.assert_array_almost_equal(factorized.eigenvalues, full.eigenvalues[:2])
+
+        factorized = DoubleFactorizedHamiltonian.from_electronic_energy(
+            self.hamiltonian, threshold=full.eigenvalues[1]
+        )
+        self.assertEqual(factorized.num_factors, 1)
+
+    def test_orbital_rotations(self):
+        """Test that the orbital rotations diagonalize each factor."""
+        factorized = DoubleFactorizedHamiltonian.from_electronic_energy(self.hamiltonian)
+        for rotation, diag_coulomb, eigenvalue, matrix in zip(
+            factorized.orbital_rotations,
+            factorized.diag_coulomb_mats,
+            factorized.eigenvalues,
+            factorized.one_body_squares,
+        ):
+            energies = np.diag(rotation @ matrix @ rotation.T.conj())
+            np.testing.assert_array_almost_equal(
+                rotation @ matrix @ rotation.T.conj(), np.diag(energies)
+            )
+            np.testing.assert_array_almost_equal(
+                diag_coulomb, eigenvalue * np.outer(energies, energies)
+            )
+            circuit = BogoliubovTransform(rotation)
+            self.assertEqual(circuit.num_qubits, self.num_orbitals)
+
+    def test_slater_determinant(self):
+        """Test that the Slater determinants are eigenstates of the factors."""
+        factorized = DoubleFactorizedHamiltonian.from_electronic_energy(self.hamiltonian)
+        mapper = JordanWignerMapper()
+        for factor, operator in enumerate(factorized.one_body_operators()):
+            _, energies, _ = operator.diagonalizing_bogoliubov_transform()
+            matrix = mapper.map(operator.second_q_op()).to_matrix()
+            for occupied_orbitals in ([], [0], [1, 2], [0, 1, 2]):
+                with self.subTest(factor=factor, occupied_orbitals=occupied_orbitals):
+                    circuit = factorized.slater_determinant(factor, occupied_orbitals)
+                    state = np.asarray(Statevector(circuit))
+                    eigenvalue = np.sum(energies[occupied_orbitals])
+                    np.testing.assert_allclose(matrix @ state, eigenvalue * state, atol=1e-7)
+
+    def test_spin_dependent_two_body(self):
+        """Test that spin-dependent two-body integrals cannot be factorized."""
+        integrals = self.hamiltonian.electronic_integrals
+        two_body = integrals.alpha["++--"]
+        hamiltonian = ElectronicEnergy.from_raw_integrals(
+            integrals.alpha["+-"],
+            two_body,
+            integrals.alpha["+-"],
+            2.0 * two_body,
+            two_body,
+            auto_index_order=False,
+        )
+        with self.assertRaises(ValueError):
+            _ = DoubleFactorizedHamiltonian.from_electronic_energy(hamiltonian)
+
+
+if __name__ == "__main__":
+    unittest.main()
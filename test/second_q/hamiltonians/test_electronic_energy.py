@@ -12,6 +12,7 @@
 
 """Test ElectronicEnergy Property"""
 
+import itertools
 import json
 import unittest
 from test.second_q.properties.property_test import PropertyTest
@@ -59,6 +60,107 @@ class TestElectronicEnergy(PropertyTest):
         self.assertNotIn("++--", fock_op.beta)
         self.assertNotIn("++--", fock_op.beta_alpha)
 
+    def test_coulomb_exchange_spin_cases(self):
+        """Test the fused Coulomb and Exchange builds for all spin cases."""
+        rng = np.random.default_rng(13)
+        two_body = [rng.random((3,) * 4) for _ in range(3)]
+        one_body = [rng.random((3, 3)) for _ in range(2)]
+        density_a, density_b = (rng.random((3, 3)) for _ in range(2))
+
+        def expected_terms(h2_aa, h2_bb, h2_ba, d_a, d_b):
+            coulomb_a = np.einsum("pqrs,ps->qr", h2_aa, d_a)
+            coulomb_b = np.einsum("pqrs,ps->qr", h2_bb, d_b)
+            if h2_ba is None:
+                coulomb_a, coulomb_b = 2.0 * coulomb_a, 2.0 * coulomb_b
+            else:
+                coulomb_a += np.einsum("pqrs,ps->qr", h2_ba, d_b)
+                coulomb_b += np.einsum("rspq,ps->rq", h2_ba, d_a)
+            exchange_a = np.einsum("pqrs,qs->pr", h2_aa, d_a)
+            exchange_b = np.einsum("pqrs,qs->pr", h2_bb, d_b)
+            return (coulomb_a, coulomb_b), (exchange_a, exchange_b)
+
+        cases = {
+            "restricted": (
+                ElectronicEnergy.from_raw_integrals(
+                    one_body[0], two_body[0], auto_index_order=False
+                ),
+                (two_body[0], two_body[0], None),
+            ),
+            "unrestricted": (
+                ElectronicEnergy.from_raw_integrals(
+                    one_body[0], two_body[0], one_body[1], *two_body[1:], auto_index_order=False
+                ),
+                (two_body[0], two_body[1], two_body[2]),
+            ),
+        }
+        densities = {
+            "alpha density": (
+                ElectronicIntegrals.from_raw_integrals(density_a, validate=False),
+                (density_a, density_a),
+            ),
+            "alpha and beta density": (
+                ElectronicIntegrals.from_raw_integrals(density_a, h1_b=density_b, validate=False),
+                (density_a, density_b),
+            ),
+        }
+        for (case, (hamiltonian, tensors)), (dens_case, (density, dens)) in itertools.product(
+            cases.items(), densities.items()
+        ):
+            with self.subTest(case=case, density=dens_case):
+                coulomb, exchange = expected_terms(*tensors, *dens)
+                result_coulomb = hamiltonian.coulomb(density)
+                result_exchange = hamiltonian.exchange(density)
+                result_fock = hamiltonian.fock(density)
+                for idx, spin in enumerate(("alpha", "beta")):
+                    # empty beta-spin terms equal the alpha-spin ones
+                    spin_coulomb = getattr(result_coulomb, spin)
+                    spin_exchange = getattr(result_exchange, spin)
+                    spin_fock = getattr(result_fock, spin)
+                    if spin_coulomb.is_empty():
+                        spin_coulomb = result_coulomb.alpha
+                        spin_exchange = result_exchange.alpha
+                        spin_fock = result_fock.alpha
+                    np.testing.assert_array_almost_equal(spin_coulomb["+-"], coulomb[idx])
+                    np.testing.assert_array_almost_equal(spin_exchange["+-"], exchange[idx])
+                    h_1 = one_body[idx] if case == "unrestricted" else one_body[0]
+                    np.testing.assert_array_almost_equal(
+                        spin_fock["+-"], h_1 + coulomb[idx] - exchange[idx]
+                    )
+
+    def test_coulomb_alpha_density_mixed_spin(self):
+        """Test the mixed-spin Coulomb terms of an unrestricted hamiltonian and alpha-only density.
+
+        The missing beta-spin density equals the alpha-spin one, such that the alpha-spin Coulomb
+        operator includes the ``g_ba D_a`` term. This used to be dropped, while the beta-spin
+        operator already included the corresponding ``g_ba^T D_a`` term.
+        """
+        rng = np.random.default_rng(17)
+        h2_aa, h2_bb, h2_ba = (rng.random((3,) * 4) for _ in range(3))
+        h_1 = rng.random((3, 3))
+        density_a = rng.random((3, 3))
+        hamiltonian = ElectronicEnergy.from_raw_integrals(
+            h_1, h2_aa, h_1, h2_bb, h2_ba, auto_index_order=False
+        )
+        density = ElectronicIntegrals.from_raw_integrals(density_a, validate=False)
+
+        coulomb = hamiltonian.coulomb(density)
+        np.testing.assert_array_almost_equal(
+            coulomb.alpha["+-"],
+            np.einsum("pqrs,ps->qr", h2_aa, density_a) + np.einsum("pqrs,ps->qr", h2_ba, density_a),
+        )
+        np.testing.assert_array_almost_equal(
+            coulomb.beta["+-"],
+            np.einsum("pqrs,ps->qr", h2_bb, density_a) + np.einsum("rspq,ps->rq", h2_ba, density_a),
+        )
+
+        explicit = ElectronicIntegrals.from_raw_integrals(density_a, h1_b=density_a, validate=False)
+        for method in ("coulomb", "fock"):
+            with self.subTest(method=method):
+                result = getattr(hamiltonian, method)(density)
+                expected = getattr(hamiltonian, method)(explicit)
+                np.testing.assert_array_almost_equal(result.alpha["+-"], expected.alpha["+-"])
+                np.testing.assert_array_almost_equal(result.beta["+-"], expected.beta["+-"])
+
     def test_from_raw_integrals(self):
         """Test from_raw_integrals utility method."""
         one_body_a = np.random.random((2, 2))
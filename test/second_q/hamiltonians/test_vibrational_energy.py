@@ -16,6 +16,8 @@ import json
 import unittest
 from test.second_q.properties.property_test import PropertyTest
 
+import numpy as np
+
 from qiskit_nature.second_q.formats.watson import WatsonHamiltonian
 from qiskit_nature.second_q.formats.watson_translator import watson_to_problem
 from qiskit_nature.second_q.operators import VibrationalOp
@@ -82,6 +84,7 @@ class TestVibrationalEnergy(PropertyTest):
             ),
         )
 
+        self.watson = watson
         problem = watson_to_problem(watson, basis)
         self.prop = problem.hamiltonian
 
@@ -97,6 +100,36 @@ class TestVibrationalEnergy(PropertyTest):
 
         self.assertTrue(op.equiv(expected))
 
+    def test_watson_to_problem(self):
+        """Test that the vectorized mapping matches the term-wise mapping of the basis."""
+
+        class TermWiseBasis(HarmonicBasis):
+            """A basis overwriting map, which disables the vectorized mapping."""
+
+            def map(self, coefficient, modes):
+                yield from super().map(coefficient, modes)
+
+        with self.subTest("iter_arrays"):
+            terms = [
+                (value, tuple(index))
+                for values, indices in self.watson.iter_arrays()
+                for value, index in zip(values, indices.tolist())
+            ]
+            self.assertEqual(terms, list(self.watson))
+            self.assertEqual(terms[-1], (-115.653915, (-4, -4)))
+
+        for num_modals in ([2, 2, 2, 2], [3, 2, 4, 2]):
+            with self.subTest(num_modals=num_modals):
+                expected = watson_to_problem(self.watson, TermWiseBasis(num_modals))
+                problem = watson_to_problem(self.watson, HarmonicBasis(num_modals))
+                expected_integrals = expected.hamiltonian.vibrational_integrals
+                integrals = problem.hamiltonian.vibrational_integrals
+                self.assertEqual(set(integrals), set(expected_integrals))
+                for key, tensor in integrals.items():
+                    self.assertEqual(tensor.shape, expected_integrals[key].shape)
+                    np.testing.assert_array_equal(tensor.coords, expected_integrals[key].coords)
+                    np.testing.assert_allclose(tensor.data, expected_integrals[key].data)
+
 
 if __name__ == "__main__":
     unittest.main()
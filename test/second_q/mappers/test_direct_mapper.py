@@ -22,6 +22,7 @@ from test.second_q.mappers.resources.reference_direct_mapper import (
 
 from qiskit_nature.second_q.drivers import GaussianForcesDriver
 from qiskit_nature.second_q.mappers import DirectMapper
+from qiskit_nature.second_q.operators import VibrationalOp
 from qiskit_nature.second_q.problems import HarmonicBasis
 import qiskit_nature.optionals as _optionals
 
@@ -70,6 +71,36 @@ class TestDirectMapper(QiskitNatureTestCase):
 
         self.assertEqual(qubit_op, _num_modals_3_q_op)
 
+    def test_mapping_matches_mode_based_mapping(self):
+        """Test the vectorized mapping against the generic mode-based mapping."""
+        vibration_op = VibrationalOp(
+            {
+                "": 0.5,
+                "+_0_0": 1.0,
+                "-_1_1": 2.0j,
+                "+_0_1 -_0_0": 1.5,
+                "+_0_0 -_0_0": -0.5,
+                "-_0_0 +_0_0 -_0_0": 0.25,
+                "+_1_0 +_1_0": 3.0,
+                "+_0_0 -_1_2 -_0_0 +_1_2": 0.75 - 0.25j,
+            },
+            num_modals=[2, 3],
+        )
+
+        mapper = DirectMapper()
+        qubit_op = mapper.map(vibration_op)
+        expected = DirectMapper.mode_based_mapping(vibration_op, 5)
+
+        self.assertTrue(qubit_op.primitive.equiv(expected.primitive))
+
+    def test_changed_num_modals(self):
+        """Test that changing the number of modals is reflected by the cached mapping."""
+        vibration_op = VibrationalOp({"+_0_0 -_1_0": 1.0}, num_modals=[1, 1])
+        mapper = DirectMapper()
+        self.assertEqual(mapper.map(vibration_op).num_qubits, 2)
+        vibration_op.num_modals = [2, 2]
+        self.assertEqual(mapper.map(vibration_op).num_qubits, 4)
+
     def test_allows_two_qubit_reduction(self):
         """Test this returns False for this mapper"""
         mapper = DirectMapper()
@@ -15,6 +15,8 @@
 import unittest
 from test import QiskitNatureTestCase
 
+import numpy as np
+
 from qiskit.circuit import Parameter
 from qiskit.quantum_info import SparsePauliOp
 from qiskit.opflow import I, PauliSumOp, X, Y, Z
@@ -144,6 +146,30 @@ class TestJordanWignerMapper(QiskitNatureTestCase):
         for k in mapped_ops.keys():
             self.assertEqual(mapped_ops[k], expected[k])
 
+    def test_mapping_is_cached(self):
+        """Test that repeated mappings of the same operator are reused."""
+        mapper = JordanWignerMapper()
+        op_a = FermionicOp({"+_0 -_1": 1.0, "+_1 -_0": 1.0}, num_spin_orbitals=2)
+        op_b = FermionicOp({"+_1 -_0": 1.0, "+_0 -_1": 1.0}, num_spin_orbitals=2)
+        self.assertIs(mapper.map(op_a), mapper.map(op_b))
+
+        op_c = FermionicOp({"+_0 -_1": 1.0, "+_1 -_0": 1.0}, num_spin_orbitals=3)
+        self.assertEqual(mapper.map(op_c).num_qubits, 3)
+
+        with self.subTest("operators within the tolerance are mapped exactly"):
+            op_d = FermionicOp({"+_0 -_1": 1.0 + 1e-10, "+_1 -_0": 1.0}, num_spin_orbitals=2)
+            self.assertIsNot(mapper.map(op_d), mapper.map(op_a))
+            expected = JordanWignerMapper().map(op_d).primitive
+            qubit_op = mapper.map(op_d).primitive
+            self.assertEqual(qubit_op.paulis, expected.paulis)
+            np.testing.assert_array_equal(qubit_op.coeffs, expected.coeffs)
+
+        with self.subTest("changed number of spin orbitals"):
+            op_e = FermionicOp({"+_0 -_1": 1.0}, num_spin_orbitals=2)
+            self.assertEqual(mapper.map(op_e).num_qubits, 2)
+            op_e.num_spin_orbitals = 4
+            self.assertEqual(mapper.map(op_e).num_qubits, 4)
+
 
 if __name__ == "__main__":
     unittest.main()
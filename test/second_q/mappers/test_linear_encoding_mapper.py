@@ -0,0 +1,112 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Linear Encoding Mapper """
+
+import unittest
+from test import QiskitNatureTestCase
+
+import numpy as np
+from ddt import ddt, data
+
+from qiskit_nature import QiskitNatureError
+from qiskit_nature.second_q.mappers import (
+    BravyiKitaevMapper,
+    JordanWignerMapper,
+    LinearEncodingMapper,
+    ParityMapper,
+)
+from qiskit_nature.second_q.mappers.bravyi_kitaev_mapper import _fenwick_encoding
+from qiskit_nature.second_q.operators import FermionicOp
+
+
+@ddt
+class TestLinearEncodingMapper(QiskitNatureTestCase):
+    """Test Linear Encoding Mapper"""
+
+    FERMIONIC_OP = FermionicOp(
+        {
+            "+_0 -_0": 0.5,
+            "+_1 -_3": 1.0,
+            "+_3 -_1": 1.0,
+            "+_0 +_2 -_4 -_1": 0.25j,
+            "+_1 +_4 -_2 -_0": -0.25j,
+        },
+        num_spin_orbitals=5,
+    )
+
+    @data(1, 2, 4, 5, 8, 11)
+    def test_fenwick_encoding(self, nmodes):
+        """Test the Fenwick encoding reproduces the Bravyi-Kitaev Pauli table."""
+        mapper = LinearEncodingMapper(_fenwick_encoding(nmodes))
+        self.assertTrue(np.all(np.tril(mapper.encoding) == mapper.encoding))
+        op = FermionicOp({"+_0 -_0": 1.0}, num_spin_orbitals=nmodes)
+        self.assertEqual(mapper.map(op), BravyiKitaevMapper().map(op))
+
+    def test_mapping(self):
+        """Test mapping with the encodings of the existing mappers."""
+        nmodes = self.FERMIONIC_OP.register_length
+        with self.subTest("Jordan-Wigner"):
+            mapper = LinearEncodingMapper(np.eye(nmodes))
+            self.assertEqual(
+                mapper.map(self.FERMIONIC_OP), JordanWignerMapper().map(self.FERMIONIC_OP)
+            )
+
+        with self.subTest("Parity"):
+            mapper = LinearEncodingMapper(np.tril(np.ones((nmodes, nmodes))))
+            self.assertEqual(mapper.map(self.FERMIONIC_OP), ParityMapper().map(self.FERMIONIC_OP))
+
+        with self.subTest("Bravyi-Kitaev"):
+            mapper = LinearEncodingMapper(_fenwick_encoding(nmodes))
+            self.assertEqual(
+                mapper.map(self.FERMIONIC_OP), BravyiKitaevMapper().map(self.FERMIONIC_OP)
+            )
+
+    def test_custom_encoding(self):
+        """Test a custom encoding preserves the spectrum."""
+        encoding = np.asarray(
+            [
+                [1, 1, 0, 0, 0],
+                [0, 1, 0, 0, 0],
+                [0, 1, 1, 0, 1],
+                [0, 0, 0, 1, 0],
+                [1, 0, 0, 1, 1],
+            ]
+        )
+        qubit_op = LinearEncodingMapper(encoding).map(self.FERMIONIC_OP)
+        expected = JordanWignerMapper().map(self.FERMIONIC_OP)
+        np.testing.assert_array_almost_equal(
+            np.linalg.eigvalsh(qubit_op.to_matrix()), np.linalg.eigvalsh(expected.to_matrix())
+        )
+
+    def test_invalid_encoding(self):
+        """Test invalid encodings raise an error."""
+        with self.subTest("not square"):
+            with self.assertRaises(QiskitNatureError):
+                LinearEncodingMapper(np.ones((2, 3)))
+
+        with self.subTest("singular"):
+            with self.assertRaises(QiskitNatureError):
+                LinearEncodingMapper(np.asarray([[1, 1, 0], [0, 1, 1], [1, 0, 1]]))
+
+        with self.subTest("too small"):
+            with self.assertRaises(QiskitNatureError):
+                LinearEncodingMapper(np.eye(3)).map(self.FERMIONIC_OP)
+
+    def test_allows_two_qubit_reduction(self):
+        """Test this returns False for this mapper"""
+        mapper = LinearEncodingMapper(np.eye(2))
+        self.assertFalse(mapper.allows_two_qubit_reduction)
+
+
+if __name__ == "__main__":
+    unittest.main()
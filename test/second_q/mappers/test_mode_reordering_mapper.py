@@ -0,0 +1,100 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Mode Reordering Mapper """
+
+import unittest
+from test import QiskitNatureTestCase
+
+import numpy as np
+from ddt import ddt, data
+
+from qiskit_nature import QiskitNatureError
+from qiskit_nature.second_q.mappers import (
+    JordanWignerMapper,
+    ModeReorderingMapper,
+    ParityMapper,
+)
+from qiskit_nature.second_q.operators import FermionicOp
+
+
+def _pauli_weight(qubit_op):
+    paulis = qubit_op.primitive.paulis
+    return np.sum(paulis.x | paulis.z)
+
+
+@ddt
+class TestModeReorderingMapper(QiskitNatureTestCase):
+    """Test Mode Reordering Mapper"""
+
+    def setUp(self):
+        super().setUp()
+        # a nearest-neighbor hopping chain whose sites are numbered in a scrambled order
+        self.chain = [3, 7, 0, 5, 1, 8, 2, 6, 4]
+        hopping = {}
+        for site_a, site_b in zip(self.chain[:-1], self.chain[1:]):
+            hopping[f"+_{site_a} -_{site_b}"] = -1.0
+            hopping[f"+_{site_b} -_{site_a}"] = -1.0
+        for site in self.chain:
+            hopping[f"+_{site} -_{site}"] = 0.5
+        self.hopping_op = FermionicOp(hopping, num_spin_orbitals=len(self.chain))
+
+    @data("total", "max")
+    def test_from_operator(self, objective):
+        """Test the optimized permutation reduces the Pauli weight."""
+        mapper = ModeReorderingMapper.from_operator(
+            JordanWignerMapper(), self.hopping_op, objective=objective
+        )
+        qubit_op = mapper.map(self.hopping_op)
+        reference_op = JordanWignerMapper().map(self.hopping_op)
+
+        with self.subTest("Pauli weight"):
+            # each hopping term maps onto XX and YY acting on neighboring qubits only
+            num_hoppings = len(self.chain) - 1
+            self.assertEqual(_pauli_weight(qubit_op), 2 * 2 * num_hoppings + len(self.chain))
+            self.assertLess(_pauli_weight(qubit_op), _pauli_weight(reference_op))
+
+        with self.subTest("neighboring sites"):
+            positions = [mapper.permutation[site] for site in self.chain]
+            self.assertTrue(np.all(np.abs(np.diff(positions)) == 1))
+
+        with self.subTest("spectrum"):
+            np.testing.assert_array_almost_equal(
+                np.linalg.eigvalsh(qubit_op.to_matrix()),
+                np.linalg.eigvalsh(reference_op.to_matrix()),
+            )
+
+    def test_permutation(self):
+        """Test the mapping with a fixed permutation."""
+        mapper = ModeReorderingMapper(ParityMapper(), [1, 2, 0])
+        op = FermionicOp({"+_0 -_1": 1.0, "+_2 -_2": 2.0}, num_spin_orbitals=3)
+        expected = ParityMapper().map(FermionicOp({"+_1 -_2": 1.0, "+_0 -_0": 2.0}))
+        self.assertEqual(mapper.map(op), expected)
+        self.assertEqual(mapper.inverse_permutation, [2, 0, 1])
+        self.assertFalse(mapper.allows_two_qubit_reduction)
+
+    def test_invalid_inputs(self):
+        """Test invalid inputs raise an error."""
+        with self.subTest("objective"):
+            with self.assertRaises(QiskitNatureError):
+                ModeReorderingMapper.from_operator(
+                    JordanWignerMapper(), self.hopping_op, objective="mean"
+                )
+
+        with self.subTest("register length"):
+            mapper = ModeReorderingMapper(JordanWignerMapper(), [1, 0])
+            with self.assertRaises(QiskitNatureError):
+                mapper.map(self.hopping_op)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -128,6 +128,24 @@ class TestQubitConverter(QiskitNatureTestCase):
             qubit_op = qubit_conv.convert_match(self.h2_op)
             self.assertEqual(qubit_op, TestQubitConverter.REF_H2_PARITY_2Q_REDUCED)
 
+    def test_conversion_is_cached(self):
+        """Test that repeated conversions of the same operator are reused"""
+        qubit_conv = QubitConverter(ParityMapper(), two_qubit_reduction=True)
+        qubit_op = qubit_conv.convert_only(self.h2_op, num_particles=self.num_particles)
+        self.assertEqual(qubit_op, TestQubitConverter.REF_H2_PARITY_2Q_REDUCED)
+        self.assertIs(
+            qubit_conv.convert_only(self.h2_op, num_particles=self.num_particles), qubit_op
+        )
+
+        with self.subTest("Different number of particles"):
+            qubit_op = qubit_conv.convert_only(self.h2_op)
+            self.assertEqual(qubit_op, TestQubitConverter.REF_H2_PARITY)
+
+        with self.subTest("Different mapper"):
+            qubit_conv.mapper = JordanWignerMapper()
+            qubit_op = qubit_conv.convert_only(self.h2_op, num_particles=self.num_particles)
+            self.assertEqual(qubit_op, TestQubitConverter.REF_H2_JW)
+
     def test_two_qubit_reduction(self):
         """Test mapping to qubit operator with two qubit reduction"""
         mapper = ParityMapper()
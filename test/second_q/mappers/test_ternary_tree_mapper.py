@@ -0,0 +1,86 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+""" Test Ternary Tree Mapper """
+
+import unittest
+from itertools import combinations
+from test import QiskitNatureTestCase
+
+import numpy as np
+from ddt import ddt, data
+from qiskit.opflow import PauliSumOp
+
+from qiskit_nature.second_q.mappers import JordanWignerMapper, TernaryTreeMapper
+from qiskit_nature.second_q.operators import FermionicOp
+
+
+@ddt
+class TestTernaryTreeMapper(QiskitNatureTestCase):
+    """Test Ternary Tree Mapper"""
+
+    @data(1, 2, 4, 5, 13, 14)
+    def test_pauli_table(self, nmodes):
+        """Test the Majorana operators anticommute and have logarithmic Pauli weight."""
+        majoranas = [pauli for paulis in TernaryTreeMapper.pauli_table(nmodes) for pauli in paulis]
+        for pauli_a, pauli_b in combinations(majoranas, 2):
+            self.assertTrue(pauli_a.anticommutes(pauli_b))
+
+        max_weight = int(np.ceil(np.log(2 * nmodes + 1) / np.log(3)))
+        for pauli in majoranas:
+            self.assertLessEqual(np.sum(pauli.x | pauli.z), max_weight)
+
+    def test_mapping_for_single_op(self):
+        """Test for single register operator."""
+        with self.subTest("test +"):
+            op = FermionicOp({"+_0": 1}, num_spin_orbitals=1)
+            expected = PauliSumOp.from_list([("X", 0.5), ("Y", -0.5j)])
+            self.assertEqual(TernaryTreeMapper().map(op), expected)
+
+        with self.subTest("test N"):
+            op = FermionicOp({"+_0 -_0": 1}, num_spin_orbitals=1)
+            expected = PauliSumOp.from_list([("I", 0.5), ("Z", -0.5)])
+            self.assertEqual(TernaryTreeMapper().map(op), expected)
+
+    def test_vacuum(self):
+        """Test the fermionic vacuum is mapped onto the all-zero state."""
+        for mode in range(5):
+            op = FermionicOp({f"-_{mode}": 1}, num_spin_orbitals=5)
+            matrix = TernaryTreeMapper().map(op).to_matrix()
+            np.testing.assert_array_almost_equal(matrix[:, 0], np.zeros(2**5))
+
+    def test_spectrum(self):
+        """Test the mapping preserves the spectrum."""
+        op = FermionicOp(
+            {
+                "+_0 -_0": 0.5,
+                "+_1 -_3": 1.0,
+                "+_3 -_1": 1.0,
+                "+_0 +_2 -_4 -_1": 0.25j,
+                "+_1 +_4 -_2 -_0": -0.25j,
+            },
+            num_spin_orbitals=5,
+        )
+        qubit_op = TernaryTreeMapper().map(op)
+        expected = JordanWignerMapper().map(op)
+        np.testing.assert_array_almost_equal(
+            np.linalg.eigvalsh(qubit_op.to_matrix()), np.linalg.eigvalsh(expected.to_matrix())
+        )
+
+    def test_allows_two_qubit_reduction(self):
+        """Test this returns False for this mapper"""
+        mapper = TernaryTreeMapper()
+        self.assertFalse(mapper.allows_two_qubit_reduction)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -517,6 +517,56 @@ class TestElectronicIntegrals(QiskitNatureTestCase):
             )
             self.assertTrue(tensor.equiv(expected))
 
+    @unittest.skipIf(not _optionals.HAS_SPARSE, "Sparse not available.")
+    def test_screen(self):
+        """Test ElectronicIntegrals.screen"""
+        import sparse as sp  # pylint: disable=import-error
+
+        from qiskit_nature.second_q.operators.tensor_ordering import (
+            IndexType,
+            to_physicist_ordering,
+        )
+
+        # positive semi-definite two-body integrals of orbitals with a decaying overlap
+        num_orbs = 6
+        distance = np.abs(np.subtract.outer(np.arange(num_orbs), np.arange(num_orbs)))
+        vectors = np.asarray(
+            [np.exp(-3.0 * (distance + idx)) * np.cos(distance + idx) for idx in range(3)]
+        )
+        two_body = to_physicist_ordering(
+            np.einsum("kpq,krs->pqrs", vectors, vectors), index_order=IndexType.CHEMIST
+        )
+        one_body = np.exp(-8.0 * distance)
+
+        def discarded(integrals, screened) -> float:
+            difference = integrals.second_q_coeffs().to_dense() - screened.second_q_coeffs()
+            return sum(np.sum(np.abs(difference[key])) for key in difference if key != "")
+
+        for label, integrals in [
+            ("restricted", ElectronicIntegrals.from_raw_integrals(one_body, two_body)),
+            (
+                "unrestricted",
+                ElectronicIntegrals.from_raw_integrals(
+                    one_body, two_body, 0.5 * one_body, 0.5 * two_body, 0.7 * two_body
+                ),
+            ),
+        ]:
+            with self.subTest(label):
+                screened, error = integrals.screen(1e-3, sparse_density=0.5)
+                self.assertTrue(screened.alpha.is_sparse())
+                self.assertIsInstance(screened.alpha["++--"], sp.COO)
+                self.assertEqual(screened.beta.is_empty(), integrals.beta.is_empty())
+                self.assertEqual(screened.beta_alpha.is_empty(), integrals.beta_alpha.is_empty())
+                self.assertLess(screened.alpha["++--"].nnz, two_body.size)
+                self.assertGreater(error, 0.0)
+                self.assertLessEqual(discarded(integrals, screened), error + 1e-12)
+
+        with self.subTest("dense storage"):
+            integrals = ElectronicIntegrals.from_raw_integrals(one_body, two_body)
+            screened, error = integrals.screen(1e-3, schwarz=False, sparse_density=0.0)
+            self.assertTrue(screened.alpha.is_dense())
+            self.assertAlmostEqual(discarded(integrals, screened), error)
+
 
 if __name__ == "__main__":
     unittest.main()
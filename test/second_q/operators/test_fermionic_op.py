@@ -464,6 +464,23 @@ class TestFermionicOp(QiskitNatureTestCase):
             targ = FermionicOp({"-_0 +_1": 1})
             self.assertEqual(fer_op, targ)
 
+    def test_permute_indices(self):
+        """test permute_indices method"""
+        with self.subTest("Test permutation"):
+            orig = FermionicOp({"+_0 -_1": 1, "+_2 -_2": 2j, "": 3}, num_spin_orbitals=3)
+            fer_op = orig.permute_indices([2, 0, 1])
+            targ = FermionicOp({"+_2 -_0": 1, "+_1 -_1": 2j, "": 3}, num_spin_orbitals=3)
+            self.assertEqual(fer_op, targ)
+
+        with self.subTest("Test inverse permutation"):
+            orig = FermionicOp({"+_0 -_1 +_3": 1, "-_2": 2}, num_spin_orbitals=4)
+            fer_op = orig.permute_indices([3, 0, 1, 2]).permute_indices([1, 2, 3, 0])
+            self.assertEqual(fer_op, orig)
+
+        with self.subTest("Test invalid permutation"):
+            with self.assertRaises(ValueError):
+                FermionicOp({"+_0 -_1": 1}).permute_indices([0, 0])
+
     def test_induced_norm(self):
         """Test induced norm."""
         op = 3 * FermionicOp({"+_0": 1}, num_spin_orbitals=1) + 4j * FermionicOp(
@@ -0,0 +1,87 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test for OperatorCache"""
+
+import unittest
+from test import QiskitNatureTestCase
+
+from qiskit.circuit import Parameter
+
+from qiskit_nature.second_q.operators import FermionicOp, OperatorCache, SpinOp
+
+
+class TestOperatorCache(QiskitNatureTestCase):
+    """OperatorCache tests."""
+
+    def test_intern(self):
+        """Test interning of operators."""
+        cache = OperatorCache()
+        op_a = cache.intern(FermionicOp({"+_0 -_1": 1.0, "+_1 -_0": 1.0}))
+        op_b = cache.intern(FermionicOp({"+_1 -_0": 1.0, "+_0 -_1": 1.0 + 1e-12}))
+        self.assertIs(op_a, op_b)
+
+        with self.subTest("different register length"):
+            op_c = cache.intern(FermionicOp({"+_0 -_1": 1.0, "+_1 -_0": 1.0}, num_spin_orbitals=4))
+            self.assertIsNot(op_a, op_c)
+
+        with self.subTest("different operator type"):
+            op_d = cache.intern(SpinOp({"X_0": 1.0}))
+            op_e = cache.intern(SpinOp({"X_0": 1.0}, spin=1))
+            self.assertIsNot(op_d, op_e)
+
+        with self.subTest("parameters"):
+            param = Parameter("a")
+            op_f = FermionicOp({"+_0 -_1": param})
+            self.assertIs(cache.intern(op_f), op_f)
+            self.assertIsNot(cache.intern(FermionicOp({"+_0 -_1": param})), op_f)
+
+    def test_get_or_build(self):
+        """Test memoization of built objects."""
+        cache = OperatorCache()
+        calls = []
+
+        def builder():
+            calls.append(None)
+            return FermionicOp({"+_0 -_0": 1.0})
+
+        op_a = cache.get_or_build("key", builder)
+        op_b = cache.get_or_build("key", builder)
+        self.assertIs(op_a, op_b)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_eviction(self):
+        """Test the least-recently-used eviction."""
+        cache = OperatorCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits, 0)
+
+    def test_invalid_maxsize(self):
+        """Test the maxsize validation."""
+        with self.assertRaises(ValueError):
+            _ = OperatorCache(maxsize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
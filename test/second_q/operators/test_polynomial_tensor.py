@@ -21,6 +21,7 @@ import numpy as np
 from ddt import ddt, idata
 
 from qiskit_nature.second_q.operators import PolynomialTensor
+from qiskit_nature.settings import settings
 import qiskit_nature.optionals as _optionals
 
 
@@ -843,6 +844,106 @@ class TestPolynomialTensor(QiskitNatureTestCase):
 
                 self.assertTrue(result.equiv(expected))
 
+    def test_sparse_contractions(self):
+        """Test that sufficiently sparse data stays sparse throughout einsum, compose and tensor"""
+        import sparse as sp  # pylint: disable=import-error
+
+        num_orbs = 6
+        one_body = sp.random((num_orbs, num_orbs), density=0.05, random_state=1)
+        two_body = sp.random((num_orbs,) * 4, density=0.02, random_state=2)
+        tensor = PolynomialTensor({"": 1.5, "+-": one_body, "++--": two_body})
+        dense_tensor = tensor.to_dense()
+
+        with self.subTest("einsum with a sparse density"):
+            density = PolynomialTensor(
+                {"+-": sp.random((num_orbs, num_orbs), density=0.05, random_state=3)}
+            )
+            einsum_map = {
+                "pqrs,ps->qr": ("++--", "+-", "+-"),
+                "pqrs,qs->pr": ("++--", "+-", "+-"),
+            }
+            result = PolynomialTensor.einsum(einsum_map, tensor, density)
+            expected = PolynomialTensor.einsum(einsum_map, dense_tensor, density.to_dense())
+            self.assertTrue(result.is_sparse())
+            self.assertTrue(result.equiv(expected))
+
+        with self.subTest("einsum with dense coefficients"):
+            coeffs = PolynomialTensor({"+-": np.random.random((num_orbs, num_orbs))})
+            einsum_map = {
+                "jk,ji,kl->il": ("+-", "+-", "+-", "+-"),
+                "prsq,pi,qj,rk,sl->iklj": ("++--", "+-", "+-", "+-", "+-", "++--"),
+            }
+            result = PolynomialTensor.einsum(einsum_map, tensor, coeffs, coeffs, coeffs, coeffs)
+            expected = PolynomialTensor.einsum(
+                einsum_map, dense_tensor, coeffs, coeffs, coeffs, coeffs
+            )
+            self.assertTrue(result.equiv(expected))
+
+        # keep the dense references of the products small
+        num_orbs = 3
+        one_body = sp.random((num_orbs, num_orbs), density=0.2, random_state=4)
+        two_body = sp.random((num_orbs,) * 4, density=0.05, random_state=5)
+        tensor = PolynomialTensor({"": 1.5, "+-": one_body, "++--": two_body})
+        dense_tensor = tensor.to_dense()
+
+        with self.subTest("compose"):
+            result = tensor.compose(tensor)
+            self.assertIsInstance(result["+-++--"], sp.COO)
+            self.assertTrue(result.equiv(dense_tensor.compose(dense_tensor)))
+
+        with self.subTest("tensor"):
+            result = tensor.tensor(tensor)
+            self.assertIsInstance(result["+-++--"], sp.COO)
+            self.assertTrue(result.equiv(dense_tensor.tensor(dense_tensor)))
+
+        with self.subTest("expand"):
+            result = tensor.expand(tensor)
+            self.assertIsInstance(result["++--+-"], sp.COO)
+            self.assertTrue(result.equiv(dense_tensor.expand(dense_tensor)))
+
+        with self.subTest("sparse density threshold"):
+            threshold = settings.sparse_density_threshold
+            try:
+                settings.sparse_density_threshold = 0.0
+                result = tensor.compose(tensor)
+                self.assertIsInstance(result["+-++--"], np.ndarray)
+            finally:
+                settings.sparse_density_threshold = threshold
+
+    @unittest.skipIf(not _optionals.HAS_SPARSE, "Sparse not available.")
+    def test_screen(self):
+        """Test PolynomialTensor.screen"""
+        import sparse as sp  # pylint: disable=import-error
+
+        one_body = np.asarray([[1.0, 1e-9], [1e-9, 2.0]])
+        two_body = np.zeros((2, 2, 2, 2))
+        two_body[0, 0, 0, 0] = two_body[1, 1, 1, 1] = 1.0
+        two_body[0, 0, 1, 1] = two_body[1, 1, 0, 0] = 1e-6
+        two_body[0, 1, 0, 1] = 1e-8
+        tensor = PolynomialTensor({"": 0.5, "+-": one_body, "++--": two_body})
+
+        with self.subTest("absolute threshold"):
+            screened, error = tensor.screen(1e-7, sparse_density=0.0)
+            self.assertTrue(screened.is_dense())
+            self.assertEqual(screened[""], 0.5)
+            self.assertEqual(np.count_nonzero(screened["+-"]), 2)
+            self.assertEqual(np.count_nonzero(screened["++--"]), 4)
+            self.assertAlmostEqual(error, 2e-9 + 1e-8)
+
+        with self.subTest("Schwarz screening"):
+            # the Schwarz factor of the pair (0, 1) is 1e-3, thus the (0, 1) and (1, 0) pairs can be
+            # skipped for a threshold of 1e-2 and their bound gets reported
+            screened, error = tensor.screen(1e-2, schwarz=True, sparse_density=1.0)
+            self.assertIsInstance(screened["++--"], sp.COO)
+            self.assertEqual(screened["++--"].nnz, 2)
+            self.assertAlmostEqual(error, 2e-9 + (2 + 2e-3) ** 2 - 4)
+
+        with self.subTest("sparse input"):
+            screened, error = tensor.to_sparse().screen(1e-7)
+            self.assertTrue(screened.is_sparse())
+            self.assertEqual(screened["++--"].nnz, 4)
+            self.assertAlmostEqual(error, 2e-9 + 1e-8)
+
 
 if __name__ == "__main__":
     unittest.main()
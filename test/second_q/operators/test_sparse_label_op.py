@@ -568,6 +568,49 @@ class TestSparseLabelOp(QiskitNatureTestCase):
         op = DummySparseLabelOp({"+_0 -_1": a, "+_0 -_2": b})
         self.assertEqual(op.parameters(), [a, b])
 
+    def test_fingerprint(self):
+        """Test fingerprint."""
+        reference = DummySparseLabelOp(op2).fingerprint()
+
+        with self.subTest("term order"):
+            test_op = DummySparseLabelOp({"+_0 -_2": 1.0, "+_0 -_1": 0.5})
+            self.assertEqual(test_op.fingerprint(), reference)
+
+        with self.subTest("numerical noise"):
+            test_op = DummySparseLabelOp({"+_0 -_1": 0.5 + 1e-12, "+_0 -_2": 1.0 - 1e-12j})
+            self.assertEqual(test_op.fingerprint(), reference)
+
+        with self.subTest("negligible terms"):
+            test_op = DummySparseLabelOp({**op2, "+_0 -_3": 1e-12})
+            self.assertEqual(test_op.fingerprint(), reference)
+
+        with self.subTest("different coefficients"):
+            test_op = DummySparseLabelOp({"+_0 -_1": 0.5, "+_0 -_2": 1.1})
+            self.assertNotEqual(test_op.fingerprint(), reference)
+            self.assertEqual(
+                test_op.fingerprint(atol=0.5), DummySparseLabelOp(op2).fingerprint(0.5)
+            )
+
+        with self.subTest("different labels"):
+            self.assertNotEqual(DummySparseLabelOp(op3).fingerprint(), reference)
+
+        with self.subTest("exact"):
+            exact_reference = DummySparseLabelOp(op2).fingerprint(exact=True)
+            test_op = DummySparseLabelOp({"+_0 -_2": 1.0, "+_0 -_1": 0.5})
+            self.assertEqual(test_op.fingerprint(exact=True), exact_reference)
+            test_op = DummySparseLabelOp({"+_0 -_1": 0.5 + 1e-12, "+_0 -_2": 1.0})
+            self.assertNotEqual(test_op.fingerprint(exact=True), exact_reference)
+            test_op = DummySparseLabelOp({**op2, "+_0 -_3": 1e-12})
+            self.assertNotEqual(test_op.fingerprint(exact=True), exact_reference)
+
+        with self.subTest("parameters"):
+            test_op = DummySparseLabelOp(opParameter)
+            self.assertEqual(
+                test_op.fingerprint(),
+                DummySparseLabelOp({"+_0 -_2": b, "+_0 -_1": a}).fingerprint(),
+            )
+            self.assertNotEqual(test_op.fingerprint(), reference)
+
 
 if __name__ == "__main__":
     unittest.main()
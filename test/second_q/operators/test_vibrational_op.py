@@ -14,7 +14,10 @@
 import unittest
 from test import QiskitNatureTestCase
 
-from qiskit_nature.second_q.operators import VibrationalOp
+import numpy as np
+
+import qiskit_nature.optionals as _optionals
+from qiskit_nature.second_q.operators import PolynomialTensor, VibrationalOp
 
 
 class TestVibrationalOp(QiskitNatureTestCase):
@@ -365,6 +368,58 @@ class TestVibrationalOp(QiskitNatureTestCase):
             targ = VibrationalOp({"-_0_0 +_0_1 +_1_0 -_1_1": 1})
             self.assertEqual(vib_op, targ)
 
+    def test_from_polynomial_tensor(self):
+        """Test from PolynomialTensor"""
+        one_body = np.arange(1, 9, dtype=float).reshape((2, 2, 2))
+        two_body = np.zeros((2, 2, 2, 3, 1, 1))
+        two_body[0, 1, 0, 2, 0, 0] = 0.5
+
+        expected = VibrationalOp(
+            {
+                "": 1.5,
+                "+_0_0 -_0_0": 1.0,
+                "+_0_0 -_0_1": 2.0,
+                "+_0_1 -_0_0": 3.0,
+                "+_0_1 -_0_1": 4.0,
+                "+_1_0 -_1_0": 5.0,
+                "+_1_0 -_1_1": 6.0,
+                "+_1_1 -_1_0": 7.0,
+                "+_1_1 -_1_1": 8.0,
+                "+_0_1 -_0_0 +_2_0 -_2_0": 0.5,
+            }
+        )
+
+        with self.subTest("dense"):
+            tensor = PolynomialTensor(
+                {"": 1.5, "_+-": one_body, "_+-_+-": two_body}, validate=False
+            )
+            vib_op = VibrationalOp.from_polynomial_tensor(tensor)
+            self.assertEqual(vib_op.simplify(), expected)
+            self.assertEqual(len(vib_op), 1 + one_body.size + two_body.size)
+            self.assertEqual(vib_op.num_modals, [2, 2, 1])
+
+        with self.subTest("sparse"):
+            if not _optionals.HAS_SPARSE:
+                self.skipTest("Sparse not available.")
+            import sparse as sp  # pylint: disable=import-error
+
+            tensor = PolynomialTensor(
+                {"": 1.5, "_+-": sp.as_coo(one_body), "_+-_+-": sp.as_coo(two_body)},
+                validate=False,
+            )
+            vib_op = VibrationalOp.from_polynomial_tensor(tensor)
+            self.assertEqual(vib_op, expected)
+            self.assertEqual(vib_op.num_modals, [2, 2, 1])
+
+            # the index arrays of the operator must match those parsed from its labels
+            # pylint: disable=protected-access
+            index_arrays = vib_op._index_arrays()
+            parsed_arrays = VibrationalOp(dict(expected.items()))._index_arrays()
+            self.assertEqual(set(index_arrays), {0, 2, 4})
+            for length, arrays in index_arrays.items():
+                for array, parsed_array in zip(arrays, parsed_arrays[length]):
+                    np.testing.assert_array_equal(array, parsed_array)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -41,6 +41,21 @@ class TestAngularMomentum(PropertyTest):
             expected_op = FermionicOp(expected, num_spin_orbitals=8).simplify()
         self.assertEqual(op, expected_op)
 
+    def test_second_q_ops_cached(self):
+        """Test that second_q_ops is only built once per number of spatial orbitals."""
+        # pylint: disable=protected-access
+        op = self.prop.second_q_ops()["AngularMomentum"]
+        cached = AngularMomentum(4).second_q_ops()["AngularMomentum"]
+        self.assertIs(cached._data, op._data)
+        self.assertIsNot(AngularMomentum(3).second_q_ops()["AngularMomentum"]._data, op._data)
+
+        with self.subTest("mutations do not leak into the cache"):
+            self.assertIsNot(cached, op)
+            op.num_spin_orbitals = 10
+            self.assertEqual(
+                AngularMomentum(4).second_q_ops()["AngularMomentum"].num_spin_orbitals, 8
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
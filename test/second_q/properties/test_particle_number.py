@@ -40,3 +40,9 @@ class TestParticleNumber(PropertyTest):
             "+_7 -_7": 1.0,
         }
         self.assertEqual(dict(ops.items()), expected)
+
+    def test_second_q_ops_mutation(self):
+        """Test that mutating a returned operator does not affect later calls."""
+        op = ParticleNumber(2).second_q_ops()["ParticleNumber"]
+        op.num_spin_orbitals = 10
+        self.assertEqual(ParticleNumber(2).second_q_ops()["ParticleNumber"].num_spin_orbitals, 4)
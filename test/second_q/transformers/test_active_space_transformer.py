@@ -24,11 +24,11 @@ from qiskit_nature import QiskitNatureError
 from qiskit_nature.second_q.drivers import PySCFDriver
 from qiskit_nature.second_q.formats.qcschema import QCSchema
 from qiskit_nature.second_q.formats.qcschema_translator import qcschema_to_problem
-from qiskit_nature.second_q.hamiltonians import ElectronicEnergy
+from qiskit_nature.second_q.hamiltonians import CholeskyElectronicEnergy, ElectronicEnergy
 from qiskit_nature.second_q.operators import ElectronicIntegrals
 from qiskit_nature.second_q.problems import ElectronicStructureProblem
 from qiskit_nature.second_q.properties import ElectronicDensity, ElectronicDipoleMoment
-from qiskit_nature.second_q.transformers import ActiveSpaceTransformer
+from qiskit_nature.second_q.transformers import ActiveSpaceSession, ActiveSpaceTransformer
 
 
 @ddt
@@ -170,6 +170,84 @@ class TestActiveSpaceTransformer(QiskitNatureTestCase):
 
         self.assertDriverResult(driver_result_reduced, expected)
 
+    @unittest.skipIf(not _optionals.HAS_PYSCF, "pyscf not available.")
+    @unittest.skipIf(not _optionals.HAS_SPARSE, "Sparse not available.")
+    def test_sparse_integrals(self):
+        """Test that sparse integrals are reduced identically to dense ones."""
+        driver = PySCFDriver(basis="631g")
+        driver_result = driver.run()
+
+        trafo = ActiveSpaceTransformer(2, 2)
+        expected = trafo.transform(driver_result)
+
+        integrals = driver_result.hamiltonian.electronic_integrals
+        driver_result.hamiltonian.electronic_integrals = ElectronicIntegrals(
+            integrals.alpha.to_sparse()
+        )
+        driver_result_reduced = trafo.transform(driver_result)
+
+        reduced_integrals = driver_result_reduced.hamiltonian.electronic_integrals
+        driver_result_reduced.hamiltonian.electronic_integrals = ElectronicIntegrals(
+            reduced_integrals.alpha.to_dense(),
+            reduced_integrals.beta.to_dense(),
+            reduced_integrals.beta_alpha.to_dense(),
+        )
+
+        self.assertDriverResult(driver_result_reduced, expected)
+
+    @unittest.skipIf(not _optionals.HAS_PYSCF, "pyscf not available.")
+    def test_cholesky_electronic_energy(self):
+        """Test that Cholesky-decomposed integrals are reduced identically to full ones."""
+        driver = PySCFDriver(atom="Be 0 0 0; H 0 0 1.3", basis="sto3g", spin=1)
+        driver_result = driver.run()
+
+        trafo = ActiveSpaceTransformer((2, 1), 3)
+        expected = trafo.transform(driver_result)
+
+        problem = ElectronicStructureProblem(
+            CholeskyElectronicEnergy.from_electronic_energy(
+                driver_result.hamiltonian, threshold=1e-12
+            )
+        )
+        problem.properties = driver_result.properties
+        for attribute in (
+            "basis",
+            "num_particles",
+            "num_spatial_orbitals",
+            "orbital_energies",
+            "orbital_energies_b",
+            "orbital_occupations",
+            "orbital_occupations_b",
+        ):
+            setattr(problem, attribute, getattr(driver_result, attribute))
+        driver_result_reduced = trafo.transform(problem)
+
+        self.assertIsInstance(driver_result_reduced.hamiltonian, CholeskyElectronicEnergy)
+        self.assertDriverResult(driver_result_reduced, expected)
+
+    @unittest.skipIf(not _optionals.HAS_PYSCF, "pyscf not available.")
+    def test_active_space_session(self):
+        """Test that an ActiveSpaceSession reduces identically to individual transformations."""
+        for atom, spin, candidates in (
+            ("Li 0 0 0; H 0 0 1.6", 0, [(2, 2), (2, 3), (4, 4), (2, 2, [1, 4])]),
+            ("Be 0 0 0; H 0 0 1.3", 1, [((2, 1), 3), ((1, 0), 2), ((1, 0), 2, [2, 5])]),
+        ):
+            driver = PySCFDriver(atom=atom, basis="sto3g", spin=spin)
+            driver_result = driver.run()
+            session = ActiveSpaceSession(driver_result)
+            transformers = [ActiveSpaceTransformer(*candidate) for candidate in candidates]
+
+            results = session.transform_many(transformers, num_processes=2)
+            sequential = session.transform_many(transformers, num_processes=1)
+            for candidate, trafo, result, result_seq in zip(
+                candidates, transformers, results, sequential
+            ):
+                with self.subTest(atom=atom, candidate=candidate):
+                    expected = trafo.transform(driver_result)
+                    self.assertDriverResult(session.transform(trafo), expected)
+                    self.assertDriverResult(result, expected)
+                    self.assertDriverResult(result_seq, expected)
+
     @unittest.skipIf(not _optionals.HAS_PYSCF, "pyscf not available.")
     def test_unpaired_electron_active_space(self):
         """Test an active space with an unpaired electron."""
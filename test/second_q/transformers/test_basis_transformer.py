@@ -12,18 +12,23 @@
 
 """Tests for the BasisTransformer."""
 
+import os
+import tempfile
 import unittest
 from typing import cast
 
 from test import QiskitNatureTestCase
 
+import h5py
 import numpy as np
 
 import qiskit_nature.optionals as _optionals
 from qiskit_nature.second_q.drivers import PySCFDriver, MethodType
 from qiskit_nature.second_q.formats.qcschema_translator import get_ao_to_mo_from_qcschema
 from qiskit_nature.second_q.hamiltonians import ElectronicEnergy
+from qiskit_nature.second_q.operators import ElectronicIntegrals, PolynomialTensor
 from qiskit_nature.second_q.problems import ElectronicBasis
+from qiskit_nature.second_q.transformers import BasisTransformer
 
 
 class TestBasisTransformer(QiskitNatureTestCase):
@@ -172,6 +177,62 @@ class TestBasisTransformer(QiskitNatureTestCase):
             self.assertIsNone(problem_mo.orbital_energies_b)
             # orbital_occupations are not tested since in the MO basis they are auto-filled
 
+    def test_two_body_out_of_core(self):
+        """Test the out-of-core transformation of two-body integrals stored in an HDF5 file."""
+        rng = np.random.default_rng(42)
+        nao = 5
+        eri = rng.random((nao,) * 4)
+        eri = eri + eri.transpose(1, 0, 2, 3)
+        eri = eri + eri.transpose(0, 1, 3, 2)
+        eri = eri + eri.transpose(2, 3, 0, 1)
+        coeff_a = rng.random((nao, nao))
+        coeff_b = rng.random((nao, nao))
+
+        problem_ao = ElectronicIntegrals.from_raw_integrals(np.zeros((nao, nao)), eri)
+
+        for unrestricted in (False, True):
+            trafo = BasisTransformer(
+                ElectronicBasis.AO,
+                ElectronicBasis.MO,
+                ElectronicIntegrals.from_raw_integrals(
+                    coeff_a, h1_b=coeff_b if unrestricted else None
+                ),
+            )
+            expected = trafo.transform_electronic_integrals(problem_ao)
+            active = [1, 2, 4]
+
+            for shape in ((nao,) * 4, (nao**2, nao**2), (nao**4,)):
+                with self.subTest(unrestricted=unrestricted, shape=shape):
+                    with tempfile.TemporaryDirectory() as tmpdir:
+                        with h5py.File(os.path.join(tmpdir, "eri.hdf5"), "w") as file:
+                            file.create_dataset("eri", data=eri.reshape(shape))
+                            result = trafo.transform_two_body_out_of_core(
+                                file["eri"], chunk_size=2, scratch_dir=tmpdir
+                            )
+                            result_active = trafo.transform_two_body_out_of_core(
+                                file["eri"], active_orbitals=active
+                            )
+
+                    for spin in ("alpha", "beta", "beta_alpha"):
+                        expected_tensor: PolynomialTensor = getattr(expected, spin)
+                        tensor: PolynomialTensor = getattr(result, spin)
+                        tensor_active: PolynomialTensor = getattr(result_active, spin)
+                        if spin == "beta" and not unrestricted:
+                            self.assertTrue(tensor.is_empty())
+                            continue
+                        if spin == "beta_alpha" and not unrestricted:
+                            continue
+                        expected_eri = np.asarray(expected_tensor.get("++--"))
+                        np.testing.assert_array_almost_equal(tensor.get("++--"), expected_eri)
+                        np.testing.assert_array_almost_equal(
+                            tensor_active.get("++--"),
+                            expected_eri[np.ix_(active, active, active, active)],
+                        )
+
+        with self.subTest("mismatching size"):
+            with self.assertRaises(ValueError):
+                trafo.transform_two_body_out_of_core(np.zeros((nao - 1,) * 4))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,40 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2023.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test optimized einsum utilities."""
+
+from test import QiskitNatureTestCase
+
+import numpy as np
+from ddt import data, ddt
+from qiskit_nature.utils import get_einsum_expression
+
+
+@ddt
+class TestGetEinsumExpression(QiskitNatureTestCase):
+    """Tests for the cached einsum expressions."""
+
+    @data(True, False)
+    def test_get_einsum_expression(self, optimize: bool):
+        """Test the contraction result and its caching."""
+        rng = np.random.default_rng(42)
+        two_body = rng.random((3, 3, 3, 3))
+        coeff = rng.random((3, 2))
+        subscripts = "prsq,pi,qj,rk,sl->iklj"
+        shapes = (two_body.shape, *(coeff.shape,) * 4)
+
+        expression = get_einsum_expression(subscripts, *shapes, optimize=optimize)
+        np.testing.assert_allclose(
+            expression(two_body, *(coeff,) * 4),
+            np.einsum(subscripts, two_body, *(coeff,) * 4),
+        )
+        self.assertIs(get_einsum_expression(subscripts, *shapes, optimize=optimize), expression)